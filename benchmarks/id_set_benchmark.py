@@ -0,0 +1,179 @@
+"""Benchmark of re_create_id_set on a generated content repository of 5k entities.
+
+Generates a content repository of copies of the test files (integration packages, unified integrations, unified and
+package scripts, playbooks, test playbooks and test scripts), each copy with its own id, in a temporary directory,
+and creates its id_set with the pipeline re_create_id_set used to run (a pool.map barrier per section in
+cpu_count() * 2 processes, which print every file and parse the test playbooks and package scripts twice) and with
+re_create_id_set. The id_sets are checked to be identical.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/id_set_benchmark.py [copies]
+"""
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from multiprocessing import Pool, cpu_count
+
+from demisto_sdk.common.constants import INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, PACKS_INTEGRATION_REGEX, \
+    SCRIPT_REGEX, PACKS_SCRIPT_YML_REGEX, PACKS_PLAYBOOK_YML_REGEX, PLAYBOOK_REGEX, BETA_PLAYBOOK_REGEX, \
+    TEST_SCRIPT_REGEX, PACKS_TEST_PLAYBOOKS_REGEX, TEST_PLAYBOOK_REGEX
+from demisto_sdk.common.parse_cache import parsed_file_cache
+from demisto_sdk.common.scripts.update_id_set import re_create_id_set, checked_type, get_integration_data, \
+    get_script_data, get_playbook_data, get_integrations_paths, get_playbooks_paths, get_scripts_paths, \
+    get_test_playbooks_paths, sort
+from demisto_sdk.common.tools import get_yaml
+from demisto_sdk.yaml_tools.unifier import Unifier
+
+# 7 entities per copy
+DEFAULT_COPIES = 715
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+# the path of every copy of a test file in the generated repository
+PATH_TEMPLATES = {
+    'Integrations/Zoom{0}/Zoom{0}.yml': 'integration-Zoom.yml',
+    'Integrations/integration-PagerDuty{0}.yml': 'integration-test.yml',
+    'Scripts/script-Script{0}.yml': 'script-valid.yml',
+    'Scripts/Package{0}/Package{0}.yml': 'script-valid.yml',
+    'Playbooks/playbook-Playbook{0}.yml': 'Playbooks.playbook-test.yml',
+    'TestPlaybooks/playbook-Test{0}.yml': 'Playbooks.playbook-test.yml',
+    'TestPlaybooks/script-Test{0}.yml': 'script-valid.yml',
+}
+# the top level id and name of playbooks, and the id under commonfields and the name of integrations and scripts
+ID_PATTERN = re.compile(r'^(id|  id|name): .*$', re.MULTILINE)
+
+
+def generate_content_repo(repo_dir, copies):
+    test_files = {}
+    for test_file in set(PATH_TEMPLATES.values()):
+        with io.open(os.path.join(TEST_FILES, test_file), encoding='utf-8') as yml_file:
+            test_files[test_file] = yml_file.read()
+    for index in range(copies):
+        for path_template, test_file in PATH_TEMPLATES.items():
+            path = os.path.join(repo_dir, path_template.format(index))
+            entity_id = os.path.splitext(os.path.basename(path))[0]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with io.open(path, 'w', encoding='utf-8') as yml_file:
+                yml_file.write(ID_PATTERN.sub(lambda match: '{}: {}'.format(match.group(1), entity_id),
+                                              test_files[test_file]))
+            if path_template.startswith('Scripts/Package'):
+                with open(os.path.splitext(path)[0] + '.py', 'w') as code_file:
+                    code_file.write("demisto.executeCommand('createNewIncident', {})\n")
+    os.makedirs(os.path.join(repo_dir, 'Tests'))
+
+
+def legacy_process_integration(file_path):
+    res = []
+    if os.path.isfile(file_path):
+        if checked_type(file_path, (INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, PACKS_INTEGRATION_REGEX)):
+            print("adding {0} to id_set".format(file_path))
+            res.append(get_integration_data(file_path))
+    else:
+        package_name = os.path.basename(file_path)
+        file_path = os.path.join(file_path, '{}.yml'.format(package_name))
+        if os.path.isfile(file_path):
+            print("adding {0} to id_set".format(file_path))
+            res.append(get_integration_data(file_path))
+    return res
+
+
+def legacy_process_script(file_path):
+    res = []
+    if os.path.isfile(file_path):
+        if checked_type(file_path, (SCRIPT_REGEX, PACKS_SCRIPT_YML_REGEX)):
+            print("adding {0} to id_set".format(file_path))
+            res.append(get_script_data(file_path))
+    else:
+        unifier = Unifier(file_path)
+        yml_path, code = unifier.get_script_package_data()
+        print("adding {0} to id_set".format(file_path))
+        res.append(get_script_data(yml_path, script_code=code))
+    return res
+
+
+def legacy_process_playbook(file_path):
+    res = []
+    if checked_type(file_path, (PACKS_PLAYBOOK_YML_REGEX, PLAYBOOK_REGEX, BETA_PLAYBOOK_REGEX)):
+        print('adding {0} to id_set'.format(file_path))
+        res.append(get_playbook_data(file_path))
+    return res
+
+
+def legacy_process_test_playbook_path(file_path):
+    print("adding {0} to id_set".format(file_path))
+    script = None
+    playbook = None
+    if checked_type(file_path, (TEST_SCRIPT_REGEX, PACKS_TEST_PLAYBOOKS_REGEX, TEST_PLAYBOOK_REGEX)):
+        yml_data = get_yaml(file_path)
+        if 'commonfields' in yml_data:
+            script = get_script_data(file_path)
+        else:
+            playbook = get_playbook_data(file_path)
+    return playbook, script
+
+
+def legacy_re_create_id_set():
+    scripts_list = []
+    playbooks_list = []
+    integration_list = []
+    testplaybooks_list = []
+
+    pool = Pool(processes=cpu_count() * 2)
+    for arr in pool.map(legacy_process_integration, get_integrations_paths()):
+        integration_list.extend(arr)
+    for arr in pool.map(legacy_process_playbook, get_playbooks_paths()):
+        playbooks_list.extend(arr)
+    for arr in pool.map(legacy_process_script, get_scripts_paths()):
+        scripts_list.extend(arr)
+    for pair in pool.map(legacy_process_test_playbook_path, get_test_playbooks_paths()):
+        if pair[0]:
+            testplaybooks_list.append(pair[0])
+        if pair[1]:
+            scripts_list.append(pair[1])
+
+    new_ids_dict = OrderedDict()
+    new_ids_dict['scripts'] = sort(scripts_list)
+    new_ids_dict['playbooks'] = sort(playbooks_list)
+    new_ids_dict['integrations'] = sort(integration_list)
+    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
+    with open('./Tests/id_set.json', 'w') as id_set_file:
+        json.dump(new_ids_dict, id_set_file, indent=4)
+
+
+def time_id_set(create_id_set):
+    # every run parses the files, as a separate process would
+    parsed_file_cache.clear()
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        create_id_set()
+    duration = time.perf_counter() - start
+    with open('./Tests/id_set.json') as id_set_file:
+        return duration, id_set_file.read()
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+    repo_dir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        generate_content_repo(repo_dir, copies)
+        os.chdir(repo_dir)
+        legacy, legacy_id_set = time_id_set(legacy_re_create_id_set)
+        pipeline, id_set = time_id_set(re_create_id_set)
+        assert id_set == legacy_id_set, 'the id_sets are not the same'
+        print('{} entities, {} cpus'.format(copies * len(PATH_TEMPLATES), cpu_count()))
+        print('{:<28} {:>10} {:>10}'.format('id_set', 'time', 'speedup'))
+        print('{:<28} {:>9.3f}s {:>9.1f}x'.format('pool.map per section', legacy, 1))
+        print('{:<28} {:>9.3f}s {:>9.1f}x'.format('single pipeline', pipeline, legacy / pipeline))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(repo_dir)
+
+
+if __name__ == '__main__':
+    main()
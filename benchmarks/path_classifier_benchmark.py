@@ -0,0 +1,84 @@
+"""Micro-benchmark of the path classifier on a generated 20k paths content repository listing.
+
+Compares the regex loops the validators used to run (re.match over each regex list for every call) with
+PathClassifier, both when every path is seen for the first time and when paths are classified again.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/path_classifier_benchmark.py
+"""
+import re
+import time
+
+from demisto_sdk.common.constants import CHECKED_TYPES_REGEXES, SCHEMA_TO_REGEX, REPUTATION_REGEX, \
+    CODE_FILES_REGEX, PACKAGE_SCRIPTS_REGEXES, YML_INTEGRATION_REGEXES
+from demisto_sdk.common.path_classifier import PathClassifier
+
+PATHS_COUNT = 20000
+# the regex lists FilesValidator matches every changed file against
+REGEX_LISTS = [CODE_FILES_REGEX, CHECKED_TYPES_REGEXES, PACKAGE_SCRIPTS_REGEXES, YML_INTEGRATION_REGEXES]
+PATH_TEMPLATES = [
+    'Packs/Pack{0}/Integrations/Integration{0}/Integration{0}.yml',
+    'Packs/Pack{0}/Integrations/Integration{0}/Integration{0}.py',
+    'Packs/Pack{0}/Integrations/Integration{0}/Integration{0}_test.py',
+    'Packs/Pack{0}/Integrations/Integration{0}/Integration{0}_image.png',
+    'Packs/Pack{0}/Scripts/Script{0}/Script{0}.yml',
+    'Packs/Pack{0}/Playbooks/playbook-Playbook{0}.yml',
+    'Integrations/integration-Integration{0}.yml',
+    'Scripts/script-Script{0}.yml',
+    'IncidentFields/incidentfield-Field{0}.json',
+    'Layouts/layout-details-Layout{0}.json',
+]
+
+
+def generate_paths():
+    return [PATH_TEMPLATES[index % len(PATH_TEMPLATES)].format(index) for index in range(PATHS_COUNT)]
+
+
+def regex_loop(path, regexes):
+    for regex in regexes:
+        if re.match(regex, path, re.IGNORECASE):
+            return regex
+    return None
+
+
+def classify_with_loops(paths):
+    for path in paths:
+        for regexes in REGEX_LISTS:
+            regex_loop(path, regexes)
+        for regexes in SCHEMA_TO_REGEX.values():
+            if regex_loop(path, regexes):
+                break
+        else:
+            regex_loop(path, [REPUTATION_REGEX])
+
+
+def classify_with_classifier(classifier, paths):
+    for path in paths:
+        for regexes in REGEX_LISTS:
+            classifier.match(path, regexes)
+        classifier.classify(path)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    paths = generate_paths()
+    loops = timed(classify_with_loops, paths)
+
+    classifier = PathClassifier()
+    classifier.clear()
+    cold = timed(classify_with_classifier, classifier, paths)
+    warm = timed(classify_with_classifier, classifier, paths)
+
+    print('{} paths'.format(len(paths)))
+    print('regex loops:           {:8.3f}s'.format(loops))
+    print('classifier (cold):     {:8.3f}s ({:.1f}x)'.format(cold, loops / cold))
+    print('classifier (memoized): {:8.3f}s ({:.1f}x)'.format(warm, loops / warm))
+
+
+if __name__ == '__main__':
+    main()
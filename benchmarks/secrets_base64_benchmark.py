@@ -0,0 +1,65 @@
+"""Benchmark of the removal of long base64 strings before the secrets detection scans a file.
+
+Compares the removal the secrets detection used to run (re.findall of every base64-like string of the file, and a
+replace over the whole file for each one longer than 500 characters) with SecretsValidator.ignore_base64, which removes
+them in a single pass, on generated files with more and more embedded images, like unified ymls and test data.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/secrets_base64_benchmark.py [max blobs]
+"""
+import base64
+import random
+import re
+import sys
+import time
+
+from demisto_sdk.validation.secrets import SecretsValidator
+
+DEFAULT_MAX_BLOBS = 800
+BLOB_SIZE = 6000
+
+
+# disable-secrets-detection-start
+def ignore_base64_with_replace(file_contents):
+    base64_strings = re.findall(r'(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|'
+                                r'[A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{4})', file_contents)
+    for base64_string in base64_strings:
+        if len(base64_string) > 500:
+            file_contents = file_contents.replace(base64_string, '')
+    return file_contents
+# disable-secrets-detection-end
+
+
+def generate_file_contents(blobs):
+    random_generator = random.Random(blobs)
+    lines = []
+    for index in range(blobs):
+        lines.append('- name: command{}'.format(index))
+        lines.append('  description: Gets the details of an object by its id.')
+        image = bytes(random_generator.getrandbits(8) for _ in range(BLOB_SIZE))
+        lines.append('image: data:image/png;base64,{}'.format(base64.b64encode(image).decode('ascii')))
+    return '\n'.join(lines)
+
+
+def time_removal(remove, file_contents):
+    start = time.perf_counter()
+    result = remove(file_contents)
+    return time.perf_counter() - start, result
+
+
+def main():
+    max_blobs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_BLOBS
+    print('{:>8} {:>10} {:>14} {:>14} {:>10}'.format('blobs', 'size', 'replace', 'single pass', 'speedup'))
+    blobs = 50
+    while blobs <= max_blobs:
+        file_contents = generate_file_contents(blobs)
+        replace_time, expected = time_removal(ignore_base64_with_replace, file_contents)
+        single_pass_time, result = time_removal(SecretsValidator.ignore_base64, file_contents)
+        assert result == expected, 'the removed base64 strings are not the same'
+        print('{:>8} {:>8.1f}MB {:>13.3f}s {:>13.3f}s {:>9.1f}x'.format(
+            blobs, len(file_contents) / 1024 / 1024, replace_time, single_pass_time, replace_time / single_pass_time))
+        blobs *= 2
+
+
+if __name__ == '__main__':
+    main()
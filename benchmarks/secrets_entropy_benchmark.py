@@ -0,0 +1,101 @@
+"""Benchmark of the entropy scoring of the secrets detection on a large .json and a large .py file.
+
+Scores every whitespace-separated string of the files - the candidates of search_potential_secrets - with the entropy
+calculation the secrets detection used to run (a str.count for each of the 100 printable characters), with the single
+pass SecretsValidator.calculate_shannon_entropy, and with the batch SecretsValidator.get_high_entropy_strings, which
+is vectorized with numpy when it is installed. The files are generated in a temporary directory: a test data json of
+random ids and hashes, and copies of a test integration.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/secrets_entropy_benchmark.py [copies]
+"""
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+
+from demisto_sdk.validation.secrets import SecretsValidator, ENTROPY_THRESHOLD
+
+DEFAULT_COPIES = 20
+TEST_PY_FILE = os.path.abspath(os.path.join('tests', 'test_files', 'VulnDB', 'VulnDB.py'))
+
+
+def calculate_entropy_per_printable(data):
+    if not data:
+        return 0
+    entropy = 0
+    for char in (ord(c) for c in string.printable):
+        p_x = float(data.count(chr(char))) / len(data)
+        if p_x > 0:
+            entropy += - p_x * math.log(p_x, 2)
+    return entropy
+
+
+def generate_files(files_dir, copies):
+    random_generator = random.Random(1)
+    json_path = os.path.join(files_dir, 'test_data.json')
+    with open(json_path, 'w') as json_file:
+        json.dump([{'id': index, 'name': 'Incident {}'.format(index),
+                    'sha256': hashlib.sha256(str(index).encode()).hexdigest(),
+                    'description': ' '.join(random_generator.choice(['alert', 'user', 'host', 'malware', 'login'])
+                                            for _ in range(8))}
+                   for index in range(copies * 500)], json_file, indent=4)
+
+    py_path = os.path.join(files_dir, 'integration.py')
+    with open(TEST_PY_FILE) as test_py_file:
+        py_code = test_py_file.read()
+    with open(py_path, 'w') as py_file:
+        py_file.write(py_code * copies)
+    return [json_path, py_path]
+
+
+def time_scoring(score, strings):
+    start = time.perf_counter()
+    high_entropy_strings = score(strings)
+    return time.perf_counter() - start, high_entropy_strings
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+    try:
+        import numpy  # noqa: F401
+        batch_name = 'batch (numpy)'
+    except ImportError:
+        batch_name = 'batch (python)'
+
+    scorings = [
+        ('per printable char', lambda strings: [string_ for string_ in strings
+                                                if calculate_entropy_per_printable(string_) >= ENTROPY_THRESHOLD]),
+        ('single pass', lambda strings: [string_ for string_ in strings
+                                         if SecretsValidator.calculate_shannon_entropy(string_) >= ENTROPY_THRESHOLD]),
+        (batch_name, SecretsValidator.get_high_entropy_strings),
+    ]
+    files_dir = tempfile.mkdtemp()
+    try:
+        for file_path in generate_files(files_dir, copies):
+            with io.open(file_path, mode='r', encoding='utf-8') as scanned_file:
+                strings = scanned_file.read().split()
+            file_size = os.path.getsize(file_path) / 1024 / 1024
+            print('{}: {:.1f}MB, {} strings'.format(os.path.basename(file_path), file_size, len(strings)))
+            print('{:<24} {:>10} {:>10}'.format('scoring', 'time', 'speedup'))
+            baseline, expected = None, None
+            for name, score in scorings:
+                duration, high_entropy_strings = time_scoring(score, strings)
+                if baseline is None:
+                    baseline, expected = duration, high_entropy_strings
+                assert high_entropy_strings == expected, 'the high entropy strings are not the same'
+                print('{:<24} {:>9.3f}s {:>9.1f}x'.format(name, duration, baseline / duration))
+            print()
+    finally:
+        shutil.rmtree(files_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark of the per-line regex scan of the secrets detection, in lines per second.
+
+Compares the scan the secrets detection used to run on every line (re.findall/re.search of every regex, looked up by
+pattern string on every call) with SecretsValidator.regex_for_secrets, is_secrets_disabled and
+remove_false_positives, which use precompiled regexes behind literal prefilters. The lines are the lines of the test
+files, repeated.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/secrets_regex_benchmark.py [repeats]
+"""
+import io
+import os
+import re
+import sys
+import time
+
+from demisto_sdk.validation.secrets import SecretsValidator, DATES_REGEX, UUID_REGEX, URLS_REGEX, EMAIL_REGEX, \
+    IPV6_REGEX, IPV4_REGEX
+
+DEFAULT_REPEATS = 5
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+
+
+# disable-secrets-detection-start
+def scan_line_with_findall(line):
+    false_positives = [date[0].lower() for date in re.findall(DATES_REGEX, line)]
+    false_positives += re.findall(UUID_REGEX, line)
+    re_res = re.search(r'dockerimage:\s*\w*demisto/\w+:(\d+.\d+.\d+.\d+)', line)
+    if re_res:
+        line = line.replace(re_res.group(1), '')
+    potential_secrets = re.findall(URLS_REGEX, line) + re.findall(EMAIL_REGEX, line)
+    potential_secrets += [ipv6 for ipv6 in re.findall(IPV6_REGEX, line) if ipv6 != '::' and len(ipv6) > 4]
+    potential_secrets += re.findall(IPV4_REGEX, line)
+    for regex in (r'(disable-secrets-detection-start)', r'(disable-secrets-detection-end)',
+                  r'(disable-secrets-detection)'):
+        re.findall(regex, line)
+    re.search(r'([^\s]*[(\[{].*[)\]}][^\s]*)', line)
+    return potential_secrets, false_positives
+# disable-secrets-detection-end
+
+
+def scan_line(line):
+    skip_secrets = {'skip_once': False, 'skip_multi': False}
+    SecretsValidator.is_secrets_disabled(line, skip_secrets)
+    result = SecretsValidator.regex_for_secrets(line)
+    SecretsValidator.remove_false_positives(line)
+    return result
+
+
+def get_lines(repeats):
+    lines = []
+    for root, _, files in os.walk(TEST_FILES):
+        for file_name in sorted(files):
+            with io.open(os.path.join(root, file_name), mode='r', encoding='utf-8', errors='ignore') as test_file:
+                lines += test_file.read().split('\n')
+    return lines * repeats
+
+
+def time_scan(scan, lines):
+    start = time.perf_counter()
+    for line in lines:
+        scan(line)
+    return time.perf_counter() - start
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REPEATS
+    lines = get_lines(repeats)
+    findall_time = time_scan(scan_line_with_findall, lines)
+    prefiltered_time = time_scan(scan_line, lines)
+    print('{} lines'.format(len(lines)))
+    print('{:<24} {:>10} {:>14}'.format('scan', 'time', 'lines/s'))
+    print('{:<24} {:>9.3f}s {:>14,.0f}'.format('findall per regex', findall_time, len(lines) / findall_time))
+    print('{:<24} {:>9.3f}s {:>14,.0f}'.format('prefiltered', prefiltered_time, len(lines) / prefiltered_time))
+    print('speedup: {:.1f}x'.format(findall_time / prefiltered_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark of the whitelist check of the secrets detection, in strings per second.
+
+Checks the whitespace-separated strings of copies of a test integration against a generated whitelist of generic
+strings, the way the secrets detection used to (any(white_list_string.lower() in string_.lower()) over the whole
+whitelist), and with the compiled SubstringMatcher of SecretsValidator.get_white_list.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/secrets_whitelist_benchmark.py [whitelist size]
+"""
+import io
+import json
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+
+from demisto_sdk.validation.secrets import SecretsValidator
+
+DEFAULT_WHITE_LIST_SIZE = 3000
+COPIES = 5
+TEST_PY_FILE = os.path.abspath(os.path.join('tests', 'test_files', 'VulnDB', 'VulnDB.py'))
+
+
+def generate_white_list(white_list_path, size):
+    random_generator = random.Random(1)
+    generic_strings = [''.join(random_generator.choice(string.ascii_letters + string.digits + '-_.')
+                               for _ in range(random_generator.randint(5, 30))) for _ in range(size)]
+    with open(white_list_path, 'w') as white_list_file:
+        json.dump({'files': [], 'iocs': {'urls': ['https://api.zoom.us']}, 'generic_strings': generic_strings},
+                  white_list_file)
+
+
+def check_with_any(strings, secrets_white_list):
+    return [string_ for string_ in strings
+            if not any(white_list_string.lower() in string_.lower() for white_list_string in secrets_white_list)]
+
+
+def check_with_matcher(strings, white_list):
+    return [string_ for string_ in strings if not white_list.strings_matcher.search(string_.lower())]
+
+
+def time_check(check, strings, white_list):
+    start = time.perf_counter()
+    result = check(strings, white_list)
+    return time.perf_counter() - start, result
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WHITE_LIST_SIZE
+    with io.open(TEST_PY_FILE, mode='r', encoding='utf-8') as test_py_file:
+        strings = test_py_file.read().split() * COPIES
+
+    files_dir = tempfile.mkdtemp()
+    try:
+        white_list_path = os.path.join(files_dir, 'secrets_white_list.json')
+        generate_white_list(white_list_path, size)
+        validator = SecretsValidator(white_list_path=white_list_path)
+        start = time.perf_counter()
+        white_list = validator.get_white_list(False, '')
+        compile_time = time.perf_counter() - start
+    finally:
+        shutil.rmtree(files_dir)
+
+    any_time, expected = time_check(check_with_any, strings, white_list.strings)
+    matcher_time, not_white_listed = time_check(check_with_matcher, strings, white_list)
+    assert not_white_listed == expected, 'the whitelisted strings are not the same'
+    print('{} strings, {} whitelisted strings (loaded and compiled in {:.3f}s)'.format(len(strings), size,
+                                                                                       compile_time))
+    print('{:<24} {:>10} {:>14}'.format('check', 'time', 'strings/s'))
+    print('{:<24} {:>9.3f}s {:>14,.0f}'.format('any substring', any_time, len(strings) / any_time))
+    print('{:<24} {:>9.3f}s {:>14,.0f}'.format('aho-corasick', matcher_time, len(strings) / matcher_time))
+    print('speedup: {:.1f}x'.format(any_time / matcher_time))
+
+
+if __name__ == '__main__':
+    main()
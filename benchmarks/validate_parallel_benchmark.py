@@ -0,0 +1,73 @@
+"""Benchmark of `validate -a` on a generated content repository, serial and with --jobs N.
+
+Generates a content repository of copies of the test files (playbooks, scripts, integration packages and incident
+fields) in a temporary directory, and times FilesValidator.validate_all_files in the current process and in
+worker processes. The output of the runs is discarded after checking it is identical.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/validate_parallel_benchmark.py [copies]
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from multiprocessing import cpu_count
+
+from demisto_sdk.common.parse_cache import parsed_file_cache
+from demisto_sdk.validation.file_validator import FilesValidator
+
+DEFAULT_COPIES = 100
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+# the path of every copy of a test file in the generated repository
+PATH_TEMPLATES = {
+    'Playbooks/playbook-Playbook{0}.yml': 'Playbooks.playbook-test.yml',
+    'Scripts/script-Script{0}.yml': 'script-valid.yml',
+    'Integrations/Zoom{0}/Zoom{0}.yml': 'integration-Zoom.yml',
+    'IncidentFields/incidentfield-Field{0}.json': 'incidentfield-valid.json',
+}
+
+
+def generate_content_repo(repo_dir, copies):
+    for index in range(copies):
+        for path_template, test_file in PATH_TEMPLATES.items():
+            path = os.path.join(repo_dir, path_template.format(index))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copy(os.path.join(TEST_FILES, test_file), path)
+
+
+def validate_all_files(jobs):
+    # every run parses the files, as a separate `validate -a` process would
+    parsed_file_cache.clear()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        files_validator = FilesValidator(validate_conf_json=False, jobs=jobs)
+        files_validator.validate_all_files()
+    return time.perf_counter() - start, files_validator._is_valid, output.getvalue()
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+    repo_dir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        generate_content_repo(repo_dir, copies)
+        os.chdir(repo_dir)
+        serial, is_valid, serial_output = validate_all_files(jobs=1)
+        print('{} files, valid: {}'.format(copies * len(PATH_TEMPLATES), is_valid))
+        print('{:<12} {:>10} {:>10}'.format('jobs', 'time', 'speedup'))
+        print('{:<12} {:>9.3f}s {:>9.1f}x'.format(1, serial, 1))
+        for jobs in sorted({2, 4, cpu_count()} - {1}):
+            parallel, parallel_is_valid, parallel_output = validate_all_files(jobs=jobs)
+            assert parallel_is_valid == is_valid and parallel_output == serial_output, 'the output is not the same'
+            print('{:<12} {:>9.3f}s {:>9.1f}x'.format(jobs, parallel, serial / parallel))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(repo_dir)
+
+
+if __name__ == '__main__':
+    main()
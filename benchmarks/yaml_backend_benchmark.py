@@ -0,0 +1,36 @@
+"""Benchmark of the yml loader used by the SDK against the pure-Python PyYAML loader.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/yaml_backend_benchmark.py
+"""
+import os
+import timeit
+
+import yaml
+
+from demisto_sdk.common import yaml_backend
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'test_files')
+INTEGRATION_FILES = [
+    os.path.join(TEST_FILES_DIR, 'VulnDB', 'VulnDB.yml'),
+    os.path.join(TEST_FILES_DIR, 'CortexXDR', 'Integrations', 'PaloAltoNetworks_XDR', 'PaloAltoNetworks_XDR.yml'),
+    os.path.join(TEST_FILES_DIR, 'integration-Zoom.yml'),
+]
+REPEAT = 20
+
+
+def main():
+    print('libyaml available: {}'.format(yaml_backend.LIBYAML_AVAILABLE))
+    print('{:<30} {:>12} {:>12} {:>8}'.format('file', 'pure (ms)', 'backend (ms)', 'speedup'))
+    for file_path in INTEGRATION_FILES:
+        with open(file_path) as f:
+            yml_text = f.read()
+
+        pure = min(timeit.repeat(lambda: yaml.load(yml_text, Loader=yaml.SafeLoader), number=1, repeat=REPEAT))
+        backend = min(timeit.repeat(lambda: yaml_backend.safe_load(yml_text), number=1, repeat=REPEAT))
+        print('{:<30} {:>12.2f} {:>12.2f} {:>7.1f}x'.format(os.path.basename(file_path), pure * 1000,
+                                                            backend * 1000, pure / backend))
+
+
+if __name__ == '__main__':
+    main()
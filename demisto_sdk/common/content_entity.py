@@ -0,0 +1,265 @@
+"""Object model of the content entities (integrations, scripts, playbooks, incident fields, layouts...).
+
+A ContentEntity wraps a single content file and derives the facts the validators and the id_set helpers need from it
+(parsed data, id, name, versions, commands, docker image, image and description files). Every attribute is computed
+on first access and memoized, so a single entity can be handed to all the validators of a file instead of each of them
+globbing, parsing and matching regexes on the path again.
+
+Entities use __slots__ and hold no per-instance __dict__, so the whole content repository can be kept in memory.
+The parsed data is the only large attribute, it can be dropped with unload() once the derived attributes are computed.
+"""
+import glob
+import os
+from typing import Any, List, Optional, Union
+
+from demisto_sdk.common.constants import YML_ALL_INTEGRATION_REGEXES, INTEGRATION_REGXES, YML_ALL_SCRIPTS_REGEXES, \
+    SCRIPT_REGEX, YML_ALL_PLAYBOOKS_REGEX, YML_TEST_PLAYBOOKS_REGEXES, JSON_ALL_INCIDENT_FIELD_REGEXES, \
+    JSON_ALL_INDICATOR_FIELDS_REGEXES, JSON_ALL_LAYOUT_REGEXES, JSON_ALL_INCIDENT_TYPES_REGEXES
+from demisto_sdk.common.tools import checked_type, get_yaml, get_json
+
+# Marks a lazy attribute that was not computed yet (None is a legitimate value for most of them)
+_NOT_SET = object()
+
+
+class ContentEntity:
+    """A single content file.
+
+    Attributes:
+        path (str): path to the file.
+        data (dict): the parsed file.
+        id (str): the id of the entity.
+        name (str): the name of the entity.
+        from_version (str): the fromversion of the entity, None if it has none.
+        to_version (str): the toversion of the entity, None if it has none.
+    """
+    __slots__ = ('path', '_data', '_id', '_name', '_from_version', '_to_version')
+
+    def __init__(self, path):
+        # type: (str) -> None
+        self.path = path
+        self._data = _NOT_SET  # type: Any
+        self._id = _NOT_SET  # type: Any
+        self._name = _NOT_SET  # type: Any
+        self._from_version = _NOT_SET  # type: Any
+        self._to_version = _NOT_SET  # type: Any
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.path)
+
+    def load_data(self):
+        # type: () -> dict
+        if self.path.endswith('.json'):
+            return get_json(self.path)
+        if self.path.endswith(('.yml', '.yaml')):
+            return get_yaml(self.path)
+        return {}
+
+    @property
+    def data(self):
+        # type: () -> dict
+        if self._data is _NOT_SET:
+            self._data = self.load_data()
+        return self._data
+
+    def unload(self):
+        # type: () -> None
+        """Drops the parsed data, keeping the attributes that were already derived from it."""
+        self._data = _NOT_SET
+
+    @property
+    def id(self):
+        # type: () -> Optional[str]
+        if self._id is _NOT_SET:
+            self._id = self.get_id()
+        return self._id
+
+    def get_id(self):
+        # type: () -> Optional[str]
+        try:
+            file_id = self.data.get('id')
+            if not file_id:
+                # In integrations/scripts, the id is under 'commonfields'.
+                file_id = self.data.get('commonfields', {}).get('id', '')
+            if not file_id:
+                # In layout, the id is under 'layout'.
+                file_id = self.data.get('layout', {}).get('id', '')
+
+            return file_id
+        except AttributeError:
+            return None
+
+    @property
+    def name(self):
+        # type: () -> Optional[str]
+        if self._name is _NOT_SET:
+            self._name = self.data.get('name')
+        return self._name
+
+    @property
+    def from_version(self):
+        # type: () -> Optional[str]
+        if self._from_version is _NOT_SET:
+            self._from_version = self.data.get('fromversion') or self.data.get('fromVersion')
+        return self._from_version
+
+    @property
+    def to_version(self):
+        # type: () -> Optional[str]
+        if self._to_version is _NOT_SET:
+            self._to_version = self.data.get('toversion') or self.data.get('toVersion')
+        return self._to_version
+
+
+class YmlContentEntity(ContentEntity):
+    """A content entity defined by a yml file - either unified or the yml of a package.
+
+    Attributes:
+        is_unified (bool): whether the entity is a unified yml and not part of a package.
+        package_path (str): the package directory, None for unified ymls.
+    """
+    __slots__ = ()
+    UNIFIED_REGEXES = []  # type: List[str]
+
+    @property
+    def is_unified(self):
+        # type: () -> bool
+        return bool(checked_type(self.path, self.UNIFIED_REGEXES))
+
+    @property
+    def package_path(self):
+        # type: () -> Optional[str]
+        if self.is_unified:
+            return None
+        return os.path.dirname(self.path)
+
+    def _find_package_file(self, pattern):
+        # type: (str) -> Optional[str]
+        if self.is_unified:
+            return None
+        paths = glob.glob(os.path.join(self.package_path, pattern))
+        return paths[0] if paths else None
+
+
+class Integration(YmlContentEntity):
+    """An integration.
+
+    Attributes:
+        commands (list): names of the integration commands.
+        docker_image (str): the docker image of the integration, '' if it has none.
+        image_path (str): the image file of the package, None for unified integrations or if there is no image.
+        description_path (str): the detailed description file of the package, None for unified integrations or if
+            there is no description file.
+    """
+    __slots__ = ('_commands', '_image_path', '_description_path')
+    UNIFIED_REGEXES = INTEGRATION_REGXES
+
+    def __init__(self, path):
+        # type: (str) -> None
+        super(Integration, self).__init__(path)
+        self._commands = _NOT_SET  # type: Any
+        self._image_path = _NOT_SET  # type: Any
+        self._description_path = _NOT_SET  # type: Any
+
+    @property
+    def commands(self):
+        # type: () -> List[str]
+        if self._commands is _NOT_SET:
+            commands = self.data.get('script', {}).get('commands', [])
+            self._commands = [command.get('name') for command in commands]
+        return self._commands
+
+    @property
+    def docker_image(self):
+        # type: () -> str
+        return self.data.get('script', {}).get('dockerimage', '')
+
+    @property
+    def image_path(self):
+        # type: () -> Optional[str]
+        if self._image_path is _NOT_SET:
+            self._image_path = self._find_package_file('*.png')
+        return self._image_path
+
+    @property
+    def description_path(self):
+        # type: () -> Optional[str]
+        if self._description_path is _NOT_SET:
+            self._description_path = self._find_package_file('*_description.md')
+        return self._description_path
+
+
+class Script(YmlContentEntity):
+    """A script.
+
+    Attributes:
+        docker_image (str): the docker image of the script, '' if it has none.
+    """
+    __slots__ = ()
+    UNIFIED_REGEXES = [SCRIPT_REGEX]
+
+    @property
+    def docker_image(self):
+        # type: () -> str
+        return self.data.get('dockerimage', '')
+
+
+class Playbook(YmlContentEntity):
+    """A playbook or a test playbook.
+
+    Attributes:
+        is_test_playbook (bool): whether the playbook is a test playbook.
+    """
+    __slots__ = ()
+    UNIFIED_REGEXES = YML_ALL_PLAYBOOKS_REGEX
+
+    @property
+    def is_test_playbook(self):
+        # type: () -> bool
+        return bool(checked_type(self.path, YML_TEST_PLAYBOOKS_REGEXES))
+
+
+class IncidentField(ContentEntity):
+    __slots__ = ()
+
+
+class IndicatorField(ContentEntity):
+    __slots__ = ()
+
+
+class IncidentType(ContentEntity):
+    __slots__ = ()
+
+
+class Layout(ContentEntity):
+    __slots__ = ()
+
+
+ENTITY_CLASS_TO_REGEXES = [
+    (Integration, YML_ALL_INTEGRATION_REGEXES),
+    (Script, YML_ALL_SCRIPTS_REGEXES),
+    (Playbook, YML_ALL_PLAYBOOKS_REGEX),
+    (IncidentField, JSON_ALL_INCIDENT_FIELD_REGEXES),
+    (IndicatorField, JSON_ALL_INDICATOR_FIELDS_REGEXES),
+    (IncidentType, JSON_ALL_INCIDENT_TYPES_REGEXES),
+    (Layout, JSON_ALL_LAYOUT_REGEXES),
+]
+
+
+def get_content_entity(path_or_entity):
+    # type: (Union[str, ContentEntity]) -> ContentEntity
+    """Gets the content entity of a file.
+
+    Args:
+        path_or_entity: a path to a content file, or an already created entity which is returned as is.
+
+    Returns:
+        ContentEntity. An instance of the most specific entity class matching the path.
+    """
+    if isinstance(path_or_entity, ContentEntity):
+        return path_or_entity
+
+    for entity_class, regexes in ENTITY_CLASS_TO_REGEXES:
+        if checked_type(path_or_entity, regexes):
+            return entity_class(path_or_entity)
+
+    return ContentEntity(path_or_entity)
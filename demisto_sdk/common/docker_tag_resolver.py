@@ -0,0 +1,231 @@
+"""Resolution of the latest tags of the docker images of integrations and scripts.
+
+Checking that an integration or a script uses the latest tag of its docker image used to send up to three requests
+per file (a registry token, the docker hub tags and the registry tags list), without a session or a cache, while
+most of the files use the same few images (demisto/python, demisto/python3...). DockerTagResolver resolves every
+image once per run, resolves the images of all the changed files concurrently over a single pooled session before
+the validation starts, and keeps the resolved tags on disk for a configurable time to live. In offline mode the tags
+are taken from the disk cache, however old they are, and nothing is requested.
+"""
+import hashlib
+import os
+import re
+import time
+from typing import Dict, Iterable, Optional  # noqa: F401
+
+from demisto_sdk.common.parse_cache import ENTRY_EXTENSION
+from demisto_sdk.common.pooled_http_client import DEFAULT_MAX_WORKERS, PooledHttpClient
+
+ACCEPT_HEADER = {
+    'Accept': 'application/json, '
+              'application/vnd.docker.distribution.manifest.v2+json, '
+              'application/vnd.docker.distribution.manifest.list.v2+json'
+}
+
+# use 10 seconds timeout for requests
+TIMEOUT = 10
+DEFAULT_HUB_URL = 'https://hub.docker.com'
+DEFAULT_REGISTRY_URL = 'https://registry-1.docker.io'
+# The tags of an image are resolved again after an hour
+DEFAULT_TTL = 60 * 60
+TAGS_DIR = 'docker-tags'
+
+
+class OfflineTagError(LookupError):
+    """Raised when the resolver is offline and the latest tag of an image is not cached."""
+
+
+def get_image_name(docker_image):
+    # type: (str) -> str
+    """Gets the name of a docker image of an integration or a script, without its tag.
+
+    Like DockerImageValidator.parse_docker_image, but without printing errors: the name is empty if the image is not
+    of demisto format, and demisto/python if there is no image.
+    """
+    if not docker_image:
+        return 'demisto/python'
+    image_regex = re.findall(r'(demisto\/.+)', docker_image, re.IGNORECASE)
+    return image_regex[0].split(':')[0] if image_regex else ''
+
+
+class DockerTagResolver(PooledHttpClient):
+    """Resolves the latest tags of docker images, once per run, with an optional disk cache of the tags.
+
+    Attributes:
+        hub_url (str): the url of docker hub, whose tags have dates.
+        registry_url (str): the url of the registry, whose tags are listed when docker hub fails.
+        ttl (int): the number of seconds a tag in the disk cache is used for.
+        offline (bool): whether to use only the tags of the disk cache, however old they are.
+        requests_count (int): the number of requests that were sent.
+    """
+
+    def __init__(self, hub_url=DEFAULT_HUB_URL, registry_url=DEFAULT_REGISTRY_URL, max_workers=DEFAULT_MAX_WORKERS,
+                 cache_dir=None, ttl=DEFAULT_TTL, offline=False):
+        # type: (str, str, int, Optional[str], int, bool) -> None
+        super(DockerTagResolver, self).__init__(max_workers, cache_dir)
+        self.hub_url = hub_url
+        self.registry_url = registry_url
+        self.ttl = ttl
+        self.offline = offline
+        self.requests_count = 0
+        # The latest tag of every resolved image, or the error of resolving it
+        self._tags = {}  # type: Dict[str, object]
+
+    def get_state(self):
+        # type: () -> dict
+        """Gets the settings and the resolved tags of the resolver, to set up the resolver of a worker process."""
+        with self._lock:
+            # the errors of requests may hold connection pools, which can not be pickled
+            tags = {image_name: tag if isinstance(tag, (str, OfflineTagError)) else RuntimeError(str(tag))
+                    for image_name, tag in self._tags.items()}
+        return {
+            'hub_url': self.hub_url,
+            'registry_url': self.registry_url,
+            'max_workers': self.max_workers,
+            'cache_dir': self.disk_cache.cache_dir if self.disk_cache is not None else None,
+            'ttl': self.ttl,
+            'offline': self.offline,
+            'tags': tags,
+        }
+
+    def set_state(self, state):
+        # type: (dict) -> None
+        """Sets the settings and the resolved tags of the resolver to the ones get_state got from another resolver."""
+        self.hub_url = state['hub_url']
+        self.registry_url = state['registry_url']
+        self.max_workers = state['max_workers']
+        self.ttl = state['ttl']
+        self.offline = state['offline']
+        if state['cache_dir']:
+            self.enable_disk_cache(state['cache_dir'])
+        else:
+            self.disable_disk_cache()
+        with self._lock:
+            self._tags.update(state['tags'])
+
+    def get_entry_path(self, image_name):
+        # type: (str) -> str
+        entry_key = hashlib.sha256('\0'.join([self.hub_url, self.registry_url, image_name]).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_cache.cache_dir, TAGS_DIR, entry_key[:2], entry_key + ENTRY_EXTENSION)
+
+    def get_latest_tag(self, image_name):
+        # type: (str) -> str
+        """Gets the latest tag of a docker image, resolved once per run.
+
+        Args:
+            image_name (str): the name of the image, e.g. demisto/python3.
+
+        Returns:
+            str. The latest tag, empty if the image has no tags.
+
+        Raises:
+            requests.exceptions.RequestException: if the tags could not be fetched.
+            OfflineTagError: if the resolver is offline and the tag of the image is not cached.
+        """
+        with self._lock:
+            resolved = image_name in self._tags
+        if not resolved:
+            try:
+                tag = self._resolve(image_name)  # type: object
+            except Exception as err:
+                # the image is not requested again in this run
+                tag = err
+            with self._lock:
+                self._tags.setdefault(image_name, tag)
+
+        tag = self._tags[image_name]
+        if isinstance(tag, Exception):
+            raise tag
+        return tag  # type: ignore
+
+    def resolve(self, image_names):
+        # type: (Iterable[str]) -> None
+        """Resolves the latest tags of images concurrently, so the following lookups of them are served from memory.
+
+        Errors are kept and raised when the tag of the image is requested.
+        """
+        self.run_concurrently(self.get_latest_tag,
+                              [image_name for image_name in sorted(set(image_names)) if image_name not in self._tags])
+
+    def _resolve(self, image_name):
+        # type: (str) -> str
+        entry_path = self.get_entry_path(image_name) if self.disk_cache is not None else None
+        if entry_path:
+            found, cached = self.disk_cache.get(entry_path)
+            if found and (self.offline or time.time() - cached['resolved_at'] < self.ttl):
+                return cached['tag']
+
+        if self.offline:
+            raise OfflineTagError('The latest tag of {} is not cached, and docker hub is not queried in offline '
+                                  'mode.'.format(image_name))
+
+        tag = self.fetch_latest_tag(image_name)
+        if entry_path:
+            self.disk_cache.set(entry_path, {'tag': tag, 'resolved_at': time.time()})
+        return tag
+
+    def _get(self, url, **kwargs):
+        with self._lock:
+            self.requests_count += 1
+        return self.session.get(url, timeout=TIMEOUT, verify=False, **kwargs)
+
+    def get_auth_token(self, image_name):
+        # type: (str) -> Optional[str]
+        """
+        Authenticate to the docker registry. Return an authentication token if authentication is required.
+        """
+        from demisto_sdk.common.hook_validations.docker import DockerImageValidator
+
+        res = self._get('{}/v2/'.format(self.registry_url), headers=ACCEPT_HEADER)
+        if res.status_code == 401:  # need to authenticate
+            # defaults in case we fail for some reason
+            realm = 'https://auth.docker.io/token'
+            service = 'registry.docker.io'
+            # Should contain header: Www-Authenticate
+            www_auth = res.headers.get('www-authenticate')
+            if www_auth:
+                parse_auth = DockerImageValidator.parse_www_auth(www_auth)
+                if parse_auth:
+                    realm, service = parse_auth
+            params = {
+                'scope': 'repository:{}:pull'.format(image_name),
+                'service': service
+            }
+            res = self._get(realm, params=params, headers=ACCEPT_HEADER)
+            res.raise_for_status()
+            return res.json().get('token')
+        else:
+            res.raise_for_status()
+            return None
+
+    def fetch_latest_tag(self, image_name):
+        # type: (str) -> str
+        """Fetches the latest tag of a docker image from docker hub, or from the registry if docker hub fails."""
+        from demisto_sdk.common.hook_validations.docker import DockerImageValidator
+
+        tag = ''
+        # first try to get the docker image tags using normal http request, which needs no token
+        res = self._get('{}/v2/repositories/{}/tags'.format(self.hub_url, image_name))
+        if res.status_code == 200:
+            tags = res.json().get('results', [])
+            # if http request successful find the latest tag by date in the response
+            if tags:
+                tag = DockerImageValidator.find_latest_tag_by_date(tags)
+
+        else:
+            # if http request did not succeed than get tags using the API.
+            # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
+            headers = ACCEPT_HEADER.copy()
+            auth_token = self.get_auth_token(image_name)
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            res = self._get('{}/v2/{}/tags/list'.format(self.registry_url, image_name), headers=headers)
+            res.raise_for_status()
+            # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
+            tags = res.json().get('tags', [])
+            if tags:
+                tag = DockerImageValidator.lexical_find_latest_tag(tags)
+        return tag
+
+
+docker_tag_resolver = DockerTagResolver()
@@ -0,0 +1,293 @@
+"""Git queries of a single run.
+
+The validators, the secrets detection, lint and the id_set scripts all ask git the same questions - the current
+branch, the files changed against HEAD and against origin/master, and the diff of single files - and each of them
+used to spawn its own git process for every question, sometimes once per changed file. A GitContext runs every query
+once and keeps the answer for the rest of the run, and serves the diff of single files out of one `git diff` of the
+whole tree.
+"""
+import os
+import re
+import sys
+from collections import namedtuple
+from subprocess import Popen, PIPE
+from typing import Dict, List, Optional, Set, Tuple
+
+from demisto_sdk.common.tools import print_error
+
+ChangedFile = namedtuple('ChangedFile', ['status', 'path', 'old_path'])
+ChangedFile.__doc__ = """A file in the output of `git diff --name-status`.
+
+    Attributes:
+        status (str): the git status of the file (e.g. M, A, D, R100).
+        path (str): the path of the file.
+        old_path (str): the path the file was renamed or copied from, None for other statuses.
+    """
+
+DIFF_HEADER = 'diff --git '
+HUNK_HEADER_PATTERN = re.compile(r'@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@')
+
+
+class GitContext:
+    """Runs each git query once per run.
+
+    Nothing is run on creation, every query is run on first use and its output is kept for the following ones.
+
+    Attributes:
+        cwd (str): the directory of the git repository, the current directory if None.
+        command_count (int): the number of git processes that were spawned.
+    """
+
+    def __init__(self, cwd=None):
+        # type: (Optional[str]) -> None
+        self.cwd = cwd
+        self.command_count = 0
+        self._outputs = {}  # type: Dict[Tuple[str, ...], str]
+        self._changed_files = {}  # type: Dict[Tuple[str, ...], List[ChangedFile]]
+        self._file_diffs = {}  # type: Dict[Tuple[str, ...], Dict[str, str]]
+
+    def run(self, *args, exit_on_error=True):
+        # type: (str, bool) -> str
+        """Runs a git command, once per arguments.
+
+        Errors are handled like in run_command - any output to stderr fails the command.
+
+        Args:
+            *args: the arguments of git.
+            exit_on_error (bool): whether to exit on error, a RuntimeError is raised otherwise.
+
+        Returns:
+            str. The output of the command.
+        """
+        if args not in self._outputs:
+            self.command_count += 1
+            command = ['git', '-c', 'core.quotePath=false'] + list(args)
+            p = Popen(command, stdout=PIPE, stderr=PIPE, universal_newlines=True, cwd=self.cwd)
+            output, err = p.communicate()
+            if err:
+                message = 'Failed to run command {}\nerror details:\n{}'.format(' '.join(command), err)
+                if exit_on_error:
+                    print_error(message)
+                    sys.exit(1)
+                raise RuntimeError(message)
+
+            self._outputs[args] = output
+
+        return self._outputs[args]
+
+    @property
+    def head(self):
+        # type: () -> str
+        """The commit SHA of HEAD."""
+        return self.run('rev-parse', 'HEAD').strip()
+
+    @property
+    def branch(self):
+        # type: () -> str
+        """The name of the current branch, 'HEAD' if HEAD is detached."""
+        return self.run('rev-parse', '--abbrev-ref', 'HEAD').strip()
+
+    @property
+    def is_merging(self):
+        # type: () -> bool
+        """Whether a merge is in progress."""
+        return bool(self.run('rev-parse', '-q', '--verify', 'MERGE_HEAD'))
+
+    def merge_base(self, rev='origin/master'):
+        # type: (str) -> str
+        """Gets the commit SHA of the best common ancestor of rev and HEAD."""
+        return self.run('merge-base', rev, 'HEAD').strip()
+
+    def get_changed_files(self, *diff_args):
+        # type: (str) -> List[ChangedFile]
+        """Gets the files changed according to `git diff --name-status -z <diff_args>`.
+
+        Args:
+            *diff_args: the revisions (and options) to diff, the working tree against the index if empty.
+
+        Returns:
+            list. The ChangedFile of every changed file, in the order of git.
+        """
+        if diff_args not in self._changed_files:
+            fields = self.run('diff', '--name-status', '-z', *diff_args).split('\0')
+            changed_files = []
+            i = 0
+            while i < len(fields) and fields[i]:
+                status = fields[i]
+                if status[0] in 'RC':
+                    changed_files.append(ChangedFile(status, fields[i + 2], fields[i + 1]))
+                    i += 3
+                else:
+                    changed_files.append(ChangedFile(status, fields[i + 1], None))
+                    i += 2
+
+            self._changed_files[diff_args] = changed_files
+
+        return self._changed_files[diff_args]
+
+    def get_name_status(self, *diff_args):
+        # type: (str) -> str
+        """Gets the files changed in the format of `git diff --name-status <diff_args>`, for the parsers of that format.
+
+        Args:
+            *diff_args: the revisions (and options) to diff, the working tree against the index if empty.
+
+        Returns:
+            str. A tab separated line of status, (old path) and path per changed file.
+        """
+        lines = []
+        for changed_file in self.get_changed_files(*diff_args):
+            paths = [changed_file.old_path, changed_file.path] if changed_file.old_path else [changed_file.path]
+            lines.append('\t'.join([changed_file.status] + paths) + '\n')
+        return ''.join(lines)
+
+    def get_branch_changed_files(self, rev='origin/master'):
+        # type: (str) -> List[ChangedFile]
+        """Gets the files committed in the current branch since it forked from rev (`git diff rev...HEAD`)."""
+        return self.get_changed_files(self.merge_base(rev), 'HEAD')
+
+    def get_file_diff(self, path, *revs, unified=3):
+        # type: (str, str, int) -> str
+        """Gets the diff of a single file, like `git diff --unified=<unified> <revs> <path>`.
+
+        The first request for a set of revisions diffs the whole tree in a single git process, the diff of every
+        other file is then served out of it.
+
+        Args:
+            path (str): the path of the file.
+            *revs: the revisions to diff, the working tree against the index if empty.
+            unified (int): the number of context lines.
+
+        Returns:
+            str. The diff of the file, empty if the file did not change.
+        """
+        key = ('--unified={}'.format(unified),) + revs
+        if key not in self._file_diffs:
+            self._file_diffs[key] = split_diff(self.run('diff', '--no-color', '--no-renames', *key))
+
+        return self._file_diffs[key].get(os.path.normpath(path), '')
+
+
+class BlobReader:
+    """Reads git objects through a single long-lived `git cat-file --batch` process.
+
+    The process is started on the first read. A copy of the reader, e.g. in a worker process, starts its own process.
+
+    Attributes:
+        git_context (GitContext): the git queries of the run, which counts the process.
+    """
+
+    def __init__(self, git_context=None):
+        # type: (Optional[GitContext]) -> None
+        self.git_context = git_context or GitContext()
+        self._process = None  # type: Optional[Popen]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_process'] = None
+        return state
+
+    def read(self, object_name):
+        # type: (str) -> Optional[bytes]
+        """Reads a blob.
+
+        Args:
+            object_name (str): the name of the object, e.g. <tree>:<path> or the SHA of a blob.
+
+        Returns:
+            bytes. The content of the blob, None if it does not exist or is not a blob.
+        """
+        if self._process is None:
+            self._process = Popen(['git', 'cat-file', '--batch'], stdin=PIPE, stdout=PIPE, cwd=self.git_context.cwd)
+            self.git_context.command_count += 1
+
+        self._process.stdin.write(object_name.encode('utf-8') + b'\n')
+        self._process.stdin.flush()
+        header = self._process.stdout.readline().rstrip(b'\n')
+        if header.endswith((b' missing', b' ambiguous')):
+            return None
+
+        _, object_type, size = header.split()
+        content = self._process.stdout.read(int(size))
+        self._process.stdout.read(1)  # The content is followed by a newline
+        # Paths of directories are trees
+        return content if object_type == b'blob' else None
+
+    def close(self):
+        # type: () -> None
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
+def split_diff(diff):
+    # type: (str) -> Dict[str, str]
+    """Splits the output of `git diff` to the diff of every file.
+
+    Args:
+        diff (str): the output of git diff.
+
+    Returns:
+        dict. The path of each file in the diff to its part of the diff.
+    """
+    file_diffs = {}  # type: Dict[str, str]
+    for file_diff in diff.split('\n' + DIFF_HEADER):
+        if not file_diff:
+            continue
+        if not file_diff.startswith(DIFF_HEADER):
+            file_diff = DIFF_HEADER + file_diff
+        if not file_diff.endswith('\n'):
+            file_diff += '\n'
+
+        file_diffs[get_diff_path(file_diff)] = file_diff
+
+    return file_diffs
+
+
+def get_added_line_numbers(file_diff):
+    # type: (str) -> Set[int]
+    """Gets the numbers of the lines a diff of a single file adds, in the new version of the file.
+
+    Args:
+        file_diff (str): the diff of the file, with any number of context lines.
+
+    Returns:
+        set. The numbers of the added lines, starting at 1.
+    """
+    added_line_numbers = set()  # type: Set[int]
+    line_number = None
+    for line in file_diff.split('\n'):
+        if line.startswith('@@'):
+            # @@ -<old start>[,<old count>] +<new start>[,<new count>] @@
+            line_number = int(HUNK_HEADER_PATTERN.match(line).group(1))
+        elif line_number is None or line.startswith(('-', '\\')):
+            # the header of the diff, removed lines and "\ No newline at end of file"
+            continue
+        elif line.startswith('+'):
+            added_line_numbers.add(line_number)
+            line_number += 1
+        elif line.startswith(' '):
+            line_number += 1
+    return added_line_numbers
+
+
+def get_diff_path(file_diff):
+    # type: (str) -> str
+    """Gets the path of the file in the diff of a single file (the old path of deleted files)."""
+    old_path = None
+    for line in file_diff.split('\n'):
+        if line.startswith(('+++ b/', 'rename to ')):
+            return line[len('+++ b/'):].rstrip('\t') if line.startswith('+') else line[len('rename to '):]
+        if line.startswith('--- a/'):
+            old_path = line[len('--- a/'):].rstrip('\t')
+        elif line.startswith(('@@', 'Binary files')):
+            break
+
+    if old_path:
+        return old_path
+
+    # The header of diffs with no content (e.g. mode changes) is "diff --git a/<path> b/<path>"
+    header = file_diff.split('\n', 1)[0][len(DIFF_HEADER):]
+    return header[len('a/'):(len(header) - 1) // 2]
@@ -1,32 +1,22 @@
-import re
-from typing import Callable, List
+from typing import Callable, List, Optional
 
-from demisto_sdk.common.tools import run_command
+from demisto_sdk.common.git_context import GitContext
 
 
-def get_current_working_branch() -> str:
-    branches = run_command('git branch')
-    branch_name_reg = re.search(r'\* (.*)', branches)
-    if branch_name_reg:
-        return branch_name_reg.group(1)
+def get_current_working_branch(git_context: Optional[GitContext] = None) -> str:
+    git_context = git_context or GitContext()
+    return git_context.branch
 
-    return ''
 
-
-def get_changed_files(from_branch: str = 'master', filter_results: Callable = None):
-    temp_files = run_command(f'git diff --name-status {from_branch}').split('\n')
+def get_changed_files(from_branch: str = 'master', filter_results: Callable = None,
+                      git_context: Optional[GitContext] = None):
+    git_context = git_context or GitContext()
     files: List = []
-    for file in temp_files:
-        if file:
-            temp_file_data = {
-                'status': file[0]
-            }
-            if file.lower().startswith('r'):
-                file = file.split('\t')
-                temp_file_data['name'] = file[2]
-            else:
-                temp_file_data['name'] = file[2:]
-            files.append(temp_file_data)
+    for changed_file in git_context.get_changed_files(from_branch):
+        files.append({
+            'status': changed_file.status[0],
+            'name': changed_file.path
+        })
 
     if filter_results:
         filter(filter_results, files)
@@ -1,11 +1,13 @@
 import os
 import re
 from abc import abstractmethod
+from typing import Optional
 
 from demisto_sdk.common.constants import Errors
 from demisto_sdk.common.hook_validations.structure import StructureValidator
+from demisto_sdk.common.git_context import GitContext
 from demisto_sdk.common.tools import print_error, get_release_notes_file_path, \
-    get_latest_release_notes_text, run_command
+    get_latest_release_notes_text
 from demisto_sdk.common.constants import ID_IN_COMMONFIELDS, ID_IN_ROOT
 
 
@@ -16,16 +18,27 @@ class BaseValidator:
         # type: (StructureValidator) -> None
         self.structure_validator = structure_validator
         self.current_file = structure_validator.current_file
-        self.old_file = structure_validator.old_file
         self.file_path = structure_validator.file_path
         self.is_valid = structure_validator.is_valid
+        self.git_context = getattr(structure_validator, 'git_context', None)
+
+    @property
+    def old_file(self):
+        # type: () -> dict
+        """The old version of the file, loaded only by the validators which need it."""
+        return self.structure_validator.old_file
+
+    @old_file.setter
+    def old_file(self, old_file):
+        # type: (dict) -> None
+        self.structure_validator.old_file = old_file
 
     def is_valid_file(self, validate_rn=True):
         tests = [
             self.is_valid_version()
         ]
         # In case of release branch we allow to remove release notes
-        if validate_rn and not self.is_release_branch():
+        if validate_rn and not self.is_release_branch(self.git_context):
             tests.append(self.is_there_release_notes())
         return all(tests)
 
@@ -66,14 +79,18 @@ class BaseValidator:
         return True
 
     @staticmethod
-    def is_release_branch():
-        # type: () -> bool
+    def is_release_branch(git_context=None):
+        # type: (Optional[GitContext]) -> bool
         """Check if we are working on a release branch.
 
+        Args:
+            git_context (GitContext): the git queries of the run.
+
         Returns:
             (bool): is release branch
         """
-        diff_string_config_yml = run_command("git diff origin/master .circleci/config.yml")
+        git_context = git_context or GitContext()
+        diff_string_config_yml = git_context.get_file_diff('.circleci/config.yml', 'origin/master')
         if re.search(r'[+-][ ]+CONTENT_VERSION: ".*', diff_string_config_yml):
             return True
         return False
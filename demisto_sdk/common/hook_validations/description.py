@@ -1,6 +1,7 @@
 import glob
 
-from demisto_sdk.common.tools import re, print_error, print_warning, os, get_yaml
+from demisto_sdk.common.tools import re, print_error, print_warning, os
+from demisto_sdk.common.content_entity import get_content_entity
 from demisto_sdk.common.constants import INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, BETA_INTEGRATION_DISCLAIMER
 
 
@@ -9,13 +10,15 @@ class DescriptionValidator:
 
     Attributes:
         file_path (string): Path to the checked file.
+        entity (ContentEntity): The content entity of the checked file.
         _is_valid (bool): the attribute which saves the valid/in-valid status of the current file.
     """
 
     def __init__(self, file_path):
         self._is_valid = True
 
-        self.file_path = file_path
+        self.entity = get_content_entity(file_path)
+        self.file_path = self.entity.path
 
     def is_valid(self):
         self.is_duplicate_description()
@@ -24,7 +27,7 @@ class DescriptionValidator:
 
     def is_valid_beta_description(self):
         """Check if beta disclaimer exists in detailed description"""
-        data_dictionary = get_yaml(self.file_path)
+        data_dictionary = self.entity.data
         description_in_yml = data_dictionary.get('detaileddescription', '') if data_dictionary else ''
 
         if not re.match(BETA_INTEGRATION_REGEX, self.file_path, re.IGNORECASE):
@@ -76,7 +79,7 @@ class DescriptionValidator:
             if md_file_path:
                 is_description_in_package = True
 
-        data_dictionary = get_yaml(self.file_path)
+        data_dictionary = self.entity.data
 
         if not data_dictionary:
             return is_description_in_package
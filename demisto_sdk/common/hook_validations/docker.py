@@ -1,23 +1,14 @@
-from demisto_sdk.common.tools import get_yaml, print_error
+from demisto_sdk.common.tools import print_error, print_warning
+from demisto_sdk.common.content_entity import get_content_entity
 from distutils.version import LooseVersion
 from pkg_resources import parse_version
 from datetime import datetime, timedelta
 import re
-import requests
 
+from demisto_sdk.common.docker_tag_resolver import docker_tag_resolver, OfflineTagError
 
-# disable insecure warnings
-requests.packages.urllib3.disable_warnings()
-
-ACCEPT_HEADER = {
-    'Accept': 'application/json, '
-              'application/vnd.docker.distribution.manifest.v2+json, '
-              'application/vnd.docker.distribution.manifest.list.v2+json'
-}
-
-# use 10 seconds timeout for requests
-TIMEOUT = 10
-DEFAULT_REGISTRY = 'registry-1.docker.io'
+# The latest tag of an image which was not resolved since docker hub is not queried in offline mode
+OFFLINE_TAG = object()
 
 
 class DockerImageValidator(object):
@@ -25,7 +16,8 @@ class DockerImageValidator(object):
     def __init__(self, yml_file_path, is_modified_file, is_integration):
         self.is_modified_file = is_modified_file
         self.is_integration = is_integration
-        self.yml_file = get_yaml(yml_file_path)
+        self.entity = get_content_entity(yml_file_path)
+        self.yml_file = self.entity.data
         self.yml_docker_image = self.get_docker_image_from_yml()
         self.from_version = self.yml_file.get('fromversion', '0')
         self.docker_image_name, self.docker_image_tag = DockerImageValidator.parse_docker_image(self.yml_docker_image)
@@ -40,6 +32,12 @@ class DockerImageValidator(object):
         return self.is_valid
 
     def is_docker_image_latest_tag(self):
+        if self.docker_image_latest_tag is OFFLINE_TAG:
+            # the file is not failed because docker hub was not queried
+            print_warning('The latest tag of {} is not cached and docker hub is not queried in offline mode, '
+                          'skipping the docker image tag check.'.format(self.docker_image_name))
+            return self.is_latest_tag
+
         if not self.docker_image_name or not self.docker_image_latest_tag:
             # If the docker image isn't in the format we expect it to be or we failed fetching the tag
             # We don't want to print any error msgs to user because they have already been printed
@@ -87,45 +85,6 @@ class DockerImageValidator(object):
             return ()
         return match.groups()
 
-    @staticmethod
-    def docker_auth(image_name, verify_ssl=True, registry=DEFAULT_REGISTRY):
-        """
-        Authenticate to the docker service. Return an authentication token if authentication is required.
-        """
-        res = requests.get(
-            'https://{}/v2/'.format(registry),
-            headers=ACCEPT_HEADER,
-            timeout=TIMEOUT,
-            verify=verify_ssl
-        )
-        if res.status_code == 401:  # need to authenticate
-            # defaults in case we fail for some reason
-            realm = 'https://auth.docker.io/token'
-            service = 'registry.docker.io'
-            # Should contain header: Www-Authenticate
-            www_auth = res.headers.get('www-authenticate')
-            if www_auth:
-                parse_auth = DockerImageValidator.parse_www_auth(www_auth)
-                if parse_auth:
-                    realm, service = parse_auth
-            params = {
-                'scope': 'repository:{}:pull'.format(image_name),
-                'service': service
-            }
-            res = requests.get(
-                url=realm,
-                params=params,
-                headers=ACCEPT_HEADER,
-                timeout=TIMEOUT,
-                verify=verify_ssl
-            )
-            res.raise_for_status()
-            res_json = res.json()
-            return res_json.get('token')
-        else:
-            res.raise_for_status()
-            return None
-
     @staticmethod
     def clear_non_numbered_tags(tags):
         """Clears a given tags list to only keep numbered tags
@@ -183,49 +142,20 @@ class DockerImageValidator(object):
 
     @staticmethod
     def get_docker_image_latest_tag(docker_image_name, yml_docker_image):
-        """Returns the docker image latest tag of the given docker image
+        """Returns the docker image latest tag of the given docker image, resolved once per run by docker_tag_resolver
 
         Args:
             docker_image_name: The name of the docker image
             yml_docker_image: The docker image as it appears in the yml file
 
         Returns:
-            The last updated docker image tag
+            The last updated docker image tag, OFFLINE_TAG if the resolver is offline and the tag is not cached
         """
         try:
-            tag = ''
-            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-            headers = ACCEPT_HEADER.copy()
-            if auth_token:
-                headers['Authorization'] = 'Bearer {}'.format(auth_token)
-
-            # first try to get the docker image tags using normal http request
-            res = requests.get(
-                url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
-                verify=False,
-            )
-            if res.status_code == 200:
-                tags = res.json().get('results', [])
-                # if http request successful find the latest tag by date in the response
-                if tags:
-                    tag = DockerImageValidator.find_latest_tag_by_date(tags)
-
-            else:
-                # if http request did not succeed than get tags using the API.
-                # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-                res = requests.get(
-                    'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
-                    headers=headers,
-                    timeout=TIMEOUT,
-                    verify=False
-                )
-                res.raise_for_status()
-                # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
-                tags = res.json().get('tags', [])
-                if tags:
-                    tag = DockerImageValidator.lexical_find_latest_tag(tags)
-            return tag
-        except (requests.exceptions.RequestException, Exception):
+            return docker_tag_resolver.get_latest_tag(docker_image_name)
+        except OfflineTagError:
+            return OFFLINE_TAG
+        except Exception:
             if not docker_image_name:
                 docker_image_name = yml_docker_image
             print_error('Failed getting tag for: {}. Please check it exists and of demisto format.'
@@ -1,10 +1,12 @@
 import os
 import re
 import json
-from distutils.version import LooseVersion
 from collections import OrderedDict
+from typing import Dict, Union  # noqa: F401
 
 from demisto_sdk.common.configuration import Configuration
+from demisto_sdk.common.content_entity import get_content_entity
+from demisto_sdk.common.id_set_index import IdSetIndex, get_version_range
 from demisto_sdk.common.tools import get_script_or_integration_id, collect_ids, print_error
 from demisto_sdk.common.constants import INTEGRATION_REGEX, TEST_PLAYBOOK_REGEX, SCRIPT_JS_REGEX, \
     SCRIPT_REGEX, TEST_SCRIPT_REGEX, INTEGRATION_YML_REGEX, PLAYBOOK_REGEX, SCRIPT_YML_REGEX, SCRIPT_PY_REGEX
@@ -22,6 +24,7 @@ class IDSetValidator:
     Attributes:
         is_circle (bool): whether we are running on circle or local env.
         id_set (dict): Dictionary that hold all the data from the id_set.json file.
+        id_set_indexes (dict): The index of every section of the id_set, built when the id_set is set.
         script_set (set): Set of all the data regarding scripts in our system.
         playbook_set (set): Set of all the data regarding playbooks in our system.
         integration_set (set): Set of all the data regarding integrations in our system.
@@ -34,9 +37,9 @@ class IDSetValidator:
 
     ID_SET_PATH = "./Tests/id_set.json"
 
-    def __init__(self, is_test_run=False, is_circle=False, configuration=Configuration()):
+    def __init__(self, is_test_run=False, is_circle=False, configuration=None):
         self.is_circle = is_circle
-        self.configuration = configuration
+        self.configuration = configuration or Configuration()
         if not is_test_run and self.is_circle:
             self.id_set = self.load_id_set()
             self.id_set_path = os.path.join(self.configuration.env_dir, 'configs', 'id_set.json')
@@ -45,6 +48,18 @@ class IDSetValidator:
             self.integration_set = self.id_set[self.INTEGRATION_SECTION]
             self.test_playbook_set = self.id_set[self.TEST_PLAYBOOK_SECTION]
 
+    @property
+    def id_set(self):
+        # type: () -> dict
+        return self._id_set
+
+    @id_set.setter
+    def id_set(self, id_set):
+        # type: (dict) -> None
+        self._id_set = id_set
+        self.id_set_indexes = {section: IdSetIndex(instances)
+                               for section, instances in id_set.items()}  # type: Dict[str, IdSetIndex]
+
     def load_id_set(self):
         with open(self.ID_SET_PATH, 'r') as id_set_file:
             try:
@@ -58,80 +73,76 @@ class IDSetValidator:
 
             return id_set
 
-    def is_valid_in_id_set(self, file_path: str, obj_data: OrderedDict, obj_set: list):
+    def is_valid_in_id_set(self, file_path: str, obj_data: OrderedDict, obj_set: Union[list, IdSetIndex]):
         """Check if the file is represented correctly in the id_set
 
         Args:
             file_path (string): Path to the file.
             obj_data (dict): Dictionary that holds the extracted details from the given file.
-            obj_set (set): The set in which the file should be located at.
+            obj_set (list or IdSetIndex): The set in which the file should be located at, or its index.
 
         Returns:
             bool. Whether the file is represented correctly in the id_set or not.
         """
-        is_found = False
-        file_id = list(obj_data.keys())[0]
-
-        for checked_instance in obj_set:
-            checked_instance_id = list(checked_instance.keys())[0]
-            checked_instance_data = checked_instance[checked_instance_id]
-            checked_instance_toversion = checked_instance_data.get('toversion', '99.99.99')
-            checked_instance_fromversion = checked_instance_data.get('fromversion', '0.0.0')
-            obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
-            obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
-            if checked_instance_id == file_id and checked_instance_toversion == obj_to_version and \
-                    checked_instance_fromversion == obj_from_version:
-                is_found = True
-                if checked_instance_data != obj_data[file_id]:
-                    print_error("You have failed to update id_set.json with the data of {} "
-                                "please run `python Tests/scripts/update_id_set.py`".format(file_path))
-                    return False
-
-        if not is_found:
+        obj_index = obj_set if isinstance(obj_set, IdSetIndex) else IdSetIndex(obj_set)
+        file_id = next(iter(obj_data))
+        from_version, to_version = get_version_range(obj_data[file_id])
+
+        found_entries = obj_index.find(file_id, from_version, to_version)
+        if any(entry.data != obj_data[file_id] for entry in found_entries):
             print_error("You have failed to update id_set.json with the data of {} "
                         "please run `python Tests/scripts/update_id_set.py`".format(file_path))
+            return False
 
-        return is_found
+        if not found_entries:
+            print_error("You have failed to update id_set.json with the data of {} "
+                        "please run `python Tests/scripts/update_id_set.py`".format(file_path))
+
+        return bool(found_entries)
 
     def is_file_valid_in_set(self, file_path):
         """Check if the file is represented correctly in the id_set
 
         Args:
-            file_path (string): Path to the file.
+            file_path (string or ContentEntity): Path to the file, or its content entity.
 
         Returns:
             bool. Whether the file is represented correctly in the id_set or not.
         """
         is_valid = True
         if self.is_circle:  # No need to check on local env because the id_set will contain this info after the commit
+            entity = get_content_entity(file_path)
+            file_path = entity.path
             if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_data = get_playbook_data(file_path)
-                is_valid = self.is_valid_in_id_set(file_path, playbook_data, self.playbook_set)
+                playbook_data = get_playbook_data(entity)
+                is_valid = self.is_valid_in_id_set(file_path, playbook_data, self.id_set_indexes[self.PLAYBOOK_SECTION])
 
             elif re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_data = get_playbook_data(file_path)
-                is_valid = self.is_valid_in_id_set(file_path, playbook_data, self.test_playbook_set)
+                playbook_data = get_playbook_data(entity)
+                is_valid = self.is_valid_in_id_set(file_path, playbook_data,
+                                                   self.id_set_indexes[self.TEST_PLAYBOOK_SECTION])
 
             elif re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE) or \
                     re.match(SCRIPT_REGEX, file_path, re.IGNORECASE):
 
-                script_data = get_script_data(file_path)
-                is_valid = self.is_valid_in_id_set(file_path, script_data, self.script_set)
+                script_data = get_script_data(entity)
+                is_valid = self.is_valid_in_id_set(file_path, script_data, self.id_set_indexes[self.SCRIPTS_SECTION])
 
             elif re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
                     re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
 
-                integration_data = get_integration_data(file_path)
-                is_valid = self.is_valid_in_id_set(file_path, integration_data, self.integration_set)
+                integration_data = get_integration_data(entity)
+                is_valid = self.is_valid_in_id_set(file_path, integration_data,
+                                                   self.id_set_indexes[self.INTEGRATION_SECTION])
 
             elif re.match(SCRIPT_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(SCRIPT_PY_REGEX, file_path, re.IGNORECASE) or \
                     re.match(SCRIPT_JS_REGEX, file_path, re.IGNORECASE):
 
-                unifier = Unifier(os.path.dirname(file_path))
+                unifier = Unifier(entity)
                 yml_path, code = unifier.get_script_package_data()
                 script_data = get_script_data(yml_path, script_code=code)
-                is_valid = self.is_valid_in_id_set(yml_path, script_data, self.script_set)
+                is_valid = self.is_valid_in_id_set(yml_path, script_data, self.id_set_indexes[self.SCRIPTS_SECTION])
 
         return is_valid
 
@@ -146,31 +157,21 @@ class IDSetValidator:
         Returns:
             bool. Whether the ID already exist in the system or not.
         """
+        obj_from_version, obj_to_version = get_version_range(obj_data[obj_id])
+
         is_duplicated = False
-        obj_data_list = list(obj_data.values())
-        dict_value = obj_data_list[0]
-        obj_toversion = dict_value.get('toversion', '99.99.99')
-        obj_fromversion = dict_value.get('fromversion', '0.0.0')
-
-        for section, section_data in self.id_set.items():
-            for instance in section_data:
-                instance_id = list(instance.keys())[0]
-                instance_to_version = instance[instance_id].get('toversion', '99.99.99')
-                instance_from_version = instance[instance_id].get('fromversion', '0.0.0')
-                if obj_id == instance_id:
-                    if section != obj_type and LooseVersion(obj_fromversion) < LooseVersion(instance_to_version):
-                        is_duplicated = True
-                        break
-
-                    elif obj_fromversion == instance_from_version and obj_toversion == instance_to_version:
-                        if instance[instance_id] != obj_data[obj_id]:
-                            is_duplicated = True
-                            break
-
-                    elif (LooseVersion(obj_fromversion) <= LooseVersion(instance_to_version) and
-                          (LooseVersion(obj_toversion) >= LooseVersion(instance_from_version))):
-                        is_duplicated = True
-                        break
+        for section, id_set_index in self.id_set_indexes.items():
+            if section != obj_type:
+                # The id is used by another type of object, which it may not overlap from its start version on
+                duplicates = id_set_index.find_overlapping(obj_id, obj_from_version)
+            else:
+                # The object itself, with the same version range and data, is not a duplicate
+                duplicates = [entry for entry in id_set_index.find_overlapping(obj_id, obj_from_version, obj_to_version)
+                              if (entry.from_version, entry.to_version) != (obj_from_version, obj_to_version) or
+                              entry.data != obj_data[obj_id]]
+            if duplicates:
+                is_duplicated = True
+                break
 
         if is_duplicated:
             print_error("The ID {0} already exists, please update the file or update the "
@@ -183,7 +184,7 @@ class IDSetValidator:
         """Check if the ID of the given file already exist in the system.
 
         Args:
-            file_path (string): Path to the file.
+            file_path (string or ContentEntity): Path to the file, or its content entity.
 
         Returns:
             bool. Whether the ID of the given file already exist in the system or not.
@@ -191,28 +192,30 @@ class IDSetValidator:
         is_used = False
         is_json_file = False
         if self.is_circle:
+            entity = get_content_entity(file_path)
+            file_path = entity.path
             if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.TEST_PLAYBOOK_SECTION
                 obj_id = collect_ids(file_path)
-                obj_data = get_playbook_data(file_path)
+                obj_data = get_playbook_data(entity)
 
             elif re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or \
                     re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.SCRIPTS_SECTION
                 obj_id = get_script_or_integration_id(file_path)
-                obj_data = get_script_data(file_path)
+                obj_data = get_script_data(entity)
 
             elif re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
                     re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
 
                 obj_type = self.INTEGRATION_SECTION
                 obj_id = get_script_or_integration_id(file_path)
-                obj_data = get_integration_data(file_path)
+                obj_data = get_integration_data(entity)
 
             elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.PLAYBOOK_SECTION
                 obj_id = collect_ids(file_path)
-                obj_data = get_playbook_data(file_path)
+                obj_data = get_playbook_data(entity)
 
             elif re.match(SCRIPT_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(SCRIPT_PY_REGEX, file_path, re.IGNORECASE) or \
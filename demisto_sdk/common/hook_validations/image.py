@@ -2,6 +2,7 @@ import glob
 import base64
 
 from demisto_sdk.common.tools import re, print_error, os, get_yaml, checked_type
+from demisto_sdk.common.content_entity import get_content_entity
 from demisto_sdk.common.constants import IMAGE_REGEX, INTEGRATION_REGEX, DEFAULT_IMAGE_BASE64, \
     INTEGRATION_REGXES, YML_INTEGRATION_REGEXES
 
@@ -11,20 +12,22 @@ class ImageValidator:
 
     Attributes:
         file_path (string): Path to the checked file.
+        entity (ContentEntity): The content entity the validator was created for.
         _is_valid (bool): the attribute which saves the valid/in-valid status of the current file.
     """
     IMAGE_MAX_SIZE = 10 * 1024  # 10kB
 
     def __init__(self, file_path):
         self._is_valid = True
+        self.entity = get_content_entity(file_path)
+        file_path = self.entity.path
 
         if checked_type(file_path, INTEGRATION_REGXES) or re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
             self.file_path = file_path
         else:
             if checked_type(file_path, YML_INTEGRATION_REGEXES):
-                try:
-                    self.file_path = glob.glob(os.path.join(os.path.dirname(file_path), '*.png'))[0]
-                except IndexError:
+                self.file_path = self.entity.image_path
+                if not self.file_path:
                     self._is_valid = False
                     print_error("You've created/modified a package but failed to provide an image as a .png file, "
                                 "please add an image in order to proceed.")
@@ -51,7 +54,7 @@ class ImageValidator:
                 self._is_valid = False
 
         else:
-            data_dictionary = get_yaml(self.file_path)
+            data_dictionary = self.get_yml_data()
 
             if not data_dictionary:
                 return
@@ -67,7 +70,7 @@ class ImageValidator:
         is_image_in_yml = False
         is_image_in_package = False
 
-        data_dictionary = get_yaml(self.file_path)
+        data_dictionary = self.get_yml_data()
 
         if not data_dictionary:
             return False
@@ -92,8 +95,14 @@ class ImageValidator:
 
         return True
 
+    def get_yml_data(self):
+        """Gets the parsed yml of the checked file, reusing the entity data if the checked file is the entity."""
+        if self.file_path == self.entity.path:
+            return self.entity.data
+        return get_yaml(self.file_path)
+
     def load_image_from_yml(self):
-        data_dictionary = get_yaml(self.file_path)
+        data_dictionary = self.get_yml_data()
 
         if not data_dictionary:
             print_error("{} isn't an image file or unified integration file.".format(self.file_path))
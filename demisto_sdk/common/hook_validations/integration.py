@@ -1,3 +1,5 @@
+from typing import Optional
+
 from demisto_sdk.common.constants import Errors, INTEGRATION_CATEGORIES, PYTHON_SUBTYPES, BANG_COMMAND_NAMES, \
     DBOT_SCORES_DICT, IOC_OUTPUTS_DICT
 from demisto_sdk.common.hook_validations.base_validator import BaseValidator
@@ -40,8 +42,8 @@ class IntegrationValidator(BaseValidator):
         ]
         return not any(answers)
 
-    def is_valid_file(self, validate_rn=True):
-        # type: (bool) -> bool
+    def is_valid_file(self, validate_rn=True, validate_docker=True):
+        # type: (bool, bool) -> bool
         """Check whether the Integration is valid or not"""
         answers = [
             super(IntegrationValidator, self).is_valid_file(validate_rn),
@@ -51,9 +53,10 @@ class IntegrationValidator(BaseValidator):
             self.is_insecure_configured_correctly(),
             self.is_valid_category(),
             self.is_id_equals_name(),
-            self.is_docker_image_valid(),
-            self.is_valid_feed(),
         ]
+        if validate_docker:
+            answers.append(self.is_docker_image_valid())
+        answers.append(self.is_valid_feed())
         return all(answers)
 
     def is_valid_beta_integration(self):
@@ -479,10 +482,11 @@ class IntegrationValidator(BaseValidator):
 
         return False
 
-    def is_docker_image_valid(self):
-        # type: () -> bool
-        docker_image_validator = DockerImageValidator(self.file_path, is_modified_file=True, is_integration=True)
-        if not docker_image_validator.is_docker_image_valid():
+    def is_docker_image_valid(self, docker_image_validator=None):
+        # type: (Optional[DockerImageValidator]) -> bool
+        docker_image_validator = docker_image_validator or DockerImageValidator(
+            self.structure_validator.entity, is_modified_file=True, is_integration=True)
+        if docker_image_validator.is_docker_image_valid():
             return True
         self.is_valid = False
         return False
@@ -3,7 +3,7 @@ from __future__ import print_function
 import os
 import re
 
-from demisto_sdk.common.tools import run_command
+from demisto_sdk.common.git_context import GitContext
 from demisto_sdk.common.tools import print_error, get_latest_release_notes_text, \
     get_release_notes_file_path
 
@@ -16,14 +16,16 @@ class ReleaseNotesValidator:
         release_notes_path (str): the path to the changelog file of the examined file.
         latest_release_notes (str): the text of the UNRELEASED section in the changelog file.
         master_diff (str): the changes in the changelog file compared to origin/master.
+        git_context (GitContext): the git queries of the run.
     """
     COMMENT_FILLER_REGEX = r'- ?$'
     SINGLE_LINE_REAL_COMMENT_REGEX = r'[a-zA-Z0-9].*\.$'
     MULTI_LINE_REAL_COMMENT_REGEX = r'(\t+| {2,4})- .*\.$'
     LINK_TO_RELEASE_NOTES_STANDARD = 'https://github.com/demisto/content/blob/master/docs/release_notes/README.md'
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, git_context=None):
         self.file_path = file_path
+        self.git_context = git_context or GitContext()
         self.release_notes_path = get_release_notes_file_path(self.file_path)
         self.latest_release_notes = get_latest_release_notes_text(self.release_notes_path)
         self.master_diff = self.get_master_diff()
@@ -38,8 +40,7 @@ class ReleaseNotesValidator:
         Returns:
             str. empty string if no changes made or no origin/master branch, otherwise full difference context.
         """
-        return run_command(F'git diff --unified=100 '
-                           F'origin/master {self.release_notes_path}')  # type: str
+        return self.git_context.get_file_diff(self.release_notes_path, 'origin/master', unified=100)
 
     def is_release_notes_changed(self):
         """Validates that a new comment was added to release notes.
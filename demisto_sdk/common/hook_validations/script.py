@@ -1,3 +1,5 @@
+from typing import Optional
+
 from demisto_sdk.common.constants import PYTHON_SUBTYPES, Errors
 from demisto_sdk.common.hook_validations.base_validator import BaseValidator
 from demisto_sdk.common.tools import print_error, server_version_compare, get_dockerimage45
@@ -25,8 +27,8 @@ class ScriptValidator(BaseValidator):
                 return False
         return True
 
-    def is_backward_compatible(self):
-        # type: () -> bool
+    def is_backward_compatible(self, validate_docker=True):
+        # type: (bool) -> bool
         """Check if the script is backward compatible."""
         if not self.old_file:
             return True
@@ -38,8 +40,9 @@ class ScriptValidator(BaseValidator):
             self.is_arg_changed(),
             self.is_there_duplicates_args(),
             self.is_changed_subtype(),
-            self.is_docker_image_valid()
         ]
+        if validate_docker:
+            is_breaking_backwards.append(self.is_docker_image_valid())
 
         # Add sane-doc-report exception
         # Sane-doc-report uses docker and every fix/change requires a docker tag change,
@@ -162,9 +165,10 @@ class ScriptValidator(BaseValidator):
             """
         return super(ScriptValidator, self)._is_id_equals_name('script')
 
-    def is_docker_image_valid(self):
-        # type: () -> bool
-        docker_image_validator = DockerImageValidator(self.file_path, is_modified_file=True, is_integration=False)
+    def is_docker_image_valid(self, docker_image_validator=None):
+        # type: (Optional[DockerImageValidator]) -> bool
+        docker_image_validator = docker_image_validator or DockerImageValidator(
+            self.structure_validator.entity, is_modified_file=True, is_integration=False)
         if not docker_image_validator.is_docker_image_valid():
             return True
         return False
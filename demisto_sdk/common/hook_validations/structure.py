@@ -4,16 +4,20 @@ Module contains validation of schemas, ids and paths.
 """
 import json
 import os
-import re
-from typing import Optional
+from typing import Any, Optional, Union
 
-import yaml
-from pykwalify.core import Core
-
-from demisto_sdk.common.constants import Errors, ACCEPTED_FILE_EXTENSIONS, FILE_TYPES_PATHS_TO_VALIDATE, \
-    SCHEMA_TO_REGEX, REPUTATION_REGEX
-from demisto_sdk.common.tools import get_remote_file, get_matching_regex, print_error
+from demisto_sdk.common.constants import Errors, ACCEPTED_FILE_EXTENSIONS, SCHEMA_TO_REGEX
+from demisto_sdk.common.tools import print_error
 from demisto_sdk.common.configuration import Configuration
+from demisto_sdk.common.content_entity import ContentEntity, get_content_entity
+from demisto_sdk.common.git_context import GitContext
+from demisto_sdk.common.old_file_provider import OldFileProvider, RemoteOldFileProvider
+from demisto_sdk.common.parse_cache import parsed_file_cache
+from demisto_sdk.common.path_classifier import path_classifier
+from demisto_sdk.common import yaml_backend
+
+# Marks an old file that was not loaded yet
+_NOT_LOADED = object()
 
 
 class StructureValidator:
@@ -21,29 +25,56 @@ class StructureValidator:
 
         Attributes:
             file_path (str): the path to the file we are examining at the moment.
+            entity (ContentEntity): the content entity of the file, shared with the other validators of the file.
             is_valid (bool): the attribute which saves the valid/in-valid status of the current file. will be bool only
                              after running is_file_valid.
             scheme_name (str): Name of the yaml scheme need to validate.
             file_type (str): equal to scheme_name if there's a scheme.
             current_file (dict): loaded json.
-            old_file: (dict) loaded file from git.
+            old_file: (dict) loaded file from git, loaded on first access.
+            old_file_path (str): the path of the file in the old version, if it was renamed.
+            old_file_provider (OldFileProvider): gets the old version of the file.
+            git_context (GitContext): the git queries of the run, None if the file is not validated against git.
         """
     SCHEMAS_PATH = "schemas"
 
     FILE_SUFFIX_TO_LOAD_FUNCTION = {
-        '.yml': yaml.safe_load,
+        '.yml': yaml_backend.safe_load,
         '.json': json.load,
     }
 
-    def __init__(self, file_path, old_file_path=None, predefined_scheme=None, configuration=Configuration()):
-        # type: (str, Optional[str], Optional[str], Configuration) -> None
+    def __init__(self,
+                 file_path,  # type: Union[str, ContentEntity]
+                 old_file_path=None,  # type: Optional[str]
+                 predefined_scheme=None,  # type: Optional[str]
+                 configuration=None,  # type: Optional[Configuration]
+                 git_context=None,  # type: Optional[GitContext]
+                 old_file_provider=None,  # type: Optional[OldFileProvider]
+                 ):
+        # type: (...) -> None
         self.is_valid = True
-        self.file_path = file_path
+        self.entity = get_content_entity(file_path)
+        self.file_path = self.entity.path
         self.scheme_name = predefined_scheme or self.scheme_of_file_by_path()
         self.file_type = self.get_file_type()
         self.current_file = self.load_data_from_file()
-        self.old_file = get_remote_file(old_file_path) if old_file_path else get_remote_file(file_path)
-        self.configuration = configuration
+        self.old_file_path = old_file_path
+        self.old_file_provider = old_file_provider or RemoteOldFileProvider()
+        self._old_file = _NOT_LOADED  # type: Any
+        self.configuration = configuration or Configuration()
+        self.git_context = git_context
+
+    @property
+    def old_file(self):
+        # type: () -> dict
+        if self._old_file is _NOT_LOADED:
+            self._old_file = self.old_file_provider.get_old_file(self.old_file_path or self.file_path)
+        return self._old_file
+
+    @old_file.setter
+    def old_file(self, old_file):
+        # type: (Optional[dict]) -> None
+        self._old_file = old_file
 
     def is_valid_file(self):
         # type: () -> bool
@@ -71,13 +102,9 @@ class StructureValidator:
         Returns:
             (str): Type of file by scheme name
         """
-
-        for scheme_name, regex_list in SCHEMA_TO_REGEX.items():
-            if get_matching_regex(self.file_path, regex_list):
-                return scheme_name
-
-        if get_matching_regex(self.file_path, [REPUTATION_REGEX]):
-            return 'reputation'
+        scheme_name = path_classifier.classify(self.file_path).schema
+        if scheme_name:
+            return scheme_name
 
         pretty_formated_string_of_regexes = json.dumps(SCHEMA_TO_REGEX, indent=4, sort_keys=True)
 
@@ -94,12 +121,18 @@ class StructureValidator:
         """
         if self.scheme_name in [None, 'reputation', 'image']:
             return True
+        from demisto_sdk.common.schema_validator import get_schema_validator
+        schema_validator = get_schema_validator(self.scheme_name)
+        file_extension = os.path.splitext(self.file_path)[1]
         try:
-            path = os.path.normpath(
-                os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(self.scheme_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
-            core.validate(raise_exception=True)
+            if file_extension == '.yml':
+                # pykwalify loads yml files by the YAML 1.2 rules, where yes/no/on/off are strings and a duplicate key
+                # is an error, so they are loaded (once) by the same rules
+                schema_validator.validate(parsed_file_cache.get_or_load(self.file_path, yaml_backend.safe_load_yaml12))
+            elif file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
+                schema_validator.validate(self.current_file)
+            else:
+                schema_validator.validate(file_path=self.file_path)
         except Exception as err:
             print_error('Failed: {} failed.\n{}'.format(self.file_path, str(err)))
             self.is_valid = False
@@ -187,7 +220,7 @@ class StructureValidator:
 
     def load_data_from_file(self):
         # type: () -> dict
-        """Loads data according to function defined in FILE_SUFFIX_TO_LOAD_FUNCTION
+        """Loads data according to function defined in FILE_SUFFIX_TO_LOAD_FUNCTION, using the parsed files cache.
         Returns:
              (dict)
         """
@@ -195,9 +228,7 @@ class StructureValidator:
         if file_extension in ACCEPTED_FILE_EXTENSIONS:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
                 load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
-                with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
-                    return loaded_file_data
+                return parsed_file_cache.get_or_load(self.file_path, load_function)
 
             # Ignore loading image
             elif file_extension == '.png':
@@ -217,11 +248,7 @@ class StructureValidator:
         if self.scheme_name:
             return self.scheme_name
 
-        for file_type, regexes in FILE_TYPES_PATHS_TO_VALIDATE.items():
-            for regex in regexes:
-                if re.search(regex, self.file_path, re.IGNORECASE):
-                    return file_type
-        return None
+        return path_classifier.classify(self.file_path).file_type
 
     def is_valid_file_path(self):
         """Returns is valid filepath exists.
@@ -0,0 +1,127 @@
+"""Index of a section of the id_set (scripts, playbooks, integrations or test playbooks) by the ids of its objects.
+
+A section of the id_set is a list of {id: data} instances, and the same id may appear in several instances, each for
+a different version range (fromversion - toversion). Looking up an id used to scan the whole section and parse the
+versions of every instance again. IdSetIndex is built once when the id_set is loaded: it maps every id to its entries,
+sorted by their version ranges, with the versions parsed into integer tuples. Looking up an id costs O(1), and the
+entries of an id whose version range overlaps a given range are found by a binary search.
+
+The entries keep the instances of the section, so replacing the data of an instance in place keeps the index valid as
+long as its version range is the same, otherwise it should be replaced through the index. New instances should be
+added through the index, which appends them to the section too.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple  # noqa: F401
+
+DEFAULT_FROM_VERSION = '0.0.0'
+DEFAULT_TO_VERSION = '99.99.99'
+# Greater than every part of a parsed version
+INFINITY = float('inf')
+
+
+@lru_cache(maxsize=1024)
+def parse_version(version):
+    # type: (str) -> Tuple[int, ...]
+    """Parses a version, e.g. 4.5.0, into a tuple of integers which compares like the version.
+
+    The versions are cached, an id_set has thousands of instances but few distinct versions.
+    """
+    return tuple(int(part) for part in re.findall(r'\d+', str(version)))
+
+
+def get_version_range(data):
+    # type: (dict) -> Tuple[Tuple[int, ...], Tuple[int, ...]]
+    """Gets the parsed fromversion and toversion of the data of an id_set instance."""
+    return (parse_version(data.get('fromversion', DEFAULT_FROM_VERSION)),
+            parse_version(data.get('toversion', DEFAULT_TO_VERSION)))
+
+
+class IdSetEntry(namedtuple('IdSetEntry', ['obj_id', 'from_version', 'to_version', 'instance'])):
+    """An instance of an id_set section, with its parsed version range."""
+
+    @property
+    def data(self):
+        # type: () -> dict
+        return self.instance[self.obj_id]
+
+
+class IdSetIndex:
+    """The instances of an id_set section by their ids, sorted by their version ranges.
+
+    Attributes:
+        instances (list): the instances of the section, which the index keeps up to date.
+    """
+
+    def __init__(self, instances=None):
+        # type: (Optional[list]) -> None
+        self.instances = instances if instances is not None else []
+        self._entries = {}  # type: Dict[str, List[IdSetEntry]]
+        # The version ranges of the entries of every id, for the binary searches
+        self._version_ranges = {}  # type: Dict[str, List[Tuple[Tuple[int, ...], Tuple[int, ...]]]]
+        for instance in self.instances:
+            self._index(instance)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def _index(self, instance):
+        # type: (dict) -> IdSetEntry
+        obj_id = next(iter(instance))
+        from_version, to_version = get_version_range(instance[obj_id])
+        entry = IdSetEntry(obj_id, from_version, to_version, instance)
+
+        version_ranges = self._version_ranges.setdefault(obj_id, [])
+        position = bisect_right(version_ranges, (from_version, to_version))
+        version_ranges.insert(position, (from_version, to_version))
+        self._entries.setdefault(obj_id, []).insert(position, entry)
+        return entry
+
+    def add(self, instance):
+        # type: (dict) -> IdSetEntry
+        """Adds an instance to the section and to the index."""
+        self.instances.append(instance)
+        return self._index(instance)
+
+    def update(self, entry, data):
+        # type: (IdSetEntry, dict) -> IdSetEntry
+        """Replaces the data of an instance in place, and moves its entry to the version range of the new data."""
+        entries = self._entries[entry.obj_id]
+        position = next(index for index, other in enumerate(entries) if other.instance is entry.instance)
+        del entries[position]
+        del self._version_ranges[entry.obj_id][position]
+        entry.instance[entry.obj_id] = data
+        return self._index(entry.instance)
+
+    def get_entries(self, obj_id):
+        # type: (str) -> List[IdSetEntry]
+        """Gets the entries of an id, sorted by their version ranges."""
+        return self._entries.get(obj_id, [])
+
+    def find(self, obj_id, from_version, to_version):
+        # type: (str, Tuple[int, ...], Tuple[int, ...]) -> List[IdSetEntry]
+        """Gets the entries of an id with exactly the given version range."""
+        version_ranges = self._version_ranges.get(obj_id, [])
+        start = bisect_left(version_ranges, (from_version, to_version))
+        end = bisect_right(version_ranges, (from_version, to_version))
+        return self._entries[obj_id][start:end] if end > start else []
+
+    def find_overlapping(self, obj_id, from_version, to_version=None):
+        # type: (str, Tuple[int, ...], Optional[Tuple[int, ...]]) -> List[IdSetEntry]
+        """Gets the entries of an id whose version range overlaps the given one, edges included.
+
+        The entries that start after the given range are cut off by a binary search.
+
+        Args:
+            obj_id (str): the id.
+            from_version (tuple): the parsed start of the range.
+            to_version (tuple): the parsed end of the range, None if the range has no end.
+        """
+        version_ranges = self._version_ranges.get(obj_id, [])
+        end = len(version_ranges) if to_version is None else bisect_right(version_ranges, (to_version, (INFINITY,)))
+        return [entry for entry in self._entries[obj_id][:end] if entry.to_version >= from_version] if end else []
@@ -0,0 +1,150 @@
+"""Providers of the old version of content files, for the backward compatibility checks.
+
+The old version of a file used to be fetched from GitHub over HTTPS, one request per validated file, even for files
+that were just added. GitOldFileProvider reads it from the local repository instead - the tree of the compared
+revision is resolved once and the blobs of all the files are streamed through a single long-lived
+`git cat-file --batch` process. The GitHub fetch (RemoteFileFetcher) is kept for repositories in which the revision
+is not available (e.g. shallow clones).
+"""
+import json
+import os
+from abc import abstractmethod
+from typing import Dict, Iterable, Optional
+
+from demisto_sdk.common import yaml_backend
+from demisto_sdk.common.git_context import BlobReader, GitContext
+from demisto_sdk.common.remote_file_fetcher import remote_file_fetcher
+from demisto_sdk.common.tools import get_remote_file, print_warning
+
+
+class OldFileProvider:
+    """Gets the old version of content files."""
+
+    @abstractmethod
+    def get_old_file(self, file_path):
+        # type: (str) -> dict
+        """Gets the old version of a file.
+
+        Args:
+            file_path (str): the path of the file in the repository.
+
+        Returns:
+            dict. The parsed old file, empty if the file has no old version.
+        """
+        pass
+
+    def prefetch(self, file_paths):
+        # type: (Iterable[str]) -> None
+        """Prepares the old version of files which are about to be requested."""
+        pass
+
+    def close(self):
+        # type: () -> None
+        pass
+
+
+class RemoteOldFileProvider(OldFileProvider):
+    """Fetches the old version of files from the content repository on GitHub.
+
+    Attributes:
+        tag (str): the branch or tag to fetch the files from.
+    """
+
+    def __init__(self, tag='master'):
+        # type: (str) -> None
+        self.tag = tag
+
+    def get_old_file(self, file_path):
+        # type: (str) -> dict
+        return get_remote_file(file_path, self.tag)
+
+    def prefetch(self, file_paths):
+        # type: (Iterable[str]) -> None
+        remote_file_fetcher.prefetch(file_paths, self.tag)
+
+
+class GitOldFileProvider(OldFileProvider):
+    """Reads the old version of files from the local git object store.
+
+    Nothing is run until the first file is requested. If the revision does not exist locally, the files are fetched
+    with the fallback provider.
+
+    Attributes:
+        rev (str): the revision to read the files from.
+        git_context (GitContext): the git queries of the run.
+        fallback (OldFileProvider): the provider used if the revision is not available locally.
+    """
+
+    def __init__(self, rev='origin/master', git_context=None, fallback=None):
+        # type: (str, Optional[GitContext], Optional[OldFileProvider]) -> None
+        self.rev = rev
+        self.git_context = git_context or GitContext()
+        self.fallback = fallback or RemoteOldFileProvider(rev)
+        self._tree = None  # type: Optional[str]
+        # A copy of the provider, e.g. in a worker process of a parallel validation, starts its own process
+        self._blob_reader = BlobReader(self.git_context)
+        self._old_files = {}  # type: Dict[str, dict]
+
+    @property
+    def tree(self):
+        # type: () -> str
+        """The SHA of the tree of the revision, empty if the revision does not exist locally."""
+        if self._tree is None:
+            try:
+                self._tree = self.git_context.run('rev-parse', '-q', '--verify', self.rev + '^{tree}',
+                                                  exit_on_error=False).strip()
+            except RuntimeError:
+                self._tree = ''
+            if not self._tree:
+                print_warning('Could not find {} in the local repository, old files will be fetched from the '
+                              'remote repository.'.format(self.rev))
+
+        return self._tree
+
+    def get_old_file(self, file_path):
+        # type: (str) -> dict
+        file_path = os.path.normpath(file_path)
+        if file_path not in self._old_files:
+            if not self.tree:
+                self._old_files[file_path] = self.fallback.get_old_file(file_path)
+            else:
+                self._old_files[file_path] = self._load_old_file(file_path)
+
+        return self._old_files[file_path]
+
+    def prefetch(self, file_paths):
+        # type: (Iterable[str]) -> None
+        # Local blobs are read fast enough on demand
+        if not self.tree:
+            self.fallback.prefetch(file_paths)
+
+    def _load_old_file(self, file_path):
+        # type: (str) -> dict
+        content = self.read_blob('{}:{}'.format(self.tree, file_path))
+        if content is None:
+            # The file did not exist in the old revision
+            return {}
+
+        try:
+            if file_path.endswith('.json'):
+                return json.loads(content.decode('utf-8'))
+            return yaml_backend.safe_load(content) or {}
+        except Exception as exc:
+            print_warning('Could not parse the old version of {} from {}. Reason: {}'.format(file_path, self.rev, exc))
+            return {}
+
+    def read_blob(self, object_name):
+        # type: (str) -> Optional[bytes]
+        """Reads an object through the `git cat-file --batch` process.
+
+        Args:
+            object_name (str): the name of the object, e.g. <tree>:<path>.
+
+        Returns:
+            bytes. The content of the object, None if it does not exist.
+        """
+        return self._blob_reader.read(object_name)
+
+    def close(self):
+        # type: () -> None
+        self._blob_reader.close()
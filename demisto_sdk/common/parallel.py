@@ -0,0 +1,87 @@
+"""Running the tasks of a command in worker processes, with the output of a serial run.
+
+run_in_workers runs tasks in a pool of worker processes, each of which creates its own worker object (e.g. a
+validator) once. The output that every task prints is captured in the worker and printed by the parent process in
+the order of the tasks, and an error raised by a task is raised after the output of the tasks that precede it, as if
+the tasks were run one after the other.
+"""
+import io
+import pickle
+import sys
+from collections import namedtuple
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from typing import Any, Callable, Iterator, List  # noqa: F401
+
+# The number of chunks every worker gets, a few so slow tasks are balanced between the workers
+CHUNKS_PER_JOB = 4
+
+TaskResult = namedtuple('TaskResult', ['value', 'output', 'exception'])
+
+# The worker object and the task function of a worker process
+_worker = None
+_worker_task = None  # type: Any
+
+
+def run_in_workers(tasks, processes, create_worker, worker_args, run_task):
+    # type: (List[Any], int, Callable, tuple, Callable) -> Iterator[Any]
+    """Runs tasks in worker processes.
+
+    Args:
+        tasks (list): the tasks, which are pickled to the workers.
+        processes (int): the maximal number of worker processes.
+        create_worker (Callable): a module level function, which gets worker_args and creates the worker object of a
+            worker process.
+        worker_args (tuple): the arguments of create_worker. They are pickled by the parent process, so every worker
+            gets its own copy of them whichever way it was started.
+        run_task (Callable): a module level function, which gets the worker object and a task and runs the task.
+
+    Yields:
+        The values run_task returned, in the order of the tasks.
+
+    Raises:
+        The error raised by the first task which failed, after the output of the tasks that precede it.
+    """
+    processes = min(processes, len(tasks))
+    chunksize = max(1, len(tasks) // (processes * CHUNKS_PER_JOB))
+    initargs = (create_worker, pickle.dumps(worker_args), run_task)
+    with Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+        for result in pool.imap(_run_task, tasks, chunksize):
+            sys.stdout.write(result.output)
+            if result.exception is not None:
+                sys.stdout.flush()
+                raise result.exception
+            yield result.value
+
+
+def _init_worker(create_worker, worker_args, run_task):
+    """Creates the worker object of a worker process.
+
+    Args:
+        create_worker (Callable): the function which creates the worker object.
+        worker_args (bytes): the pickled arguments of create_worker.
+        run_task (Callable): the function which runs a task.
+    """
+    global _worker, _worker_task
+    _worker = create_worker(*pickle.loads(worker_args))
+    _worker_task = run_task
+
+
+def _run_task(task):
+    """Runs a task in a worker process.
+
+    Args:
+        task: the task.
+
+    Returns:
+        TaskResult. The value the task returned, its output and the error it raised.
+    """
+    output = io.StringIO()
+    value = None
+    exception = None
+    with redirect_stdout(output):
+        try:
+            value = _worker_task(_worker, task)
+        except (Exception, SystemExit) as exc:
+            exception = exc
+    return TaskResult(value, output.getvalue(), exception)
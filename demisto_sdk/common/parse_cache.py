@@ -0,0 +1,383 @@
+"""Process wide cache of parsed content files.
+
+A single run of the SDK loads the same yml/json file from several places (the structure validator, the image and
+description validators, the docker validator, the id_set helpers...). Parsing a big unified integration takes tens of
+milliseconds, so the parsed data is kept in memory and handed out again as long as the file was not changed on disk.
+
+The CLI also turns on a persistent layer (DiskParseCache) keyed by the content of the file, so back to back runs on the
+same checkout (e.g. pre-commit hooks running validate and secrets) do not parse unchanged files again.
+
+The SDK validates and scans files it does not trust, so the persistent cache is kept out of the content repository (in
+the user cache directory by default), its entries are JSON rather than pickles, and a cache directory that git tracks
+is not used at all.
+"""
+import base64
+import copy
+import datetime
+import hashlib
+import io
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def get_default_cache_dir():
+    # type: () -> str
+    """Gets the default cache directory, demisto-sdk under the user cache directory."""
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home and os.name == 'nt':
+        cache_home = os.environ.get('LOCALAPPDATA')
+    return os.path.join(cache_home or os.path.join(os.path.expanduser('~'), '.cache'), 'demisto-sdk')
+
+
+DEFAULT_CACHE_DIR = get_default_cache_dir()
+# Bump when the layout of the cached entries changes
+CACHE_FORMAT_VERSION = '2'
+ENTRY_EXTENSION = '.json'
+# The key of the JSON objects which encode the values JSON has no type for
+TYPE_KEY = '__type__'
+
+
+def encode_entry(data):
+    # type: (Any) -> Any
+    """Encodes data as JSON types, the values JSON has no type for (tuples, bytes, dates, mappings with non string
+    keys) as objects tagged with their type.
+
+    Raises:
+        TypeError: if the data has a value of any other type.
+    """
+    if data is None or isinstance(data, (str, int, float)):
+        return data
+    if isinstance(data, list):
+        return [encode_entry(item) for item in data]
+    if isinstance(data, dict):
+        if TYPE_KEY not in data and all(isinstance(key, str) for key in data):
+            return {key: encode_entry(value) for key, value in data.items()}
+        return {TYPE_KEY: 'dict', 'value': [[encode_entry(key), encode_entry(value)] for key, value in data.items()]}
+    if isinstance(data, tuple):
+        return {TYPE_KEY: 'tuple', 'value': [encode_entry(item) for item in data]}
+    if isinstance(data, bytes):
+        return {TYPE_KEY: 'bytes', 'value': base64.b64encode(data).decode('ascii')}
+    if isinstance(data, datetime.datetime):
+        return {TYPE_KEY: 'datetime', 'value': data.isoformat()}
+    if isinstance(data, datetime.date):
+        return {TYPE_KEY: 'date', 'value': data.isoformat()}
+    raise TypeError('{} can not be cached'.format(type(data).__name__))
+
+
+def decode_entry_object(json_object):
+    # type: (dict) -> Any
+    """Decodes a JSON object of an entry, the inverse of encode_entry."""
+    type_name = json_object.get(TYPE_KEY)
+    if type_name is None:
+        return json_object
+    value = json_object['value']
+    if type_name == 'dict':
+        return {key: item for key, item in value}
+    if type_name == 'tuple':
+        return tuple(value)
+    if type_name == 'bytes':
+        return base64.b64decode(value)
+    if type_name == 'datetime':
+        return datetime.datetime.fromisoformat(value)
+    if type_name == 'date':
+        return datetime.date.fromisoformat(value)
+    raise ValueError('unknown entry type {}'.format(type_name))
+
+
+def is_tracked_by_git(directory):
+    # type: (str) -> bool
+    """Checks whether git tracks any file under the directory, e.g. a cache directory committed to the repository."""
+    if not os.path.isdir(directory):
+        return False
+    try:
+        output = subprocess.run(['git', 'ls-files', '--', '.'], cwd=directory, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL).stdout
+    except OSError:
+        return False
+    return bool(output.strip())
+
+
+_usable_cache_dirs = {}  # type: Dict[str, bool]
+_usable_cache_dirs_lock = threading.Lock()
+
+
+def is_usable_cache_dir(cache_dir):
+    # type: (str) -> bool
+    """Checks whether a cache directory may be used, i.e. git does not track it.
+
+    The entries of a committed cache directory come from the repository, so they are not trusted. The directory is
+    checked the first time a cache uses it rather than on every invocation of the CLI, and the answer is kept for the
+    rest of the run.
+    """
+    real_path = os.path.realpath(cache_dir)
+    with _usable_cache_dirs_lock:
+        if real_path not in _usable_cache_dirs:
+            is_usable = not is_tracked_by_git(real_path)
+            if not is_usable:
+                from demisto_sdk.common.tools import print_warning
+                print_warning('The cache directory {} is tracked by git, the cache is disabled.'.format(cache_dir))
+            _usable_cache_dirs[real_path] = is_usable
+        return _usable_cache_dirs[real_path]
+
+
+def get_sdk_version():
+    # type: () -> str
+    """Gets the installed demisto-sdk version, without importing pkg_resources when possible (it is slow to import)."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # python 3.7
+        from pkg_resources import get_distribution, DistributionNotFound
+        try:
+            return get_distribution('demisto-sdk').version
+        except DistributionNotFound:
+            return 'unknown'
+
+    try:
+        return version('demisto-sdk')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+class DiskParseCache:
+    """Persistent cache of parsed files shared between SDK invocations.
+
+    Entries are JSON files stored under <cache_dir>/parsed/ and keyed by the sha256 of the file content, the function
+    used to parse it and the SDK version, so editing a file, changing the parser or upgrading the SDK never serves
+    stale data. Entries are written to a temporary file and atomically renamed into place, so parallel workers and
+    concurrent runs only ever see complete entries - an unreadable entry is treated as a miss. A cache directory that
+    git tracks is not read or written.
+
+    Attributes:
+        cache_dir (str): root directory of the cache.
+        hits (int): number of lookups served from disk.
+        misses (int): number of lookups that were not found on disk.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, sdk_version=None):
+        # type: (str, Optional[str]) -> None
+        self.cache_dir = cache_dir
+        self.sdk_version = sdk_version or get_sdk_version()
+        self.hits = 0
+        self.misses = 0
+        self._entries_dir = os.path.join(cache_dir, 'parsed')
+
+    @staticmethod
+    def get_load_function_name(load_function):
+        # type: (Callable) -> Optional[str]
+        """Returns a stable name of load_function, or None if it has none (lambdas, nested functions)."""
+        qualified_name = getattr(load_function, '__qualname__', '')
+        if not qualified_name or '<' in qualified_name:
+            return None
+        return '{}.{}'.format(getattr(load_function, '__module__', ''), qualified_name)
+
+    def get_entry_path(self, content, load_function_name):
+        # type: (bytes, str) -> str
+        digest = hashlib.sha256()
+        for part in (CACHE_FORMAT_VERSION, self.sdk_version, load_function_name):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(content)
+        entry_key = digest.hexdigest()
+        return os.path.join(self._entries_dir, entry_key[:2], entry_key + ENTRY_EXTENSION)
+
+    def get(self, entry_path):
+        # type: (str) -> Tuple[bool, Any]
+        """Reads an entry.
+
+        Returns:
+            (bool, Any). Whether the entry was found and its data.
+        """
+        if not self.is_usable():
+            self.misses += 1
+            return False, None
+
+        try:
+            with io.open(entry_path, encoding='utf-8') as entry_file:
+                data = json.load(entry_file, object_hook=decode_entry_object)
+        except Exception:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        return True, data
+
+    def is_usable(self):
+        # type: () -> bool
+        return is_usable_cache_dir(self.cache_dir)
+
+    def create_cache_dir(self):
+        # type: () -> None
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # a cache directory inside a repository is not committed
+            with open(os.path.join(self.cache_dir, '.gitignore'), 'w') as gitignore_file:
+                gitignore_file.write('*\n')
+
+    def set(self, entry_path, data):
+        # type: (str, Any) -> None
+        """Atomically writes an entry, silently giving up if the cache directory is not writable."""
+        if not self.is_usable():
+            return
+
+        entry_dir = os.path.dirname(entry_path)
+        temp_path = None
+        try:
+            entry = json.dumps(encode_entry(data), separators=(',', ':'))
+            self.create_cache_dir()
+            os.makedirs(entry_dir, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix='.tmp')
+            with io.open(temp_fd, 'w', encoding='utf-8') as temp_file:
+                temp_file.write(entry)
+            os.replace(temp_path, entry_path)
+        except Exception:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def load(self, file_path, load_function):
+        # type: (str, Callable) -> Any
+        """Returns the parsed content of file_path, from disk if it was already parsed by an earlier run."""
+        with open(file_path, 'r') as file_obj:
+            text = file_obj.read()
+
+        text_file = io.StringIO(text)
+        # the errors of the parsers refer to the file by its name
+        text_file.name = file_path  # type: ignore
+        load_function_name = self.get_load_function_name(load_function)
+        if load_function_name is None:
+            return load_function(text_file)
+
+        entry_path = self.get_entry_path(text.encode('utf-8'), load_function_name)
+        found, data = self.get(entry_path)
+        if not found:
+            data = load_function(text_file)
+            self.set(entry_path, data)
+
+        return data
+
+
+class ParsedFileCache:
+    """LRU cache of parsed files keyed by (realpath, mtime_ns, size) and the function used to parse them.
+
+    Every lookup returns a private deep copy of the cached data, so callers are free to mutate what they get without
+    affecting other callers. Copying parsed data is two orders of magnitude cheaper than parsing it again.
+
+    Attributes:
+        max_bytes (int): memory cap of the cache, measured by the size of the source files it holds.
+        hits (int): number of lookups served from the cache.
+        misses (int): number of lookups that had to parse the file.
+    """
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB of source files
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.disk_cache = None  # type: Optional[DiskParseCache]
+
+    def enable_disk_cache(self, cache_dir=DEFAULT_CACHE_DIR):
+        # type: (str) -> None
+        """Backs the in-memory cache with a persistent cache under cache_dir."""
+        self.disk_cache = DiskParseCache(cache_dir)
+
+    def disable_disk_cache(self):
+        # type: () -> None
+        self.disk_cache = None
+
+    @staticmethod
+    def get_file_key(file_path):
+        # type: (str) -> Tuple[str, int, int]
+        """Gets the cache key of a file.
+
+        Raises:
+            OSError: if the file does not exist.
+        """
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        return real_path, stat.st_mtime_ns, stat.st_size
+
+    def get_or_load(self, file_path, load_function):
+        # type: (str, Callable) -> Any
+        """Returns the parsed content of file_path, parsing it with load_function only if it is not cached.
+
+        Args:
+            file_path (str): path to the file.
+            load_function (Callable): function that gets an open file object and returns the parsed data.
+
+        Returns:
+            A copy of the parsed data.
+        """
+        key = self.get_file_key(file_path)
+        # a file may be parsed by several functions, e.g. by the YAML 1.1 and 1.2 rules
+        entry_key = (key[0], load_function)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                self._entries.move_to_end(entry_key)
+                return copy.deepcopy(entry[2])
+
+        if self.disk_cache is not None:
+            data = self.disk_cache.load(file_path, load_function)
+        else:
+            with open(file_path, 'r') as file_obj:
+                data = load_function(file_obj)
+
+        with self._lock:
+            self.misses += 1
+            # the data of a file which is too large to be kept is not copied
+            self._store(key, load_function, copy.deepcopy(data) if key[2] <= self.max_bytes else None)
+
+        return data
+
+    def _store(self, key, load_function, data):
+        entry_key = (key[0], load_function)
+        old_entry = self._entries.pop(entry_key, None)
+        if old_entry is not None:
+            self._current_bytes -= old_entry[0][2]
+
+        size = key[2]
+        if size > self.max_bytes:
+            return
+
+        self._entries[entry_key] = (key, load_function, data)
+        self._current_bytes += size
+        while self._current_bytes > self.max_bytes:
+            _, (evicted_key, _, _) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_key[2]
+
+    def invalidate(self, file_path):
+        # type: (str) -> None
+        """Removes a single file from the cache, as parsed by every function."""
+        real_path = os.path.realpath(file_path)
+        with self._lock:
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == real_path]:
+                self._current_bytes -= self._entries.pop(entry_key)[0][2]
+
+    def clear(self):
+        # type: () -> None
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        # type: () -> Dict[str, int]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'bytes': self._current_bytes,
+        }
+
+
+parsed_file_cache = ParsedFileCache()
@@ -0,0 +1,160 @@
+"""Classification of content repository paths.
+
+The validators find out what a file is by matching its path against lists of 20-40 regexes (checked_type), and the
+same path is matched against the same lists many times during a single run. PathClassifier compiles every regex list
+once and memoizes the answers per path, and answers "what is this path" (entity type, schema, pack and package) in a
+single pass.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from demisto_sdk.common.constants import SCHEMA_TO_REGEX, FILE_TYPES_PATHS_TO_VALIDATE, REPUTATION_REGEX, \
+    CHECKED_TYPES_REGEXES, YML_ALL_INTEGRATION_REGEXES, YML_ALL_SCRIPTS_REGEXES, YML_ALL_PLAYBOOKS_REGEX, \
+    JSON_ALL_INCIDENT_FIELD_REGEXES, JSON_ALL_INDICATOR_FIELDS_REGEXES, JSON_ALL_INCIDENT_TYPES_REGEXES, \
+    JSON_ALL_LAYOUT_REGEXES, JSON_ALL_WIDGETS_REGEXES, JSON_ALL_DASHBOARDS_REGEXES, JSON_ALL_CLASSIFIER_REGEXES, \
+    JSON_ALL_CONNECTIONS_REGEXES, JSON_ALL_REPORTS_REGEXES, JSON_ALL_MISC_REGEXES, PYTHON_INTEGRATION_REGEXES, \
+    PYTHON_SCRIPT_REGEXES, INTEGRATION_JS_REGEX, PACKS_INTEGRATION_JS_REGEX, SCRIPT_JS_REGEX, PACKS_SCRIPT_JS_REGEX, \
+    IMAGE_REGEX, DESCRIPTION_REGEX, PACKS_DIR, INTEGRATIONS_DIR, SCRIPTS_DIR, BETA_INTEGRATIONS_DIR
+
+# Order matters - the first matching entity type wins
+ENTITY_TYPE_TO_REGEXES = [
+    ('integration', YML_ALL_INTEGRATION_REGEXES + PYTHON_INTEGRATION_REGEXES +
+     [INTEGRATION_JS_REGEX, PACKS_INTEGRATION_JS_REGEX]),
+    ('script', YML_ALL_SCRIPTS_REGEXES + PYTHON_SCRIPT_REGEXES + [SCRIPT_JS_REGEX, PACKS_SCRIPT_JS_REGEX]),
+    ('playbook', YML_ALL_PLAYBOOKS_REGEX),
+    ('incidentfield', JSON_ALL_INCIDENT_FIELD_REGEXES),
+    ('indicatorfield', JSON_ALL_INDICATOR_FIELDS_REGEXES),
+    ('incidenttype', JSON_ALL_INCIDENT_TYPES_REGEXES),
+    ('layout', JSON_ALL_LAYOUT_REGEXES),
+    ('widget', JSON_ALL_WIDGETS_REGEXES),
+    ('dashboard', JSON_ALL_DASHBOARDS_REGEXES),
+    ('classifier', JSON_ALL_CLASSIFIER_REGEXES),
+    ('canvas-context-connections', JSON_ALL_CONNECTIONS_REGEXES),
+    ('report', JSON_ALL_REPORTS_REGEXES),
+    ('reputation', JSON_ALL_MISC_REGEXES + [REPUTATION_REGEX]),
+    ('image', [IMAGE_REGEX]),
+    ('description', [DESCRIPTION_REGEX]),
+]  # type: List[Tuple[str, List[str]]]
+
+PACK_NAME_REGEX = r'^(?:./)?{}/([^/]+)/'.format(PACKS_DIR)
+PACKAGE_ROOT_REGEX = r'^(?:\./)?((?:{}/[^/]+/)?(?:{}|{}|{})/[^/]+)/[^/]+$'.format(
+    PACKS_DIR, INTEGRATIONS_DIR, SCRIPTS_DIR, BETA_INTEGRATIONS_DIR)
+
+PathInfo = namedtuple('PathInfo', ['entity_type', 'schema', 'file_type', 'pack_name', 'package_root'])
+PathInfo.__doc__ = """What a path in the content repository is.
+
+    Attributes:
+        entity_type (str): the type of the content entity the file belongs to, None if unknown.
+        schema (str): name of the schema the file is validated against, None if there is none.
+        file_type (str): the schema, or the validated file type of files with no schema (e.g. reports).
+        pack_name (str): the pack the file is in, None if it is not in a pack.
+        package_root (str): the package directory of integration/script package files, None otherwise.
+    """
+
+
+@lru_cache(maxsize=None)
+def compile_regexes(regexes):
+    # type: (Tuple[str, ...]) -> Tuple[Pattern, ...]
+    """Compiles a tuple of regexes (case insensitive) once."""
+    return tuple(re.compile(regex, re.IGNORECASE) for regex in regexes)
+
+
+@lru_cache(maxsize=256 * 1024)
+def _match(path, regexes):
+    # type: (str, Tuple[str, ...]) -> Optional[str]
+    for regex, compiled_regex in zip(regexes, compile_regexes(regexes)):
+        if compiled_regex.match(path):
+            return regex
+    return None
+
+
+class PathClassifier:
+    """Compiled, memoized classifier of content repository paths.
+
+    Attributes:
+        schema_to_regexes (dict): schema name to the regexes of the files validated with it.
+        file_type_to_regexes (dict): file type to the regexes of files which have no schema.
+        entity_type_to_regexes (list): ordered (entity type, regexes) pairs.
+    """
+
+    def __init__(self, schema_to_regexes=None, file_type_to_regexes=None, entity_type_to_regexes=None):
+        # type: (Optional[Dict[str, List[str]]], Optional[Dict[str, List[str]]], Optional[list]) -> None
+        self.schema_to_regexes = schema_to_regexes if schema_to_regexes is not None else SCHEMA_TO_REGEX
+        self.file_type_to_regexes = file_type_to_regexes if file_type_to_regexes is not None \
+            else FILE_TYPES_PATHS_TO_VALIDATE
+        self.entity_type_to_regexes = entity_type_to_regexes if entity_type_to_regexes is not None \
+            else ENTITY_TYPE_TO_REGEXES
+        self._schemas = self._compile_table(list(self.schema_to_regexes.items()) + [('reputation', [REPUTATION_REGEX])])
+        self._file_types = self._compile_table(self.file_type_to_regexes.items())
+        self._entity_types = self._compile_table(self.entity_type_to_regexes)
+        self._pack_name_regex = re.compile(PACK_NAME_REGEX)
+        self._package_root_regex = re.compile(PACKAGE_ROOT_REGEX, re.IGNORECASE)
+        self._path_infos = {}  # type: Dict[str, PathInfo]
+
+    @staticmethod
+    def _compile_table(table):
+        return [(name, compile_regexes(tuple(regexes))) for name, regexes in table]
+
+    @staticmethod
+    def match(path, regexes):
+        # type: (str, Sequence[str]) -> Optional[str]
+        """Gets the first regex of regexes matching the beginning of path (case insensitive), memoized per path.
+
+        Args:
+            path (str): the path to match.
+            regexes (list): the regexes to match against.
+
+        Returns:
+            str. The matching regex, None if no regex matches.
+        """
+        return _match(path, tuple(regexes))
+
+    def is_checked_type(self, path):
+        # type: (str) -> bool
+        return self.match(path, CHECKED_TYPES_REGEXES) is not None
+
+    def classify(self, path):
+        # type: (str) -> PathInfo
+        """Gets what the path is, computed once per path."""
+        path_info = self._path_infos.get(path)
+        if path_info is None:
+            path_info = self._classify(path)
+            self._path_infos[path] = path_info
+        return path_info
+
+    def _classify(self, path):
+        # type: (str) -> PathInfo
+        schema = self._first_match(self._schemas, path)
+        file_type = schema
+        if not file_type:
+            for name, compiled_regexes in self._file_types:
+                if any(compiled_regex.search(path) for compiled_regex in compiled_regexes):
+                    file_type = name
+                    break
+
+        pack_name_match = self._pack_name_regex.search(path)
+        package_root_match = self._package_root_regex.match(path)
+        return PathInfo(
+            entity_type=self._first_match(self._entity_types, path),
+            schema=schema,
+            file_type=file_type,
+            pack_name=pack_name_match.group(1) if pack_name_match else None,
+            package_root=package_root_match.group(1) if package_root_match else None,
+        )
+
+    @staticmethod
+    def _first_match(table, path):
+        for name, compiled_regexes in table:
+            if any(compiled_regex.match(path) for compiled_regex in compiled_regexes):
+                return name
+        return None
+
+    def clear(self):
+        # type: () -> None
+        self._path_infos.clear()
+        _match.cache_clear()
+
+
+path_classifier = PathClassifier()
@@ -0,0 +1,75 @@
+"""Base of the clients which send many small requests to the same few hosts.
+
+A PooledHttpClient sends all its requests over a single requests session, whose connection pool fits the number of
+concurrent requests, runs a batch of requests in a bounded thread pool before the results are needed, and optionally
+keeps the results on disk.
+
+requests is imported on first use, so importing the modules of the clients is cheap.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional  # noqa: F401
+
+from demisto_sdk.common.parse_cache import DiskParseCache
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class PooledHttpClient:
+    """Sends requests over a pooled session, with an optional disk cache of their results.
+
+    Attributes:
+        max_workers (int): the maximal number of concurrent requests.
+        disk_cache (DiskParseCache): the store of the results, None if they are not kept on disk.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, cache_dir=None):
+        # type: (int, Optional[str]) -> None
+        self.max_workers = max_workers
+        self.disk_cache = None  # type: Optional[DiskParseCache]
+        if cache_dir:
+            self.enable_disk_cache(cache_dir)
+        self._session = None
+        self._lock = threading.Lock()
+
+    def enable_disk_cache(self, cache_dir):
+        # type: (str) -> None
+        self.disk_cache = DiskParseCache(cache_dir)
+
+    def disable_disk_cache(self):
+        # type: () -> None
+        self.disk_cache = None
+
+    @property
+    def session(self):
+        """The requests session of all the requests, its connection pool fits max_workers concurrent requests."""
+        with self._lock:
+            if self._session is None:
+                import requests
+                import urllib3
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+        return self._session
+
+    def run_concurrently(self, function, items):
+        # type: (Callable[[Any], Any], Iterable[Any]) -> None
+        """Calls a function on every item, on up to max_workers items at a time, ignoring its errors.
+
+        The function is expected to keep its results (or errors) where the following lookups of them find them.
+        """
+        items = list(items)
+        if not items:
+            return
+
+        def run(item):
+            try:
+                function(item)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            list(executor.map(run, items))
@@ -0,0 +1,149 @@
+"""Fetching of files from the content repository on GitHub.
+
+When the compared revision is not available locally (e.g. in a shallow clone), the old version of the validated files
+is fetched over HTTPS. RemoteFileFetcher keeps a single pooled session for all the requests, prefetches the files
+of a run concurrently before the validation starts, and keeps the fetched files on disk, keyed by the commit of the tag
+and the path, and revalidated with ETag/If-None-Match so an unchanged file is not downloaded again.
+"""
+import hashlib
+import os
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from demisto_sdk.common.constants import CONTENT_GITHUB_LINK
+from demisto_sdk.common.parse_cache import ENTRY_EXTENSION
+from demisto_sdk.common.pooled_http_client import DEFAULT_MAX_WORKERS, PooledHttpClient
+
+if TYPE_CHECKING:
+    # git_context imports tools, which imports this module
+    from demisto_sdk.common.git_context import GitContext  # noqa: F401
+
+REQUEST_TIMEOUT = 30
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+class RemoteFileFetcher(PooledHttpClient):
+    """Fetches files of the content repository over a pooled session, with an optional disk cache of the files.
+
+    Attributes:
+        base_url (str): the url of the raw files of the repository, followed by /<tag>/<path>.
+        latencies (list): the duration in seconds of every request that was sent.
+    """
+
+    def __init__(self, base_url=CONTENT_GITHUB_LINK, max_workers=DEFAULT_MAX_WORKERS, cache_dir=None, git_context=None):
+        # type: (str, int, Optional[str], Optional[GitContext]) -> None
+        super(RemoteFileFetcher, self).__init__(max_workers, cache_dir)
+        self.base_url = base_url
+        self.latencies = []  # type: List[float]
+        self._git_context = git_context
+        self._files = {}  # type: Dict[Tuple[str, str], bytes]
+        self._tag_commits = {}  # type: Dict[str, str]
+
+    @staticmethod
+    def get_url_tag(tag):
+        # type: (str) -> str
+        # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
+        return tag[len('origin/'):] if tag.startswith('origin/') else tag
+
+    def get_url(self, file_path, tag='master'):
+        # type: (str, str) -> str
+        # The replace in the end is for Windows support
+        return '/'.join([self.base_url, self.get_url_tag(tag), file_path]).replace('\\', '/')
+
+    def get_tag_commit(self, tag):
+        # type: (str) -> str
+        """Gets the commit SHA of the tag in the local repository, the tag itself if it is not available locally."""
+        if tag not in self._tag_commits:
+            from demisto_sdk.common.git_context import GitContext  # noqa: F811
+            git_context = self._git_context or GitContext()
+            url_tag = self.get_url_tag(tag)
+            commit = ''
+            for rev in ('origin/' + url_tag, 'refs/tags/' + url_tag):
+                try:
+                    commit = git_context.run('rev-parse', '-q', '--verify', rev + '^{commit}',
+                                             exit_on_error=False).strip()
+                except RuntimeError:
+                    break
+                if commit:
+                    break
+            self._tag_commits[tag] = commit or tag
+        return self._tag_commits[tag]
+
+    def get_entry_path(self, file_path, tag):
+        # type: (str, str) -> str
+        entry_key = hashlib.sha256('\0'.join([self.disk_cache.sdk_version, self.base_url, self.get_tag_commit(tag),
+                                              file_path]).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_cache.cache_dir, 'remote', entry_key[:2], entry_key + ENTRY_EXTENSION)
+
+    def fetch(self, file_path, tag='master'):
+        # type: (str, str) -> bytes
+        """Gets the content of a file, fetched once per run.
+
+        Args:
+            file_path (str): the path of the file in the repository.
+            tag (str): the branch or tag of the file.
+
+        Returns:
+            bytes. The content of the file.
+
+        Raises:
+            requests.exceptions.RequestException: if the file could not be fetched.
+        """
+        key = (tag, file_path)
+        if key not in self._files:
+            self._files[key] = self._fetch(file_path, tag)
+        return self._files[key]
+
+    def _fetch(self, file_path, tag):
+        # type: (str, str) -> bytes
+        entry_path = None
+        cached = None
+        headers = {}
+        if self.disk_cache is not None:
+            entry_path = self.get_entry_path(file_path, tag)
+            found, cached = self.disk_cache.get(entry_path)
+            if found and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+
+        start_time = time.perf_counter()
+        res = self.session.get(self.get_url(file_path, tag), headers=headers, verify=False, timeout=REQUEST_TIMEOUT)
+        with self._lock:
+            self.latencies.append(time.perf_counter() - start_time)
+
+        if res.status_code == 304 and cached is not None:
+            return cached['content']
+
+        res.raise_for_status()
+        if entry_path and res.headers.get('ETag'):
+            self.disk_cache.set(entry_path, {'etag': res.headers['ETag'], 'content': res.content})
+        return res.content
+
+    def prefetch(self, file_paths, tag='master'):
+        # type: (Iterable[str], str) -> None
+        """Fetches files concurrently, so the following fetches of them are served from memory.
+
+        Errors are ignored, files which could not be fetched are fetched again when they are requested.
+        """
+        file_paths = [file_path for file_path in sorted(set(file_paths)) if (tag, file_path) not in self._files]
+        self.run_concurrently(lambda file_path: self.fetch(file_path, tag), file_paths)
+
+    def get_latency_percentiles(self):
+        # type: () -> Dict[int, float]
+        """Gets the percentiles of the request latencies (nearest rank), in seconds."""
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {}
+        return {percentile: latencies[max(0, -(-percentile * len(latencies) // 100) - 1)]
+                for percentile in LATENCY_PERCENTILES}
+
+    def get_latency_report(self):
+        # type: () -> str
+        percentiles = self.get_latency_percentiles()
+        if not percentiles:
+            return 'No remote files were fetched.'
+        return 'Fetched {} remote files, latency: {}'.format(
+            len(self.latencies),
+            ', '.join('p{}={:.0f}ms'.format(percentile, latency * 1000) for percentile, latency in percentiles.items()))
+
+
+remote_file_fetcher = RemoteFileFetcher()
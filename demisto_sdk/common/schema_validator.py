@@ -0,0 +1,102 @@
+"""Validation of content files against the pykwalify schemas in common/schemas.
+
+Validating a file with pykwalify.core.Core(source_file, schema_files) used to re-read and re-parse both the schema
+and the file (with the pure-Python ruamel loader), and to build the rule tree of the schema again for every file.
+SchemaValidator parses a schema and compiles it into pykwalify rules once per process, and validates the data that
+was already loaded by the caller. The error messages are the ones of pykwalify.
+
+pykwalify is imported by this module, so it should be imported only when files are validated.
+"""
+import os
+from typing import Any, Dict, Optional
+
+import pykwalify
+from pykwalify.compat import yml
+from pykwalify.core import Core
+from pykwalify.errors import CoreError
+from pykwalify.rule import Rule
+
+SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+
+
+class CompiledCore(Core):
+    """A pykwalify Core that validates with an already compiled root rule instead of building it from a schema."""
+
+    def __init__(self, root_rule, partial_schemas, source_file=None, source_data=None):
+        # type: (Rule, Dict[str, Rule], Optional[str], Any) -> None
+        # Core requires a schema, but it is not used - the rules are given
+        super(CompiledCore, self).__init__(source_file=source_file, source_data=source_data, schema_data={})
+        self.compiled_root_rule = root_rule
+        self.partial_schemas = partial_schemas
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # The partial schemas are looked up by name during the validation, and other schemas may use the same names
+        pykwalify.partial_schemas.update(self.partial_schemas)
+        self.root_rule = self.compiled_root_rule
+        self._validate(value, self.root_rule, '', [])
+
+
+class SchemaValidator:
+    """Validates data against a pykwalify schema, which is parsed and compiled on the first validation.
+
+    Attributes:
+        schema_path (str): the path of the schema file.
+    """
+
+    def __init__(self, schema_path):
+        # type: (str) -> None
+        self.schema_path = schema_path
+        self._root_rule = None  # type: Optional[Rule]
+        self._partial_schemas = {}  # type: Dict[str, Rule]
+
+    def compile(self):
+        # type: () -> None
+        """Builds the rules of the schema, the way pykwalify builds them before every validation."""
+        with open(self.schema_path) as schema_file:
+            schema = yml.load(schema_file)
+        if not schema:
+            raise CoreError(u"No data loaded from file : {0}".format(self.schema_path))
+
+        root_schema = {}
+        for key, value in schema.items():
+            if key.startswith('schema;'):
+                self._partial_schemas[key.split(';', 1)[1]] = Rule(schema=value)
+            else:
+                root_schema[key] = value
+        self._root_rule = Rule(schema=root_schema)
+
+    def validate(self, data=None, file_path=None):
+        # type: (Any, Optional[str]) -> None
+        """Validates data against the schema.
+
+        Args:
+            data: the loaded content of the file.
+            file_path (str): the path of a file to load as pykwalify does, used only if no data is given.
+
+        Raises:
+            pykwalify.errors.PyKwalifyException: if the data is invalid, with the error message of pykwalify.
+        """
+        if self._root_rule is None:
+            self.compile()
+
+        if data is None:
+            core = CompiledCore(self._root_rule, self._partial_schemas, source_file=file_path)
+        else:
+            core = CompiledCore(self._root_rule, self._partial_schemas, source_data=data)
+        core.validate(raise_exception=True)
+
+
+_schema_validators = {}  # type: Dict[str, SchemaValidator]
+
+
+def get_schema_validator(schema_name):
+    # type: (str) -> SchemaValidator
+    """Gets the validator of a schema in common/schemas, compiled once per process.
+
+    Args:
+        schema_name (str): the name of the schema, e.g. integration.
+    """
+    if schema_name not in _schema_validators:
+        _schema_validators[schema_name] = SchemaValidator(os.path.join(SCHEMAS_DIR, '{}.yml'.format(schema_name)))
+    return _schema_validators[schema_name]
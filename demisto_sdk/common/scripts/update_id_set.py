@@ -6,15 +6,19 @@ import json
 import re
 from collections import OrderedDict
 from multiprocessing import Pool, cpu_count
-from distutils.version import LooseVersion
 import time
 
 from demisto_sdk.common.constants import INTEGRATION_REGEX, INTEGRATION_YML_REGEX, PACKS_INTEGRATION_YML_REGEX, \
     PACKS_INTEGRATION_REGEX, SCRIPT_REGEX, PACKS_SCRIPT_YML_REGEX, PLAYBOOK_REGEX, TEST_PLAYBOOK_REGEX, \
     PACKS_PLAYBOOK_YML_REGEX, PACKS_TEST_PLAYBOOKS_REGEX, SCRIPTS_REGEX_LIST, BETA_INTEGRATION_REGEX, \
     BETA_PLAYBOOK_REGEX, TEST_SCRIPT_REGEX
-from demisto_sdk.common.tools import get_yaml, get_to_version, get_from_version, collect_ids, \
-    get_script_or_integration_id, LOG_COLORS, print_color, print_error, print_warning, run_command
+from demisto_sdk.common.tools import get_yaml, LOG_COLORS, print_color, print_error, print_warning, run_command, \
+    get_yml_paths_in_dir, check_version_format
+from demisto_sdk.common.content_entity import get_content_entity
+from demisto_sdk.common.git_context import GitContext
+from demisto_sdk.common.id_set_index import IdSetIndex, get_version_range, DEFAULT_FROM_VERSION, DEFAULT_TO_VERSION
+from demisto_sdk.common.parse_cache import parsed_file_cache
+from demisto_sdk.common.path_classifier import path_classifier
 from demisto_sdk.yaml_tools.unifier import Unifier
 
 CHECKED_TYPES_REGEXES = (
@@ -39,12 +43,15 @@ INTEGRATIONS_PATH_LIST = [
     ['Packs', '*', 'Integrations', '*']
 ]
 
+# The sections of the id_set, in the order they are written
+ID_SET_SECTIONS = ('scripts', 'playbooks', 'integrations', 'TestPlaybooks')
+# The number of chunks of paths every worker gets when the id_set is created, a few so the chunks of large entities
+# are balanced between the workers
+ID_SET_CHUNKS_PER_PROCESS = 8
+
 
 def checked_type(file_path, regex_list=CHECKED_TYPES_REGEXES):
-    for regex in regex_list:
-        if re.match(regex, file_path, re.IGNORECASE):
-            return True
-    return False
+    return path_classifier.match(file_path, regex_list) is not None
 
 
 def get_changed_files(files_string):
@@ -127,7 +134,9 @@ def get_commmands_from_playbook(data_dict):
 
 def get_integration_data(file_path):
     integration_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    entity = get_content_entity(file_path)
+    file_path = entity.path
+    data_dictionary = entity.data
     id = data_dictionary.get('commonfields', {}).get('id', '-')
     name = data_dictionary.get('name', '-')
 
@@ -153,7 +162,9 @@ def get_integration_data(file_path):
 
 def get_playbook_data(file_path):
     playbook_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    entity = get_content_entity(file_path)
+    file_path = entity.path
+    data_dictionary = entity.data
     id = data_dictionary.get('id', '-')
     name = data_dictionary.get('name', '-')
 
@@ -184,7 +195,9 @@ def get_playbook_data(file_path):
 
 def get_script_data(file_path, script_code=None):
     script_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    entity = get_content_entity(file_path)
+    file_path = entity.path
+    data_dictionary = entity.data
     id = data_dictionary.get('commonfields', {}).get('id', '-')
     if script_code is None:
         script_code = data_dictionary.get('script', '')
@@ -230,51 +243,65 @@ def get_depends_on(data_dict):
     return depends_on_list, command_to_integration
 
 
-def update_object_in_id_set(obj_id, obj_data, file_path, instances_set):
-    change_string = run_command("git diff HEAD {0}".format(file_path))
-    is_added_from_version = True if re.search(r'\+fromversion: .*', change_string) else False
-    is_added_to_version = True if re.search(r'\+toversion: .*', change_string) else False
+def update_object_in_id_set(obj_id, obj_data, file_path, instances_set, git_context=None, id_set_index=None):
+    """Replaces the instance of a modified object in a section of the id_set, or adds it if it has no instance.
 
-    file_to_version = get_to_version(file_path)
-    file_from_version = get_from_version(file_path)
+    The instance with the version range of the object is replaced, a version which the change adds to the file
+    matches any version of the instance.
 
-    updated = False
-    for instance in instances_set:
-        instance_id = instance.keys()[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
+    Args:
+        obj_id (str): the id of the object.
+        obj_data (dict): the instance of the object, {obj_id: data}.
+        file_path (str): the path of the file of the object.
+        instances_set (list): the section of the id_set.
+        git_context (GitContext): the git queries of the run, whose diff of the whole tree is shared by all the files.
+        id_set_index (IdSetIndex): the index of the section, to update many objects without scanning the section.
 
-        if obj_id == instance_id:
-            if is_added_from_version or (not is_added_from_version and file_from_version == integration_from_version):
-                if is_added_to_version or (not is_added_to_version and file_to_version == integration_to_version):
-                    instance[obj_id] = obj_data[obj_id]
-                    updated = True
-                    break
+    Raises:
+        ValueError: if the fromversion or the toversion of the object is not of format x.x.x.
+    """
+    # the index keeps only the numbers of the versions, so a malformed version would be written to the id_set as is
+    check_version_format(file_path, 'fromversion', obj_data[obj_id].get('fromversion') or DEFAULT_FROM_VERSION)
+    check_version_format(file_path, 'toversion', obj_data[obj_id].get('toversion', DEFAULT_TO_VERSION))
+
+    git_context = git_context or GitContext()
+    if id_set_index is None:
+        id_set_index = IdSetIndex(instances_set)
+    change_string = git_context.get_file_diff(file_path, 'HEAD')
+    is_added_from_version = True if re.search(r'\+fromversion: .*', change_string) else False
+    is_added_to_version = True if re.search(r'\+toversion: .*', change_string) else False
 
-    if not updated:
-        # in case we didn't found then we need to create one
-        add_new_object_to_id_set(obj_id, obj_data, instances_set)
+    file_from_version, file_to_version = get_version_range(obj_data[obj_id])
+    for entry in id_set_index.get_entries(obj_id):
+        if (is_added_from_version or file_from_version == entry.from_version) and \
+                (is_added_to_version or file_to_version == entry.to_version):
+            id_set_index.update(entry, obj_data[obj_id])
+            return
 
+    # in case we didn't found then we need to create one
+    add_new_object_to_id_set(obj_id, obj_data, instances_set, id_set_index)
 
-def add_new_object_to_id_set(obj_id: str, obj_data: OrderedDict, instances_set: list):
-    obj_in_set = False
 
-    obj_data_list = list(obj_data.values())
-    dict_value = obj_data_list[0]
-    file_to_version = dict_value.get('toversion', '99.99.99')
-    file_from_version = dict_value.get('fromversion', '0.0.0')
+def add_new_object_to_id_set(obj_id: str, obj_data: OrderedDict, instances_set: list,
+                             id_set_index: IdSetIndex = None):
+    """Adds an object to a section of the id_set, or replaces the data of the object with the same version range.
 
-    for instance in instances_set:
-        instance_id = list(instance.keys())[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
-        if obj_id == instance_id and file_from_version == integration_from_version and \
-                file_to_version == integration_to_version:
-            instance[obj_id] = obj_data[obj_id]
-            obj_in_set = True
+    Args:
+        obj_id (str): the id of the object.
+        obj_data (dict): the instance of the object, {obj_id: data}.
+        instances_set (list): the section of the id_set.
+        id_set_index (IdSetIndex): the index of the section, to update many objects without scanning the section.
+    """
+    if id_set_index is None:
+        id_set_index = IdSetIndex(instances_set)
 
-    if not obj_in_set:
-        instances_set.append(obj_data)
+    file_from_version, file_to_version = get_version_range(obj_data[obj_id])
+    found_entries = id_set_index.find(obj_id, file_from_version, file_to_version)
+    for entry in found_entries:
+        entry.instance[obj_id] = obj_data[obj_id]
+
+    if not found_entries:
+        id_set_index.add(obj_data)
 
 
 def process_integration(file_path):
@@ -290,7 +317,6 @@ def process_integration(file_path):
     res = []
     if os.path.isfile(file_path):
         if checked_type(file_path, (INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, PACKS_INTEGRATION_REGEX)):
-            print("adding {0} to id_set".format(file_path))
             res.append(get_integration_data(file_path))
     else:
         # package integration
@@ -298,7 +324,6 @@ def process_integration(file_path):
         file_path = os.path.join(file_path, '{}.yml'.format(package_name))
         if os.path.isfile(file_path):
             # locally, might have leftover dirs without committed files
-            print("adding {0} to id_set".format(file_path))
             res.append(get_integration_data(file_path))
     return res
 
@@ -307,22 +332,32 @@ def process_script(file_path):
     res = []
     if os.path.isfile(file_path):
         if checked_type(file_path, (SCRIPT_REGEX, PACKS_SCRIPT_YML_REGEX)):
-            print("adding {0} to id_set".format(file_path))
             res.append(get_script_data(file_path))
     else:
-        # package script
-        unifier = Unifier(file_path)
-        yml_path, code = unifier.get_script_package_data()
-        print("adding {0} to id_set".format(file_path))
-        res.append(get_script_data(yml_path, script_code=code))
+        res.append(get_package_script_data(file_path))
 
     return res
 
 
+def get_package_script_data(package_path):
+    """
+    Get the data of a script package, its yml is parsed once for the type of its code and for its data
+
+    Arguments:
+        package_path {string} -- path to the package directory
+
+    Returns:
+        dict -- the script data, {id: data}
+    """
+    _, yml_path = get_yml_paths_in_dir(package_path, error_msg='')
+    unifier = Unifier(get_content_entity(yml_path) if yml_path else package_path)
+    yml_path, code = unifier.get_script_package_data()
+    return get_script_data(unifier.entity or yml_path, script_code=code)
+
+
 def process_playbook(file_path):
     res = []
     if checked_type(file_path, (PACKS_PLAYBOOK_YML_REGEX, PLAYBOOK_REGEX, BETA_PLAYBOOK_REGEX)):
-        print('adding {0} to id_set'.format(file_path))
         res.append(get_playbook_data(file_path))
     return res
 
@@ -337,16 +372,16 @@ def process_test_playbook_path(file_path):
     Returns:
         pair -- first element is a playbook second is a script. each may be None
     """
-    print("adding {0} to id_set".format(file_path))
     script = None
     playbook = None
     if checked_type(file_path, (TEST_SCRIPT_REGEX, PACKS_TEST_PLAYBOOKS_REGEX, TEST_PLAYBOOK_REGEX)):
-        yml_data = get_yaml(file_path)
-        if 'commonfields' in yml_data:
+        # the file is parsed once, for its type and its data
+        entity = get_content_entity(file_path)
+        if 'commonfields' in entity.data:
             # script files contain this key
-            script = get_script_data(file_path)
+            script = get_script_data(entity)
         else:
-            playbook = get_playbook_data(file_path)
+            playbook = get_playbook_data(entity)
 
     return playbook, script
 
@@ -397,42 +432,67 @@ def get_test_playbooks_paths():
     return test_playbook_files
 
 
-def re_create_id_set():
-    start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
+# The functions which discover the paths of the entities of every section, in the order the paths are processed
+ID_SET_PATHS = OrderedDict([
+    ('integrations', get_integrations_paths),
+    ('playbooks', get_playbooks_paths),
+    ('scripts', get_scripts_paths),
+    ('TestPlaybooks', get_test_playbooks_paths),
+])
+# The functions which process the paths of every section, except for the test playbooks which can be scripts as well
+ID_SET_PROCESSORS = {
+    'integrations': process_integration,
+    'playbooks': process_playbook,
+    'scripts': process_script,
+}
 
-    pool = Pool(processes=cpu_count() * 2)
 
-    print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
-    print_color("Starting iterating over Integrations", LOG_COLORS.GREEN)
-    for arr in pool.map(process_integration, get_integrations_paths()):
-        integration_list.extend(arr)
+def _init_id_set_worker():
+    # every file is parsed once when the id_set is created, keeping the parsed files would only copy them
+    parsed_file_cache.max_bytes = 0
+
 
-    print_color("Starting iterating over Playbooks", LOG_COLORS.GREEN)
-    for arr in pool.map(process_playbook, get_playbooks_paths()):
-        playbooks_list.extend(arr)
+def process_id_set_path(task):
+    """
+    Process a path of any section of the id_set, by the section it was discovered for
 
-    print_color("Starting iterating over Scripts", LOG_COLORS.GREEN)
-    for arr in pool.map(process_script, get_scripts_paths()):
-        scripts_list.extend(arr)
+    Arguments:
+        task {tuple} -- the index of the path, the section it was discovered for and the path
+
+    Returns:
+        tuple -- the index of the path and the (section, data) pairs of the entities it contains
+    """
+    index, section, file_path = task
+    if section == 'TestPlaybooks':
+        playbook, script = process_test_playbook_path(file_path)
+        return index, [(entity_section, data) for entity_section, data in (('TestPlaybooks', playbook),
+                                                                           ('scripts', script)) if data]
+    return index, [(section, data) for data in ID_SET_PROCESSORS[section](file_path)]
 
-    print_color("Starting iterating over TestPlaybooks", LOG_COLORS.GREEN)
-    for pair in pool.map(process_test_playbook_path, get_test_playbooks_paths()):
-        if pair[0]:
-            testplaybooks_list.append(pair[0])
-        if pair[1]:
-            scripts_list.append(pair[1])
+
+def re_create_id_set(processes=None):
+    start_time = time.time()
+    # every path is processed once, in a single pipeline over the paths of all the sections
+    paths = [(section, file_path) for section, get_paths in ID_SET_PATHS.items() for file_path in get_paths()]
+    tasks = [(index, section, file_path) for index, (section, file_path) in enumerate(paths)]
+    processes = processes or cpu_count()
+    chunksize = max(1, len(tasks) // (processes * ID_SET_CHUNKS_PER_PROCESS))
+    sections = OrderedDict((section, []) for section in ID_SET_SECTIONS)  # type: OrderedDict
+
+    print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
+    with Pool(processes=processes, initializer=_init_id_set_worker) as pool:
+        for index, entities in pool.imap_unordered(process_id_set_path, tasks, chunksize):
+            for section, data in entities:
+                sections[section].append((index, data))
 
     new_ids_dict = OrderedDict()
-    # we sort each time the whole set in case someone manually changed something
-    # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
+    # the entities are sorted by their ids, and the entities with the same id by the order of their paths, as if the
+    # paths were processed one after the other
+    for section, entities in sections.items():
+        entities.sort(key=lambda entity: (list(entity[1].keys())[0].lower(), entity[0]))
+        new_ids_dict[section] = [data for _, data in entities]
+    print('Found {} scripts, {} playbooks, {} integrations and {} test playbooks in {} paths'.format(
+        *[len(new_ids_dict[section]) for section in ID_SET_SECTIONS], len(tasks)))
 
     with open('./Tests/id_set.json', 'w') as id_set_file:
         json.dump(new_ids_dict, id_set_file, indent=4)
@@ -445,54 +505,33 @@ def re_create_id_set():
 
 
 def find_duplicates(id_set):
-    scripts = id_set['scripts']
-    script_ids = set(list(script.keys())[0] for script in scripts)
-
-    scripts_list = []
-    for script_id in script_ids:
-        if has_duplicate(scripts, script_id):
-            scripts_list.append(script_id)
+    duplicates = []
+    for section in ['scripts', 'integrations', 'playbooks', 'TestPlaybooks']:
+        id_set_index = IdSetIndex(id_set[section])
+        duplicates.append([obj_id for obj_id in id_set_index if has_duplicate(id_set_index, obj_id)])
 
-    integrations = id_set['integrations']
-    integration_ids = set(list(integration.keys())[0] for integration in integrations)
-
-    integration_list = []
-    for integration_id in integration_ids:
-        if has_duplicate(integrations, integration_id):
-            integration_list.append(integration_id)
-
-    playbooks = id_set['playbooks']
-    playbook_ids = set(list(playbook.keys())[0] for playbook in playbooks)
-
-    playbooks_list = []
-    for playbook_id in playbook_ids:
-        if has_duplicate(playbooks, playbook_id):
-            integration_list.append(playbook_id)
-
-    test_playbooks = id_set['TestPlaybooks']
-    test_playbook_ids = set(list(test_playbook.keys())[0] for test_playbook in test_playbooks)
-
-    test_playbooks_list = []
-    for test_playbook_id in test_playbook_ids:
-        if has_duplicate(test_playbooks, test_playbook_id):
-            test_playbooks_list.append(test_playbook_id)
-
-    return scripts_list, integration_list, playbooks_list, test_playbooks_list
+    # scripts, integrations, playbooks and test playbooks
+    return tuple(duplicates)
 
 
 def has_duplicate(id_set, id_to_check):
-    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
+    """Checks whether the version ranges of objects with the same id overlap.
+
+    Args:
+        id_set (list or IdSetIndex): a section of the id_set, or its index.
+        id_to_check (str): the id.
+    """
+    id_set_index = id_set if isinstance(id_set, IdSetIndex) else IdSetIndex(id_set)
+    duplicates = id_set_index.get_entries(id_to_check)
 
     if len(duplicates) < 2:
         return False
 
     for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
+        dict1 = dup1.data
+        dict2 = dup2.data
+        dict1_from_version, dict1_to_version = dup1.from_version, dup1.to_version
+        dict2_from_version, dict2_to_version = dup2.from_version, dup2.to_version
 
         if dict1['name'] != dict2['name']:
             print_warning('The following objects has the same ID but different names: '
@@ -518,114 +557,99 @@ def sort(data):
     return data
 
 
-def update_id_set():
-    branches = run_command("git branch")
-    branch_name_reg = re.search(r"\* (.*)", branches)
-    branch_name = branch_name_reg.group(1)
+def get_changed_file_data(file_path):
+    """
+    Get the section of the id_set and the data of a changed file, the file is parsed once
+
+    Arguments:
+        file_path {string} -- path to the changed file
+
+    Returns:
+        tuple -- the section and the data of the object, {id: data}. (None, None) if the file is not in the id_set
+    """
+    entity = get_content_entity(file_path)
+    if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
+            re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
+        return 'integrations', get_integration_data(entity)
+    if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
+        return 'scripts', get_script_data(entity)
+    if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+        return 'playbooks', get_playbook_data(entity)
+    if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+        return 'TestPlaybooks', get_playbook_data(entity)
+    return None, None
+
+
+def load_id_set():
+    with open('./Tests/id_set.json', 'r') as id_set_file:
+        try:
+            return json.load(id_set_file, object_pairs_hook=OrderedDict)
+        except ValueError as ex:
+            if "Expecting property name" in str(ex):
+                # if we got this error it means we have corrupted id_set.json
+                # usually it will happen if we merged from master and we had a conflict in id_set.json
+                # so we checkout the id_set.json to be exact as in master and then run update_id_set
+                run_command("git checkout origin/master Tests/id_set.json")
+                with open('./Tests/id_set.json', 'r') as id_set_file_from_master:
+                    return json.load(id_set_file_from_master, object_pairs_hook=OrderedDict)
+            raise
+
+
+def update_id_set(git_context=None):
+    git_context = git_context or GitContext()
+    branch_name = git_context.branch
 
     print("Getting added files")
-    files_string = run_command("git diff --name-status HEAD")
-    second_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name))
+    files_string = git_context.get_name_status('HEAD')
+    second_files_string = git_context.get_name_status('origin/master...{}'.format(branch_name))
     added_files, modified_files, added_scripts, modified_scripts = \
         get_changed_files(files_string + '\n' + second_files_string)
 
-    if added_files or modified_files or added_scripts or modified_scripts:
-        print("Updating id_set.json")
-
-        with open('./Tests/id_set.json', 'r') as id_set_file:
-            try:
-                ids_dict = json.load(id_set_file, object_pairs_hook=OrderedDict)
-            except ValueError as ex:
-                if "Expecting property name" in str(ex):
-                    # if we got this error it means we have corrupted id_set.json
-                    # usually it will happen if we merged from master and we had a conflict in id_set.json
-                    # so we checkout the id_set.json to be exact as in master and then run update_id_set
-                    run_command("git checkout origin/master Tests/id_set.json")
-                    with open('./Tests/id_set.json', 'r') as id_set_file_from_master:
-                        ids_dict = json.load(id_set_file_from_master, object_pairs_hook=OrderedDict)
-                else:
-                    raise
-
-        test_playbook_set = ids_dict['TestPlaybooks']
-        integration_set = ids_dict['integrations']
-        playbook_set = ids_dict['playbooks']
-        script_set = ids_dict['scripts']
-
-    if added_files:
-        for file_path in added_files:
-            if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_integration_data(file_path),
-                                         integration_set)
-                print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
-            if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
-                print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
-            if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         playbook_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         test_playbook_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-            if re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-
-    if modified_files:
-        for file_path in modified_files:
-            if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                id = get_script_or_integration_id(file_path)
-                integration_data = get_integration_data(file_path)
-                update_object_in_id_set(id, integration_data, file_path, integration_set)
-                print("updated {0} in id_set".format(id))
-            if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or re.match(TEST_SCRIPT_REGEX,
-                                                                            file_path, re.IGNORECASE):
-                id = get_script_or_integration_id(file_path)
-                script_data = get_script_data(file_path)
-                update_object_in_id_set(id, script_data, file_path, script_set)
-                print("updated {0} in id_set".format(id))
-            if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                id = collect_ids(file_path)
-                playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id, playbook_data, file_path, playbook_set)
-                print("updated {0} in id_set".format(id))
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                id = collect_ids(file_path)
-                playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id, playbook_data, file_path, test_playbook_set)
-                print("updated {0} in id_set".format(id))
-
-    if added_scripts:
-        for added_script_package in added_scripts:
-            unifier = Unifier(added_script_package)
-            yml_path, code = unifier.get_script_package_data()
-            add_new_object_to_id_set(get_script_or_integration_id(yml_path),
-                                     get_script_data(yml_path, script_code=code), script_set)
-            print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
-
-    if modified_scripts:
-        for modified_script_package in added_scripts:
-            unifier = Unifier(modified_script_package)
-            yml_path, code = unifier.get_script_package_data()
-            update_object_in_id_set(get_script_or_integration_id(yml_path),
-                                    get_script_data(yml_path, script_code=code), yml_path, script_set)
-            print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
-
-    if added_files or modified_files:
-        new_ids_dict = OrderedDict()
-        # we sort each time the whole set in case someone manually changed something
-        # it shouldn't take too much time
-        new_ids_dict['scripts'] = sort(script_set)
-        new_ids_dict['playbooks'] = sort(playbook_set)
-        new_ids_dict['integrations'] = sort(integration_set)
-        new_ids_dict['TestPlaybooks'] = sort(test_playbook_set)
-
-        with open('./Tests/id_set.json', 'w') as id_set_file:
-            json.dump(new_ids_dict, id_set_file, indent=4)
+    if not (added_files or modified_files or added_scripts or modified_scripts):
+        print("Finished updating id_set.json")
+        return
+
+    print("Updating id_set.json")
+    ids_dict = load_id_set()
+    # every section is indexed by id once, so every object is added or updated without scanning the section
+    id_set_indexes = {section: IdSetIndex(ids_dict[section]) for section in ID_SET_SECTIONS}
+
+    # every changed file is parsed once
+    for file_path in sorted(added_files):
+        section, obj_data = get_changed_file_data(file_path)
+        if section:
+            obj_id = next(iter(obj_data))
+            add_new_object_to_id_set(obj_id, obj_data, ids_dict[section], id_set_index=id_set_indexes[section])
+            print("Adding {0} to id_set".format(obj_id))
+
+    for file_path in sorted(modified_files):
+        section, obj_data = get_changed_file_data(file_path)
+        if section:
+            obj_id = next(iter(obj_data))
+            update_object_in_id_set(obj_id, obj_data, file_path, ids_dict[section], git_context,
+                                    id_set_index=id_set_indexes[section])
+            print("updated {0} in id_set".format(obj_id))
+
+    for added_script_package in sorted(added_scripts):
+        obj_data = get_package_script_data(added_script_package)
+        obj_id = next(iter(obj_data))
+        add_new_object_to_id_set(obj_id, obj_data, ids_dict['scripts'], id_set_index=id_set_indexes['scripts'])
+        print("Adding {0} to id_set".format(obj_id))
+
+    for modified_script_package in sorted(modified_scripts):
+        obj_data = get_package_script_data(modified_script_package)
+        obj_id = next(iter(obj_data))
+        update_object_in_id_set(obj_id, obj_data, obj_data[obj_id]['file_path'], ids_dict['scripts'], git_context,
+                                id_set_index=id_set_indexes['scripts'])
+        print("updated {0} in id_set".format(obj_id))
+
+    new_ids_dict = OrderedDict()
+    # we sort each time the whole set in case someone manually changed something
+    # it shouldn't take too much time
+    for section in ID_SET_SECTIONS:
+        new_ids_dict[section] = sort(ids_dict[section])
+
+    with open('./Tests/id_set.json', 'w') as id_set_file:
+        json.dump(new_ids_dict, id_set_file, indent=4)
 
     print("Finished updating id_set.json")
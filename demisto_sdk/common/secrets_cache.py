@@ -0,0 +1,55 @@
+"""Persistent cache of the secrets found in git blobs.
+
+Scanning the whole repository, or every commit since a tag, scans mostly the same contents run after run. SecretsCache
+keeps the secrets found in every scanned blob on disk, keyed by the git blob hash, the settings the blob was scanned
+with (the hash of the whitelist that applies to its path, its extension...) and the SDK version, so a repeated scan
+only scans the blobs that were added since the previous one.
+
+The entries are kept under <cache_dir>/secrets/ with the same atomic writes as DiskParseCache.
+"""
+import hashlib
+import os
+from typing import Iterable, List, Optional  # noqa: F401
+
+from demisto_sdk.common.parse_cache import DEFAULT_CACHE_DIR, DiskParseCache, ENTRY_EXTENSION
+
+# Bump when the secrets detection changes in a way that changes its findings
+SECRETS_SCANNER_VERSION = '1'
+SECRETS_DIR = 'secrets'
+
+
+class SecretsCache:
+    """The secrets found in blobs, shared between runs.
+
+    Attributes:
+        disk_cache (DiskParseCache): the store of the entries.
+        hits (int): the number of blobs whose secrets were found in the cache.
+        misses (int): the number of blobs which were not in the cache.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, sdk_version=None):
+        # type: (str, Optional[str]) -> None
+        self.disk_cache = DiskParseCache(cache_dir, sdk_version)
+        self.hits = 0
+        self.misses = 0
+
+    def get_entry_path(self, blob_hash, scan_settings):
+        # type: (str, Iterable[str]) -> str
+        """Gets the path of the entry of a blob scanned with the given settings."""
+        entry_key = hashlib.sha256('\0'.join([SECRETS_SCANNER_VERSION, self.disk_cache.sdk_version, blob_hash] +
+                                             list(scan_settings)).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_cache.cache_dir, SECRETS_DIR, entry_key[:2], entry_key + ENTRY_EXTENSION)
+
+    def get(self, entry_path):
+        # type: (str) -> Optional[List[str]]
+        """Gets the stored secrets of a blob, None if the blob was not scanned."""
+        found, secrets = self.disk_cache.get(entry_path)
+        if found:
+            self.hits += 1
+            return secrets
+        self.misses += 1
+        return None
+
+    def set(self, entry_path, secrets):
+        # type: (str, List[str]) -> None
+        self.disk_cache.set(entry_path, secrets)
@@ -0,0 +1,113 @@
+"""Matching of a text against many substrings at once, with an Aho-Corasick automaton.
+
+The secrets detection checks every string of a file against every entry of its whitelist, e.g.
+any(white_list_string.lower() in string_.lower() for white_list_string in secrets_white_list), which costs
+O(len(whitelist)) substring searches per string. SubstringMatcher compiles the substrings once into a trie with failure
+links (Aho-Corasick), so checking whether a text contains any of them walks the text once: O(len(text)), however many
+substrings there are. SubstringSet covers the substrings that are added while matching, such as the false positives
+found in the lines of a file.
+
+The matching is case sensitive, callers that compare lower case strings lower the substrings and the texts.
+"""
+from collections import deque
+from typing import Dict, Iterable, List  # noqa: F401
+
+
+class SubstringMatcher:
+    """Finds which of a set of substrings a text contains.
+
+    Attributes:
+        substrings (frozenset): the matched substrings.
+    """
+
+    def __init__(self, substrings):
+        # type: (Iterable[str]) -> None
+        self.substrings = frozenset(substrings)
+        # The transitions of every state of the trie, state 0 is the root
+        self._goto = [{}]  # type: List[Dict[str, int]]
+        # Whether a substring ends at every state, directly or through its failure links
+        self._matches = [False]  # type: List[bool]
+        for substring in sorted(self.substrings):
+            self._add(substring)
+        self._fail = self._link()
+
+    def __len__(self):
+        return len(self.substrings)
+
+    def _add(self, substring):
+        # type: (str) -> None
+        state = 0
+        for char in substring:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._matches.append(False)
+            state = next_state
+        self._matches[state] = True
+
+    def _link(self):
+        # type: () -> List[int]
+        """Sets the failure link of every state to the state of its longest proper suffix in the trie, breadth first."""
+        fail = [0] * len(self._goto)
+        states = deque(self._goto[0].values())
+        while states:
+            state = states.popleft()
+            for char, next_state in self._goto[state].items():
+                states.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = self._goto[fallback].get(char, 0)
+                self._matches[next_state] = self._matches[next_state] or self._matches[fail[next_state]]
+        return fail
+
+    def search(self, text):
+        # type: (str) -> bool
+        """Checks whether the text contains any of the substrings."""
+        if self._matches[0]:
+            # the empty string is in every text
+            return True
+        goto, fail, matches = self._goto, self._fail, self._matches
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if matches[state]:
+                return True
+        return False
+
+
+class SubstringSet:
+    """A set of substrings which grows while texts are matched against it, e.g. the false positives of the lines of a
+    file that were scanned so far.
+
+    SubstringMatcher would have to be compiled again after every addition. SubstringSet indexes the substrings by their
+    lengths instead: adding a substring costs O(1), and checking whether a text contains any of them costs
+    O(len(text)) slice lookups per distinct length, which is cheap when the substrings have few lengths (dates, uuids,
+    versions...).
+    """
+
+    def __init__(self, substrings=()):
+        # type: (Iterable[str]) -> None
+        self._substrings_by_length = {}  # type: Dict[int, set]
+        self.update(substrings)
+
+    def __len__(self):
+        return sum(len(substrings) for substrings in self._substrings_by_length.values())
+
+    def update(self, substrings):
+        # type: (Iterable[str]) -> None
+        for substring in substrings:
+            self._substrings_by_length.setdefault(len(substring), set()).add(substring)
+
+    def search(self, text):
+        # type: (str) -> bool
+        """Checks whether the text contains any of the substrings."""
+        for length, substrings in self._substrings_by_length.items():
+            for start in range(len(text) - length + 1):
+                if text[start:start + length] in substrings:
+                    return True
+        return False
@@ -0,0 +1,194 @@
+"""Extraction of the text of pdf files and html (integration READMEs) in a pool of worker processes.
+
+Parsing a pdf or an html page is the only part of the secrets detection which runs third party parsers over untrusted
+files, and a large or malformed file can take minutes or all the memory of the machine. TextExtractor runs the
+parsers in worker processes instead of the current one: every file gets a time budget, after which its worker is
+killed, and the address space of the workers is limited, so a file which needs too much memory fails with a
+MemoryError in its worker. A file which can not be extracted is reported in the result instead of raising.
+
+The texts are kept by the hash of the content of the file, in memory and, when a cache directory is given, on disk
+with the parsed files of DiskParseCache, so unchanged files are not parsed again in later runs.
+"""
+import hashlib
+import io
+import time
+from collections import OrderedDict, namedtuple
+from multiprocessing import Pool, TimeoutError
+from typing import Callable, Dict, List, Optional, Tuple  # noqa: F401
+
+from demisto_sdk.common.parse_cache import DiskParseCache
+
+# The time in seconds a file is extracted for, and the memory in MB a worker can allocate, 0 for no limit
+DEFAULT_EXTRACTION_TIMEOUT = 60
+DEFAULT_EXTRACTION_MEMORY_LIMIT = 1024
+
+# The text of a file, or the reason it was not extracted
+ExtractedText = namedtuple('ExtractedText', ['text', 'error'])
+
+
+def extract_text_from_pdf(content):
+    # type: (bytes) -> str
+    import PyPDF2
+    # PdfReader replaced PdfFileReader in PyPDF2 2.0, and extract_text replaced extractText
+    pdf_reader = getattr(PyPDF2, 'PdfReader', None) or PyPDF2.PdfFileReader
+    pages_text = []
+    for pdf_page in pdf_reader(io.BytesIO(content)).pages:
+        extract_text = getattr(pdf_page, 'extract_text', None) or pdf_page.extractText
+        pages_text.append(extract_text())
+    return ''.join(pages_text)
+
+
+def extract_text_from_md_html(content):
+    # type: (bytes) -> str
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content.decode('utf-8', errors='ignore'), features='html.parser').text
+
+
+class TextExtractor:
+    """Extracts the texts of files in worker processes, with a time and a memory limit for every file.
+
+    Attributes:
+        processes (int): the number of worker processes.
+        timeout (float): the time in seconds a file is extracted for, 0 for no limit.
+        memory_limit (float): the memory in MB a worker can allocate, 0 for no limit.
+        disk_cache (DiskParseCache): the store of the texts shared between runs, None to keep them only in memory.
+        extractions_count (int): the number of files which were extracted rather than found in the cache.
+    """
+
+    def __init__(self, processes=1, timeout=DEFAULT_EXTRACTION_TIMEOUT, memory_limit=DEFAULT_EXTRACTION_MEMORY_LIMIT,
+                 cache_dir=None, sdk_version=None):
+        # type: (int, float, float, Optional[str], Optional[str]) -> None
+        self.processes = max(1, processes or 1)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.disk_cache = DiskParseCache(cache_dir, sdk_version) if cache_dir else None
+        self.extractions_count = 0
+        # The extracted texts and the failures of the run, by the hash of the extract function and the content
+        self._extracted_texts = {}  # type: Dict[str, ExtractedText]
+
+    @staticmethod
+    def get_extract_function_name(extract_function):
+        # type: (Callable) -> str
+        return '{}.{}'.format(extract_function.__module__, extract_function.__qualname__)
+
+    def get_key(self, content, extract_function):
+        # type: (bytes, Callable) -> str
+        digest = hashlib.sha256(self.get_extract_function_name(extract_function).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content)
+        return digest.hexdigest()
+
+    def extract_text(self, content, extract_function):
+        # type: (bytes, Callable) -> ExtractedText
+        """Extracts the text of a single file, see extract_texts."""
+        return self.extract_texts([(content, extract_function)])[0]
+
+    def extract_texts(self, files):
+        # type: (List[Tuple[bytes, Callable]]) -> List[ExtractedText]
+        """Extracts the texts of files, each file whose text is not cached in a worker process.
+
+        Args:
+            files (list): the contents of the files and the functions which extract their texts, module level
+                functions which get the content and return the text.
+
+        Returns:
+            list. The extracted text of every file, or the reason it was not extracted.
+        """
+        keys = [self.get_key(content, extract_function) for content, extract_function in files]
+        # files with the same content are extracted once
+        extractions = OrderedDict()  # type: OrderedDict
+        for key, (content, extract_function) in zip(keys, files):
+            if key in self._extracted_texts or key in extractions:
+                continue
+            if self.disk_cache is not None:
+                found, text = self.disk_cache.get(self.get_entry_path(content, extract_function))
+                if found:
+                    self._extracted_texts[key] = ExtractedText(text, None)
+                    continue
+            extractions[key] = (content, extract_function)
+
+        if extractions:
+            for key, extracted_text in zip(extractions, self.run_extractions(list(extractions.values()))):
+                self._extracted_texts[key] = extracted_text
+                # failures are not stored, a file which took too long may be extracted on another machine
+                if self.disk_cache is not None and extracted_text.error is None:
+                    content, extract_function = extractions[key]
+                    self.disk_cache.set(self.get_entry_path(content, extract_function), extracted_text.text)
+
+        return [self._extracted_texts[key] for key in keys]
+
+    def get_entry_path(self, content, extract_function):
+        # type: (bytes, Callable) -> str
+        return self.disk_cache.get_entry_path(content, self.get_extract_function_name(extract_function))
+
+    def run_extractions(self, extractions):
+        # type: (List[Tuple[bytes, Callable]]) -> List[ExtractedText]
+        """Extracts the texts in waves of a file per worker, so the time budget of every file starts when its worker
+        starts to extract it. The workers are killed after a file that ran out of time, and replaced.
+        """
+        processes = min(self.processes, len(extractions))
+        extracted_texts = []  # type: List[ExtractedText]
+        pool = self.create_pool(processes)
+        try:
+            for start in range(0, len(extractions), processes):
+                async_results = [pool.apply_async(_extract_text, (extract_function, content))
+                                 for content, extract_function in extractions[start:start + processes]]
+                deadline = time.monotonic() + self.timeout if self.timeout else None
+                timed_out = False
+                for async_result in async_results:
+                    try:
+                        extracted_texts.append(async_result.get(
+                            None if deadline is None else max(0, deadline - time.monotonic())))
+                    except TimeoutError:
+                        extracted_texts.append(ExtractedText(None, 'not extracted within {} seconds'.format(
+                            self.timeout)))
+                        timed_out = True
+                if timed_out and start + processes < len(extractions):
+                    pool.terminate()
+                    pool = self.create_pool(processes)
+        finally:
+            pool.terminate()
+
+        self.extractions_count += len(extractions)
+        return extracted_texts
+
+    def create_pool(self, processes):
+        # type: (int) -> Pool
+        return Pool(processes, initializer=_init_worker, initargs=(self.memory_limit,))
+
+
+def get_address_space_size():
+    # type: () -> int
+    """Gets the size in bytes of the virtual memory of the current process, 0 where /proc is not available."""
+    import resource
+    try:
+        with open('/proc/self/statm') as statm_file:
+            return int(statm_file.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _init_worker(memory_limit):
+    if not memory_limit:
+        return
+    try:
+        import resource
+        # the limit is on top of the memory the worker inherited from its parent
+        limit = get_address_space_size() + int(memory_limit * 1024 * 1024)
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        if hard_limit != resource.RLIM_INFINITY:
+            limit = min(limit, hard_limit)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard_limit))
+    except (ImportError, ValueError, OSError):
+        # not supported on this platform (windows)
+        pass
+
+
+def _extract_text(extract_function, content):
+    # type: (Callable, bytes) -> ExtractedText
+    try:
+        return ExtractedText(extract_function(content), None)
+    except MemoryError:
+        return ExtractedText(None, 'not extracted within the memory limit')
+    except Exception as ex:
+        return ExtractedText(None, 'not parsable ({}: {})'.format(type(ex).__name__, ex))
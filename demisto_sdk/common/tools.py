@@ -9,11 +9,13 @@ from distutils.version import LooseVersion
 from typing import Union, Optional, Tuple
 
 import urllib3
-import yaml
-import requests
 
-from demisto_sdk.common.constants import CHECKED_TYPES_REGEXES, PACKAGE_SUPPORTING_DIRECTORIES, CONTENT_GITHUB_LINK, \
+from demisto_sdk.common.constants import CHECKED_TYPES_REGEXES, PACKAGE_SUPPORTING_DIRECTORIES, \
     PACKAGE_YML_FILE_REGEX, UNRELEASE_HEADER, RELEASE_NOTES_REGEX, PACKS_DIR, PACKS_DIR_REGEX, DEF_DOCKER
+from demisto_sdk.common.parse_cache import parsed_file_cache
+from demisto_sdk.common.path_classifier import path_classifier
+from demisto_sdk.common.remote_file_fetcher import remote_file_fetcher
+from demisto_sdk.common import yaml_backend
 
 # disable insecure warnings
 urllib3.disable_warnings()
@@ -84,24 +86,18 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
 
 
 def get_remote_file(full_file_path, tag='master'):
-    # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
-    tag = tag.lstrip('origin/')
-
-    # The replace in the end is for Windows support
-    github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
     try:
-        res = requests.get(github_path, verify=False)
-        res.raise_for_status()
+        content = remote_file_fetcher.fetch(full_file_path, tag)
     except Exception as exc:
         print_warning('Could not find the old entity file under "{}".\n'
                       'please make sure that you did not break backward compatibility. '
-                      'Reason: {}'.format(github_path, exc))
+                      'Reason: {}'.format(remote_file_fetcher.get_url(full_file_path, tag), exc))
         return {}
 
     if full_file_path.endswith('json'):
-        details = json.loads(res.content)
+        details = json.loads(content)
     else:
-        details = yaml.safe_load(res.content)
+        details = yaml_backend.safe_load(content)
 
     return details
 
@@ -134,7 +130,7 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
     for file_path in added_files:
         if file_path.split("/")[0] in PACKAGE_SUPPORTING_DIRECTORIES:
             with open(file_path) as f:
-                details = yaml.safe_load(f.read())
+                details = yaml_backend.safe_load(f)
 
             uniq_identifier = '_'.join([
                 details['name'],
@@ -196,21 +192,22 @@ def get_last_release_version():
 
 def get_file(method, file_path, type_of_file):
     data_dictionary = None
-    with open(os.path.expanduser(file_path), "r") as f:
-        if file_path.endswith(type_of_file):
-            try:
-                data_dictionary = method(f)
-            except Exception as e:
-                print_error(
-                    "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
-                return []
+    if file_path.endswith(type_of_file):
+        try:
+            data_dictionary = parsed_file_cache.get_or_load(os.path.expanduser(file_path), method)
+        except OSError:
+            raise
+        except Exception as e:
+            print_error(
+                "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
+            return []
     if type(data_dictionary) is dict:
         return data_dictionary
     return {}
 
 
 def get_yaml(file_path):
-    return get_file(yaml.safe_load, file_path, ('yml', 'yaml'))
+    return get_file(yaml_backend.safe_load, file_path, ('yml', 'yaml'))
 
 
 def get_json(file_path):
@@ -233,6 +230,22 @@ def collect_ids(file_path):
         return data_dictionary.get('id', '-')
 
 
+def check_version_format(file_path, version_field, version):
+    """Checks that a version of a file is of format x.x.x, e.g. 4.5.0.
+
+    Args:
+        file_path (str): the path of the file.
+        version_field (str): the field of the version, fromversion or toversion.
+        version (str): the version.
+
+    Raises:
+        ValueError: if the version is not of format x.x.x.
+    """
+    if not re.match(r"^\d{1,2}\.\d{1,2}\.\d{1,2}$", str(version)):
+        raise ValueError("{} {} is invalid \"{}\". Should be of format: \"x.x.x\". "
+                         "for example: \"4.5.0\"".format(file_path, version_field, version))
+
+
 def get_from_version(file_path):
     data_dictionary = get_yaml(file_path)
 
@@ -241,10 +254,7 @@ def get_from_version(file_path):
         if from_version == "":
             return "0.0.0"
 
-        if not re.match(r"^\d{1,2}\.\d{1,2}\.\d{1,2}$", from_version):
-            raise ValueError("{} fromversion is invalid \"{}\". "
-                             "Should be of format: \"x.x.x\". for example: \"4.5.0\"".format(file_path, from_version))
-
+        check_version_format(file_path, 'fromversion', from_version)
         return from_version
 
     return '0.0.0'
@@ -255,10 +265,7 @@ def get_to_version(file_path):
 
     if data_dictionary:
         to_version = data_dictionary.get('toversion', '99.99.99')
-        if not re.match(r"^\d{1,2}\.\d{1,2}\.\d{1,2}$", to_version):
-            raise ValueError("{} toversion is invalid \"{}\". "
-                             "Should be of format: \"x.x.x\". for example: \"4.5.0\"".format(file_path, to_version))
-
+        check_version_format(file_path, 'toversion', to_version)
         return to_version
 
     return '99.99.99'
@@ -309,11 +316,11 @@ def get_latest_release_notes_text(rn_path):
 
 def checked_type(file_path, compared_regexes=None, return_regex=False):
     compared_regexes = compared_regexes or CHECKED_TYPES_REGEXES
-    for regex in compared_regexes:
-        if re.match(regex, file_path, re.IGNORECASE):
-            if return_regex:
-                return regex
-            return True
+    regex = path_classifier.match(file_path, compared_regexes)
+    if regex is not None:
+        if return_regex:
+            return regex
+        return True
     return False
 
 
@@ -371,8 +378,7 @@ def is_file_path_in_pack(file_path):
 
 
 def get_pack_name(file_path):
-    match = re.search(r'^(?:./)?{}/([^/]+)/'.format(PACKS_DIR), file_path)
-    return match.group(1) if match else None
+    return path_classifier.classify(file_path).pack_name
 
 
 def pack_name_to_path(pack_name):
@@ -0,0 +1,182 @@
+"""Persistent cache of the verdicts of `validate -a`.
+
+On master and release branches every file of the repository is validated, while almost none of them changed since
+the previous run. VerdictCache keeps the verdict (validity and output) of every file validation on disk, keyed by the
+git blob hash of the file, the path of the file, the hash of the schema it is validated against, the version of the
+validations and the SDK version. A file is validated again only if one of them changed, and the output of the other
+files is replayed from the cache.
+
+The entries are kept under <cache_dir>/verdicts/<repository key>/ with the same atomic writes as DiskParseCache, so the
+directory can be saved as a CI artifact and restored by the next pipeline (which checks the repository out at the same
+path). The verdicts of every checkout or worktree are kept apart, since the user cache directory is shared by all of
+them. Entries that a full run did not use are pruned after it, so the artifact does not grow over time - unless another
+run of the same checkout is still in progress, in which case the last run to finish prunes them.
+"""
+import hashlib
+import os
+import tempfile
+from collections import namedtuple
+from typing import Dict, Optional
+
+from demisto_sdk.common.parse_cache import DEFAULT_CACHE_DIR, DiskParseCache, ENTRY_EXTENSION
+from demisto_sdk.common.path_classifier import path_classifier
+
+# Bump when the validations of `validate -a` change in a way that changes their verdicts
+VALIDATOR_SET_VERSION = '1'
+VERDICTS_DIR = 'verdicts'
+# Every full run creates a marker when it starts, the entries older than it were not used by the run
+RUN_MARKER_PREFIX = '.run-'
+# The marker of a run that started this long before the current one was left by a run which did not finish
+STALE_RUN_SECONDS = 24 * 60 * 60
+SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+
+Verdict = namedtuple('Verdict', ['is_valid', 'output'])
+
+
+def get_blob_hash(content):
+    # type: (bytes) -> str
+    """Gets the git blob hash of a file content, the hash `git hash-object` prints."""
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+
+class VerdictCache:
+    """Verdicts of file validations, shared between runs.
+
+    Attributes:
+        disk_cache (DiskParseCache): the store of the entries.
+        rebuild (bool): whether to ignore the stored verdicts, so every file is validated and its verdict replaced.
+        repo_root (str): the root of the validated checkout, the paths of the validated files are relative to it.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, sdk_version=None, rebuild=False, repo_root=None):
+        # type: (str, Optional[str], bool, Optional[str]) -> None
+        self.disk_cache = DiskParseCache(cache_dir, sdk_version)
+        self.rebuild = rebuild
+        self.repo_root = os.path.realpath(repo_root or os.getcwd())
+        self._schema_hashes = {}  # type: Dict[str, str]
+        self._run_marker = None  # type: Optional[str]
+
+    @property
+    def entries_dir(self):
+        # type: () -> str
+        """The directory of the verdicts of the checkout."""
+        repository_key = hashlib.sha256(self.repo_root.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.disk_cache.cache_dir, VERDICTS_DIR, repository_key)
+
+    def get_schema_hash(self, file_path):
+        # type: (str) -> str
+        """Gets the hash of the schema the file is validated against, empty if it has none."""
+        schema_name = path_classifier.classify(file_path).schema or ''
+        if schema_name not in self._schema_hashes:
+            schema_path = os.path.join(SCHEMAS_DIR, '{}.yml'.format(schema_name))
+            schema_hash = ''
+            if schema_name and os.path.isfile(schema_path):
+                with open(schema_path, 'rb') as schema_file:
+                    schema_hash = hashlib.sha256(schema_file.read()).hexdigest()
+            self._schema_hashes[schema_name] = schema_hash
+        return self._schema_hashes[schema_name]
+
+    def get_entry_path(self, file_path):
+        # type: (str) -> str
+        """Gets the path of the entry of a file validation.
+
+        The path of the file is a part of the key since the validation output mentions it.
+        """
+        with open(file_path, 'rb') as validated_file:
+            blob_hash = get_blob_hash(validated_file.read())
+
+        entry_key = hashlib.sha256('\0'.join([VALIDATOR_SET_VERSION, self.disk_cache.sdk_version, blob_hash,
+                                              os.path.normpath(file_path), self.get_schema_hash(file_path)])
+                                   .encode('utf-8')).hexdigest()
+        return os.path.join(self.entries_dir, entry_key[:2], entry_key + ENTRY_EXTENSION)
+
+    def get(self, entry_path):
+        # type: (str) -> Optional[Verdict]
+        """Gets a stored verdict, None if there is none or the cache is rebuilt."""
+        if self.rebuild:
+            return None
+
+        found, verdict = self.disk_cache.get(entry_path)
+        if not found:
+            return None
+
+        try:
+            # mark the entry as used by this run, so it is not pruned
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return Verdict(*verdict)
+
+    def set(self, entry_path, verdict):
+        # type: (str, Verdict) -> None
+        self.disk_cache.set(entry_path, tuple(verdict))
+
+    def start_run(self):
+        # type: () -> None
+        """Marks the start of a full run, the entries it does not use are removed by prune."""
+        if not self.disk_cache.is_usable():
+            return
+        try:
+            self.disk_cache.create_cache_dir()
+            os.makedirs(self.entries_dir, exist_ok=True)
+            marker_fd, self._run_marker = tempfile.mkstemp(dir=self.entries_dir, prefix=RUN_MARKER_PREFIX)
+            os.close(marker_fd)
+        except OSError:
+            self._run_marker = None
+
+    def is_other_run_in_progress(self, run_started):
+        # type: (float) -> bool
+        """Checks whether another full run of the checkout is in progress, removing the markers of stale runs."""
+        in_progress = False
+        for file_name in os.listdir(self.entries_dir):
+            marker_path = os.path.join(self.entries_dir, file_name)
+            if not file_name.startswith(RUN_MARKER_PREFIX) or marker_path == self._run_marker:
+                continue
+            try:
+                if os.path.getmtime(marker_path) < run_started - STALE_RUN_SECONDS:
+                    os.remove(marker_path)
+                else:
+                    in_progress = True
+            except OSError:
+                pass
+        return in_progress
+
+    def prune(self):
+        # type: () -> int
+        """Removes the entries which were not used since the run started, unless another run of the checkout is in
+        progress.
+
+        The file system clock is compared with itself (the mtime of the run marker), not with the system time.
+
+        Returns:
+            int. The number of removed entries.
+        """
+        if self._run_marker is None:
+            return 0
+
+        removed = 0
+        try:
+            run_started = os.path.getmtime(self._run_marker)
+            if self.is_other_run_in_progress(run_started):
+                return 0
+
+            for root, _, files in os.walk(self.entries_dir):
+                for file_name in files:
+                    if not file_name.endswith(ENTRY_EXTENSION):
+                        continue
+                    entry_path = os.path.join(root, file_name)
+                    try:
+                        if os.path.getmtime(entry_path) < run_started:
+                            os.remove(entry_path)
+                            removed += 1
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        finally:
+            try:
+                os.remove(self._run_marker)
+            except OSError:
+                pass
+            self._run_marker = None
+        return removed
@@ -0,0 +1,163 @@
+"""YAML backend used by every yml read and write in the SDK.
+
+Loading uses the libyaml C parser (CSafeLoader) when PyYAML was built with it, and falls back to the pure-Python
+SafeLoader otherwise - both return the same data.
+Yaml12SafeLoader resolves plain scalars by the YAML 1.2 rules of ruamel.yaml (which pykwalify loads files with), for the
+schema validation. PyYAML follows YAML 1.1, where yes/no/on/off are booleans and 1:20 is an integer, and silently keeps
+the last value of a duplicate key, which ruamel.yaml fails on.
+Dumping always uses the pure-Python emitter: the libyaml emitter wraps long double-quoted scalars at different
+positions, and the files we write must stay byte-for-byte the same as before.
+"""
+import re
+from collections import OrderedDict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+    LIBYAML_AVAILABLE = False
+
+SafeDumper = yaml.SafeDumper
+YAMLError = yaml.YAMLError
+
+
+def _construct_ordered_map(loader, node):
+    data = OrderedDict()  # type: OrderedDict
+    yield data
+    loader.flatten_mapping(node)
+    data.update(loader.construct_pairs(node))
+
+
+class OrderedSafeLoader(SafeLoader):  # type: ignore
+    """Safe loader that keeps the order of the keys in mappings (loads them as OrderedDict)."""
+
+
+OrderedSafeLoader.add_constructor('tag:yaml.org,2002:map', _construct_ordered_map)
+OrderedSafeLoader.add_constructor('tag:yaml.org,2002:omap', _construct_ordered_map)
+
+
+def _scalar_value(node):
+    return node.value if isinstance(node, yaml.ScalarNode) else ''
+
+
+class Yaml12SafeLoader(SafeLoader):  # type: ignore
+    """Safe loader that resolves booleans, integers and floats by the YAML 1.2 core schema and fails on duplicate keys,
+    as ruamel.yaml does."""
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode):
+            value_nodes = {}  # type: dict
+            for key_node, value_node in node.value:
+                # the keys of a merged mapping may be overridden
+                if not isinstance(key_node, yaml.ScalarNode) or key_node.tag == 'tag:yaml.org,2002:merge':
+                    continue
+                if key_node.value in value_nodes:
+                    raise yaml.constructor.ConstructorError(
+                        'while constructing a mapping', node.start_mark,
+                        'found duplicate key "{}" with value "{}" (original value: "{}")'.format(
+                            key_node.value, _scalar_value(value_node), _scalar_value(value_nodes[key_node.value])),
+                        key_node.start_mark)
+                value_nodes[key_node.value] = value_node
+        return super(Yaml12SafeLoader, self).construct_mapping(node, deep=deep)
+
+    def construct_yaml_int(self, node):
+        # 1.2 octals start with 0o, other numbers with leading zeros are decimal
+        value = self.construct_scalar(node).replace('_', '')
+        sign = -1 if value[0] == '-' else 1
+        if value[0] in '+-':
+            value = value[1:]
+        for prefix, base in (('0b', 2), ('0x', 16), ('0o', 8)):
+            if value.startswith(prefix):
+                return sign * int(value[len(prefix):], base)
+        return sign * int(value)
+
+
+YAML_1_2_CORE_TAGS = {'tag:yaml.org,2002:bool', 'tag:yaml.org,2002:int', 'tag:yaml.org,2002:float'}
+Yaml12SafeLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag not in YAML_1_2_CORE_TAGS]
+    for first, resolvers in SafeLoader.yaml_implicit_resolvers.items()
+}
+Yaml12SafeLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:bool', re.compile(r'^(?:true|True|TRUE|false|False|FALSE)$'), list('tTfF'))
+Yaml12SafeLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:int', re.compile(r'''^(?:[-+]?0b[0-1_]+
+    |[-+]?0o?[0-7_]+
+    |[-+]?[0-9_]+
+    |[-+]?0x[0-9a-fA-F_]+)$''', re.X), list('-+0123456789'))
+Yaml12SafeLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:float', re.compile(r'''^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$''', re.X), list('-+0123456789.'))
+Yaml12SafeLoader.add_constructor('tag:yaml.org,2002:int', Yaml12SafeLoader.construct_yaml_int)
+
+
+class OrderedSafeDumper(SafeDumper):
+    """Safe dumper that writes OrderedDict as a regular mapping, keeping its keys order."""
+
+
+OrderedSafeDumper.add_representer(
+    OrderedDict, lambda dumper, data: dumper.represent_mapping('tag:yaml.org,2002:map', data.items())
+)
+
+
+class MultilineSafeDumper(OrderedSafeDumper):
+    """Ordered safe dumper that writes multiline strings as literal block scalars ('|')."""
+
+    def represent_multiline_str(self, data):
+        if '\n' in data:
+            return self.represent_scalar(u'tag:yaml.org,2002:str', data, style='|')
+        return self.represent_str(data)
+
+
+MultilineSafeDumper.add_representer(str, MultilineSafeDumper.represent_multiline_str)
+
+
+def safe_load(stream):
+    """Parses a yml document (str, bytes or file object) into plain python objects."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_yaml12(stream):
+    """Parses a yml document into plain python objects, resolving plain scalars by the YAML 1.2 rules.
+
+    Raises:
+        yaml.YAMLError: if the document is invalid or a mapping has a duplicate key.
+    """
+    return yaml.load(stream, Loader=Yaml12SafeLoader)
+
+
+def ordered_load(stream):
+    """Parses a yml document keeping the order of the keys in mappings."""
+    return yaml.load(stream, Loader=OrderedSafeLoader)
+
+
+def safe_dump(data, stream=None, **kwargs):
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def ordered_dump(data, stream=None, multiline_strings=False, **kwargs):
+    """Dumps data (usually loaded with ordered_load) keeping the keys order.
+
+    Args:
+        data: the data to dump.
+        stream: file object to write to, if None the yml text is returned.
+        multiline_strings (bool): whether to write multiline strings as literal block scalars ('|').
+    """
+    dumper = MultilineSafeDumper if multiline_strings else OrderedSafeDumper
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+
+
+def round_trip_yaml():
+    """Returns a ruamel YAML instance for round-trip edits which keep comments and quotes.
+
+    Round-trip loading has no C implementation, so this is the only pure-Python read path.
+    """
+    from ruamel.yaml import YAML
+    ryaml = YAML()
+    ryaml.preserve_quotes = True
+    return ryaml
@@ -15,3 +15,4 @@ class DemistoSDK:
 
     def __init__(self):
         self.configuration = None
+        self.cache_dir = None
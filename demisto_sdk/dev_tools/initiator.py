@@ -1,10 +1,9 @@
 import os
 import shutil
-import yaml
-import yamlordereddictloader
 
 from typing import Dict
 from distutils.dir_util import copy_tree
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.tools import print_error, print_color, LOG_COLORS
 from demisto_sdk.common.constants import INTEGRATIONS_DIR, SCRIPTS_DIR, INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR, \
     INDICATOR_FIELDS_DIR, PLAYBOOKS_DIR, LAYOUTS_DIR, TEST_PLAYBOOKS_DIR, CLASSIFIERS_DIR, CONNECTIONS_DIR, \
@@ -228,11 +227,7 @@ class Initiator:
         yml_dict["display"] = self.id
 
         with open(os.path.join(self.full_output_path, f"{self.dir_name}.yml"), 'w') as f:
-            yaml.dump(
-                yml_dict,
-                f,
-                Dumper=yamlordereddictloader.SafeDumper,
-                default_flow_style=False)
+            yaml_backend.ordered_dump(yml_dict, f, default_flow_style=False)
 
         os.remove(os.path.join(self.full_output_path, f"{current_suffix}.yml"))
 
@@ -287,7 +282,7 @@ class Initiator:
             Dict. Data from YML.
         """
         with open(file_path) as f:
-            return yaml.load(f, Loader=yamlordereddictloader.SafeLoader)
+            return yaml_backend.ordered_load(f)
 
     def fix_test_file_import(self, name_to_change: str):
         """Fixes the import statement in the _test.py file in the newly created initegration/script
@@ -5,8 +5,9 @@ from typing import Tuple, List
 
 from demisto_sdk.dev_tools.linter import Linter
 from demisto_sdk.common.configuration import Configuration
+from demisto_sdk.common.git_context import GitContext
 from demisto_sdk.common.constants import PACKS_DIR, INTEGRATIONS_DIR, SCRIPTS_DIR, BETA_INTEGRATIONS_DIR
-from demisto_sdk.common.tools import get_dev_requirements, print_color, LOG_COLORS, run_command
+from demisto_sdk.common.tools import get_dev_requirements, print_color, LOG_COLORS
 
 
 LOCK = threading.Lock()
@@ -32,13 +33,14 @@ class LintManager:
         run_all_tests (bool): Whether to run all tests.
         outfile (str): file path to save failed package list.
         configuration (Configuration): The system configuration.
+        git_context (GitContext): The git queries of the run.
     """
 
     def __init__(self, project_dir_list: str, no_test: bool = False, no_pylint: bool = False, no_flake8: bool = False,
                  no_mypy: bool = False, verbose: bool = False, root: bool = False, keep_container: bool = False,
                  cpu_num: int = 0, parallel: bool = False, max_workers: int = 10, no_bandit: bool = False,
                  git: bool = False, run_all_tests: bool = False, outfile: str = '',
-                 configuration: Configuration = Configuration()):
+                 configuration: Configuration = None, git_context: GitContext = None):
 
         if no_test and no_pylint and no_flake8 and no_mypy and no_bandit:
             raise ValueError("Nothing to run as all --no-* options specified.")
@@ -64,10 +66,11 @@ class LintManager:
         else:
             self.pkgs = project_dir_list.split(',')
 
+        self.git_context = git_context or GitContext()
         if git:
             self.pkgs = self._get_packages_to_run()
 
-        self.configuration = configuration
+        self.configuration = configuration or Configuration()
         self.requirements_for_python3 = get_dev_requirements(3.7, self.configuration.envs_dirs_base, self.log_verbose)
         self.requirements_for_python2 = get_dev_requirements(2.7, self.configuration.envs_dirs_base, self.log_verbose)
         self.outfile = outfile
@@ -196,19 +199,17 @@ class LintManager:
         Returns:
             bool. True if there is a difference and False otherwise.
         """
-        # get the current branch name.
-        current_branch = run_command(f"git rev-parse --abbrev-ref HEAD")
-
         # This will return a list of all files that changed up until the last commit (not including any changes
         # which were made but not yet committed).
-        changes_from_last_commit_vs_master = run_command(f"git diff origin/master...{current_branch}")
+        changes_from_last_commit_vs_master = self.git_context.get_branch_changed_files('origin/master')
 
-        # This will check if any changes were made to the files in the package (pkg_dir) but are yet to be committed.
-        changes_since_last_commit = run_command(f"git diff --name-only -- {pkg_dir}")
+        # This will return a list of all files that were changed but are yet to be committed.
+        changes_since_last_commit = self.git_context.get_changed_files()
 
         # if the package is in the list of changed files or if any files within the package were changed
         # but not yet committed, return True
-        if pkg_dir in changes_from_last_commit_vs_master or len(changes_since_last_commit) > 0:
+        if any(pkg_dir in changed_file.path
+               for changed_file in changes_from_last_commit_vs_master + changes_since_last_commit):
             return True
 
         # if no changes were made to the package - return False.
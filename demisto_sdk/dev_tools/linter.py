@@ -1,7 +1,6 @@
 import os
 import io
 import sys
-import yaml
 import time
 import shutil
 import hashlib
@@ -10,6 +9,7 @@ import subprocess
 from datetime import datetime
 import requests
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.constants import Errors
 from demisto_sdk.yaml_tools.unifier import Unifier
 from demisto_sdk.common.configuration import Configuration
@@ -107,7 +107,7 @@ class Linter:
             return 1
         print_v('Using yaml file: {}'.format(yml_path))
         with open(yml_path, 'r') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_backend.safe_load(yml_file)
         script_obj = yml_data
         if isinstance(script_obj.get('script'), dict):
             script_obj = script_obj.get('script')
@@ -71,11 +71,10 @@ outputs:
   description: ''
   type: String
 """
-import yaml
 import json
 import sys
-import dateparser
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.tools import print_error, print_color, LOG_COLORS
 
 
@@ -119,6 +118,7 @@ def is_date(val):
     """
     Determines if val is Date, if yes returns True otherwise False
     """
+    import dateparser  # slow to import, so it is imported only when it is needed
     if isinstance(val, (int, float)) and val > 15737548065 and val < 2573754806500:
         # 15737548065 is the lowest timestamp that exist year - 1970
         # 2573754806500 is the year 2050 - I believe no json will contain date time over this time
@@ -178,7 +178,7 @@ def parse_json(data, command_name, prefix, verbose=False, interactive=False):
     if verbose:
         print(f'JSON before converting to YAML: {arg_json}')
 
-    yaml_output = yaml.safe_dump(
+    yaml_output = yaml_backend.safe_dump(
         {
             'name': command_name.lstrip('!'),
             'arguments': [],
@@ -1,26 +1,16 @@
 import os
 import sys
 import click
-from pkg_resources import get_distribution
 
 from demisto_sdk.core import DemistoSDK
-from demisto_sdk.runners.runner import Runner
-from demisto_sdk.common.tools import print_error
-from demisto_sdk.yaml_tools.format_module import format_manager
-from demisto_sdk.yaml_tools.unifier import Unifier
-from demisto_sdk.dev_tools.uploader import Uploader
-from demisto_sdk.dev_tools.initiator import Initiator
-from demisto_sdk.yaml_tools.extractor import Extractor
 from demisto_sdk.common.configuration import Configuration
-from demisto_sdk.dev_tools.lint_manager import LintManager
-from demisto_sdk.validation.secrets import SecretsValidator
-from demisto_sdk.runners.playbook_runner import PlaybookRunner
-from demisto_sdk.validation.file_validator import FilesValidator
-from demisto_sdk.yaml_tools.content_creator import ContentCreator
-from demisto_sdk.json_to_outputs.json_to_outputs import json_to_outputs
 from demisto_sdk.common.constants import SCRIPT_PREFIX, INTEGRATION_PREFIX
-from demisto_sdk.test_playbook_generator.test_playbook_generator import TestPlaybookGenerator
+from demisto_sdk.common.parse_cache import parsed_file_cache, get_sdk_version, DEFAULT_CACHE_DIR
+from demisto_sdk.common.remote_file_fetcher import remote_file_fetcher
+from demisto_sdk.common.docker_tag_resolver import docker_tag_resolver, DEFAULT_TTL
 
+# The modules implementing the commands (and the third party packages they use) are imported inside each command, so
+# that running a single command only pays for the imports it needs.
 
 pass_config = click.make_pass_decorator(DemistoSDK, ensure=True)
 
@@ -36,16 +26,35 @@ pass_config = click.make_pass_decorator(DemistoSDK, ensure=True)
     '-v', '--version', help='Get the demisto-sdk version.',
     is_flag=True, default=False, show_default=True
 )
+@click.option(
+    '--cache-dir', envvar='DEMISTO_SDK_CACHE_DIR', default=DEFAULT_CACHE_DIR, show_default=True,
+    help='The directory of the cache of parsed and fetched files, e.g. a directory saved as a CI artifact. '
+         'A directory that git tracks is not used. Can also be set with DEMISTO_SDK_CACHE_DIR.'
+)
+@click.option(
+    '--no-cache', help='Do not read or write the cache of parsed and fetched files.',
+    is_flag=True, default=False, show_default=True
+)
 @pass_config
-def main(config, version, env_dir):
+def main(config, version, env_dir, cache_dir, no_cache):
     config.configuration = Configuration()
     if version:
-        version = get_distribution('demisto-sdk').version
-        print(version)
+        print(get_sdk_version())
 
     if env_dir:
         config.configuration.env_dir = env_dir
 
+    if no_cache:
+        config.cache_dir = None
+        parsed_file_cache.disable_disk_cache()
+        remote_file_fetcher.disable_disk_cache()
+        docker_tag_resolver.disable_disk_cache()
+    else:
+        config.cache_dir = os.path.abspath(cache_dir)
+        parsed_file_cache.enable_disk_cache(config.cache_dir)
+        remote_file_fetcher.enable_disk_cache(config.cache_dir)
+        docker_tag_resolver.enable_disk_cache(config.cache_dir)
+
 
 # ====================== extract ====================== #
 @main.command(name="split-yml",
@@ -85,6 +94,7 @@ def main(config, version, env_dir):
 )
 @pass_config
 def extract(config, **kwargs):
+    from demisto_sdk.yaml_tools.extractor import Extractor
     extractor = Extractor(configuration=config.configuration, **kwargs)
     return extractor.extract_to_package_format()
 
@@ -125,6 +135,7 @@ def extract(config, **kwargs):
 )
 @pass_config
 def extract_code(config, **kwargs):
+    from demisto_sdk.yaml_tools.extractor import Extractor
     extractor = Extractor(configuration=config.configuration, **kwargs)
     return extractor.extract_code(kwargs['outfile'])
 
@@ -142,6 +153,7 @@ def extract_code(config, **kwargs):
     "-o", "--outdir", help="The output dir to write the unified yml to", required=True
 )
 def unify(**kwargs):
+    from demisto_sdk.yaml_tools.unifier import Unifier
     unifier = Unifier(**kwargs)
     return unifier.merge_script_package_to_yml()
 
@@ -175,8 +187,35 @@ def unify(**kwargs):
 @click.option(
     '-p', '--path', help='Path of file to validate specifically.'
 )
+@click.option(
+    '-v', '--verbose', is_flag=True, default=False, show_default=True,
+    help='Report the checks that were run, the cost of their inputs and the latency of the files fetched from the '
+         'remote content repository.')
+@click.option(
+    '--jobs', type=int, default=1, show_default=True,
+    help='The number of processes to validate the files in.')
+@click.option(
+    '--only', help='Comma separated names of the checks to run on the changed files, e.g. structure,playbook.')
+@click.option(
+    '--skip', help='Comma separated names of the checks not to run on the changed files, e.g. '
+                   'integration-docker-image.')
+@click.option(
+    '--rebuild-cache', is_flag=True, default=False, show_default=True,
+    help='Validate all the files again instead of replaying the verdicts of unchanged files from the cache, and '
+         'replace the cached verdicts.')
+@click.option(
+    '--docker-tags-ttl', type=int, default=DEFAULT_TTL, show_default=True,
+    help='The number of seconds the latest docker image tags are cached for.')
+@click.option(
+    '--docker-offline', is_flag=True, default=False, show_default=True,
+    help='Check the docker images against the latest tags cached by previous runs, however old they are, instead '
+         'of querying docker hub.')
 @pass_config
 def validate(config, **kwargs):
+    from demisto_sdk.common.tools import print_error
+    from demisto_sdk.common.verdict_cache import VerdictCache
+    from demisto_sdk.validation.file_validator import FilesValidator
+    from demisto_sdk.validation.validator_registry import select_checks
     sys.path.append(config.configuration.env_dir)
 
     file_path = kwargs['path']
@@ -184,13 +223,31 @@ def validate(config, **kwargs):
     if file_path and not os.path.isfile(file_path):
         print_error(F'File {file_path} was not found')
         return 1
-    else:
-        validator = FilesValidator(configuration=config.configuration,
-                                   is_backward_check=not kwargs['no_backward_comp'],
-                                   is_circle=kwargs['post_commit'], prev_ver=kwargs['prev_ver'],
-                                   validate_conf_json=kwargs['conf_json'], use_git=kwargs['use_git'],
-                                   file_path=kwargs.get('path'))
-        return validator.run()
+
+    only_checks = kwargs['only'].split(',') if kwargs['only'] else None
+    skipped_checks = kwargs['skip'].split(',') if kwargs['skip'] else None
+    try:
+        select_checks(only_checks, skipped_checks)
+    except ValueError as err:
+        print_error(str(err))
+        return 1
+
+    docker_tag_resolver.ttl = kwargs['docker_tags_ttl']
+    docker_tag_resolver.offline = kwargs['docker_offline']
+
+    validator = FilesValidator(configuration=config.configuration,
+                               is_backward_check=not kwargs['no_backward_comp'],
+                               is_circle=kwargs['post_commit'], prev_ver=kwargs['prev_ver'],
+                               validate_conf_json=kwargs['conf_json'], use_git=kwargs['use_git'],
+                               file_path=kwargs.get('path'), jobs=kwargs['jobs'],
+                               verdict_cache=VerdictCache(config.cache_dir, rebuild=kwargs['rebuild_cache'])
+                               if config.cache_dir else None,
+                               only_checks=only_checks, skipped_checks=skipped_checks)
+    result = validator.run()
+    if kwargs['verbose']:
+        print(validator.check_stats.get_report())
+        print(remote_file_fetcher.get_latency_report())
+    return result
 
 
 # ====================== create ====================== #
@@ -209,6 +266,7 @@ def validate(config, **kwargs):
     '-p', '--preserve_bundles', is_flag=True, default=False, show_default=True,
     help='Keep the bundles created in the process of making the content artifacts')
 def create(**kwargs):
+    from demisto_sdk.yaml_tools.content_creator import ContentCreator
     content_creator = ContentCreator(**kwargs)
     return content_creator.run()
 
@@ -234,11 +292,44 @@ def create(**kwargs):
 @click.option(
     '-wl', '--whitelist', default='./Tests/secrets_white_list.json', show_default=True,
     help='Full path to whitelist file, file name should be "secrets_white_list.json"')
+@click.option(
+    '-j', '--jobs', type=int, default=1, show_default=True,
+    help='The number of processes to scan the files in.')
+@click.option(
+    '--max-file-size', type=float, default=10, show_default=True,
+    help='The size in MB of the largest file to scan, larger files are reported for a manual review. 0 for no limit.')
+@click.option(
+    '--file-time-budget', type=float, default=60, show_default=True,
+    help='The number of seconds a file is scanned for, files which take longer are reported for a manual review. '
+         '0 for no limit.')
+@click.option(
+    '--extraction-memory-limit', type=float, default=1024, show_default=True,
+    help='The memory in MB the text of a pdf file or an integration README is extracted in, files which need more '
+         'are reported for a manual review. 0 for no limit.')
+@click.option(
+    '-a', '--all', 'scan_all', is_flag=True, default=False, show_default=True,
+    help='Scan all the files of HEAD instead of the changed files.')
+@click.option(
+    '--since', help='Scan every version of the files committed since this revision (e.g. a tag) instead of the '
+                    'changed files.')
+@click.option(
+    '--diff-only', is_flag=True, default=False, show_default=True,
+    help='Scan only the lines the changes add to the changed files instead of the whole files.')
 @pass_config
 def secrets(config, **kwargs):
+    from demisto_sdk.common.secrets_cache import SecretsCache
+    from demisto_sdk.common.text_extractor import TextExtractor
+    from demisto_sdk.validation.secrets import SecretsValidator
     sys.path.append(config.configuration.env_dir)
+    text_extractor = TextExtractor(processes=kwargs['jobs'], timeout=kwargs['file_time_budget'],
+                                   memory_limit=kwargs['extraction_memory_limit'], cache_dir=config.cache_dir)
     secrets = SecretsValidator(configuration=config.configuration, is_circle=kwargs['post_commit'],
-                               ignore_entropy=kwargs['ignore_entropy'], white_list_path=kwargs['whitelist'])
+                               ignore_entropy=kwargs['ignore_entropy'], white_list_path=kwargs['whitelist'],
+                               jobs=kwargs['jobs'], max_file_size=kwargs['max_file_size'],
+                               file_time_budget=kwargs['file_time_budget'], scan_all=kwargs['scan_all'],
+                               since=kwargs['since'], diff_only=kwargs['diff_only'],
+                               secrets_cache=SecretsCache(config.cache_dir) if config.cache_dir else None,
+                               text_extractor=text_extractor)
     return secrets.run()
 
 
@@ -286,6 +377,7 @@ def secrets(config, **kwargs):
 )
 @pass_config
 def lint(config, dir, **kwargs):
+    from demisto_sdk.dev_tools.lint_manager import LintManager
     linter = LintManager(configuration=config.configuration, project_dir_list=dir, **kwargs)
     return linter.run_dev_packages()
 
@@ -308,6 +400,7 @@ def lint(config, dir, **kwargs):
     default=False, help='Format changed files using git'
                         '- this will format your branch changes and will run only on them.')
 def format_yml(use_git=False, file_type=None, **kwargs):
+    from demisto_sdk.yaml_tools.format_module import format_manager
     return format_manager(use_git, file_type, **kwargs)
 
 
@@ -325,6 +418,7 @@ def format_yml(use_git=False, file_type=None, **kwargs):
 @click.option(
     "-v", "--verbose", help="Verbose output", is_flag=True)
 def upload(**kwargs):
+    from demisto_sdk.dev_tools.uploader import Uploader
     uploader = Uploader(**kwargs)
     return uploader.upload()
 
@@ -349,6 +443,7 @@ def upload(**kwargs):
     "--debug-path", help="The path to save the debug file at, if not specified the debug file will be printed to the "
                          "terminal")
 def run(**kwargs):
+    from demisto_sdk.runners.runner import Runner
     runner = Runner(**kwargs)
     return runner.run()
 
@@ -382,6 +477,7 @@ def run(**kwargs):
     help="Timeout for the command. The playbook will continue to run in Demisto"
 )
 def run_playbook(**kwargs):
+    from demisto_sdk.runners.playbook_runner import PlaybookRunner
     playbook_runner = PlaybookRunner(**kwargs)
     return playbook_runner.run_playbook()
 
@@ -409,6 +505,7 @@ file/UI/PyCharm. This script auto generates the YAML for a command from the JSON
     "--interactive", help="If passed, then for each output field will ask user interactively to enter the "
                           "description. By default is interactive mode is disabled", is_flag=True)
 def json_to_outputs_command(**kwargs):
+    from demisto_sdk.json_to_outputs.json_to_outputs import json_to_outputs
     json_to_outputs(**kwargs)
 
 
@@ -442,6 +539,7 @@ def json_to_outputs_command(**kwargs):
 @click.option(
     "-v", "--verbose", help="Verbose output for debug purposes - shows full exception stack trace", is_flag=True)
 def generate_test_playbook(**kwargs):
+    from demisto_sdk.test_playbook_generator.test_playbook_generator import TestPlaybookGenerator
     generator = TestPlaybookGenerator(**kwargs)
     generator.run()
 
@@ -469,12 +567,13 @@ def generate_test_playbook(**kwargs):
     '--script', is_flag=True, help="Create a script based on HelloWorldScript example")
 @click.option("--pack", is_flag=True, help="Create pack and its sub directories")
 def init(**kwargs):
+    from demisto_sdk.dev_tools.initiator import Initiator
     initiator = Initiator(**kwargs)
     initiator.init()
     return 0
 
 
-@main.resultcallback()
+@main.result_callback()
 def exit_from_program(result=0, **kwargs):
     sys.exit(result)
 
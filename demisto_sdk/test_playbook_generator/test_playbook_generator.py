@@ -1,8 +1,8 @@
 import os
 import json
 from typing import Dict
-from ruamel.yaml import YAML
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.tools import print_error, print_color, LOG_COLORS
 
 
@@ -294,8 +294,7 @@ class TestPlaybookGenerator:
                 print_error(f'Directory not exist: {self.outdir}')
                 return
 
-        ryaml = YAML()
-        ryaml.preserve_quotes = True
+        ryaml = yaml_backend.round_trip_yaml()
         try:
             with open(self.integration_yml_path, 'r') as yf:
                 yaml_obj = ryaml.load(yf)
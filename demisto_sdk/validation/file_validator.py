@@ -11,8 +11,12 @@ for that task.
 """
 from __future__ import print_function
 
+import io
 import os
+import glob
 import re
+import sys
+from contextlib import redirect_stdout
 
 from demisto_sdk.common.hook_validations.pack_unique_files import PackUniqueFilesValidator
 from demisto_sdk.common.configuration import Configuration
@@ -23,20 +27,20 @@ from demisto_sdk.common.constants import CODE_FILES_REGEX, OLD_YML_FORMAT_FILE,
     PACKS_DIR, PACKS_DIRECTORIES, Errors, PLAYBOOKS_REGEXES_LIST, JSON_INDICATOR_AND_INCIDENT_FIELDS, PLAYBOOK_REGEX, \
     JSON_ALL_LAYOUT_REGEXES, REPUTATION_REGEX, CHECKED_TYPES_REGEXES
 from demisto_sdk.common.hook_validations.conf_json import ConfJsonValidator
-from demisto_sdk.common.hook_validations.description import DescriptionValidator
 from demisto_sdk.common.hook_validations.id import IDSetValidator
-from demisto_sdk.common.hook_validations.image import ImageValidator
-from demisto_sdk.common.hook_validations.incident_field import IncidentFieldValidator
-from demisto_sdk.common.hook_validations.integration import IntegrationValidator
-from demisto_sdk.common.hook_validations.script import ScriptValidator
 from demisto_sdk.common.hook_validations.structure import StructureValidator
-from demisto_sdk.common.hook_validations.playbook import PlaybookValidator
-from demisto_sdk.common.hook_validations.layout import LayoutValidator
-
-from demisto_sdk.common.tools import checked_type, run_command, print_error, print_warning, print_color, \
+from demisto_sdk.common.content_entity import get_content_entity
+from demisto_sdk.common.docker_tag_resolver import docker_tag_resolver, get_image_name
+from demisto_sdk.common.git_context import GitContext
+from demisto_sdk.common.old_file_provider import GitOldFileProvider
+from demisto_sdk.common.parallel import run_in_workers
+from demisto_sdk.common.path_classifier import path_classifier
+from demisto_sdk.common.verdict_cache import Verdict
+from demisto_sdk.validation.validator_registry import CHECKS, CheckStats, FileInputs, select_checks
+
+from demisto_sdk.common.tools import checked_type, print_error, print_warning, print_color, \
     LOG_COLORS, get_yaml, filter_packagify_changes, get_pack_name, is_file_path_in_pack, \
     get_yml_paths_in_dir
-from demisto_sdk.yaml_tools.unifier import Unifier
 from demisto_sdk.common.hook_validations.release_notes import ReleaseNotesValidator
 
 
@@ -55,12 +59,21 @@ class FilesValidator:
         validate_id_set (bool): Whether to validate id_set or not.
         file_path (string): If validating a specific file, golds it's path.
         configuration (Configuration): Configurations for IDSetValidator.
+        git_context (GitContext): The git queries of the run.
+        old_file_provider (OldFileProvider): Gets the old version of files for the backwards compatibility checks.
+        jobs (int): The number of processes to validate the files in, 1 validates them in the current process.
+        verdict_cache (VerdictCache): The verdicts of earlier runs of all files validation, None to validate all files.
+        only_checks (list): The names of the checks to run on changed files, None to run all of them.
+        skipped_checks (list): The names of the checks not to run on changed files.
+        check_stats (CheckStats): The counts of the checks that were run and of the inputs they needed.
     """
 
     def __init__(self, is_backward_check=True, prev_ver='origin/master', use_git=False, is_circle=False,
                  print_ignored_files=False, validate_conf_json=True, validate_id_set=False, file_path=None,
-                 configuration=Configuration()):
+                 configuration=None, git_context=None, old_file_provider=None, jobs=1, verdict_cache=None,
+                 only_checks=None, skipped_checks=None):
         self.branch_name = ''
+        self.git_context = git_context or GitContext()
         self.use_git = use_git
         if self.use_git:
             print('Using git')
@@ -72,34 +85,90 @@ class FilesValidator:
             # validate against master if no version was provided
             self.prev_ver = 'origin/master'
 
+        self.old_file_provider = old_file_provider or GitOldFileProvider(self.prev_ver, self.git_context)
+
         self._is_valid = True
-        self.configuration = configuration
+        self.configuration = configuration or Configuration()
         self.is_backward_check = is_backward_check
         self.is_circle = is_circle
         self.print_ignored_files = print_ignored_files
         self.validate_conf_json = validate_conf_json
         self.validate_id_set = validate_id_set
         self.file_path = file_path
+        self.jobs = max(1, jobs or 1)
+        self.verdict_cache = verdict_cache
 
-        if self.validate_conf_json:
-            self.conf_json_validator = ConfJsonValidator()
-        if self.validate_id_set:
-            self.id_set_validator = IDSetValidator(is_circle=self.is_circle, configuration=self.configuration)
+        self.only_checks = only_checks
+        self.skipped_checks = skipped_checks
+        self.selected_checks = select_checks(only_checks, skipped_checks)
+        self.check_stats = CheckStats()
+        # The id_set and conf.json are loaded by the first check that needs them
+        self._id_set_validator = None
+        self._conf_json_validator = None
 
     def run(self):
         print_color('Starting validating files structure', LOG_COLORS.GREEN)
-        if self.is_valid_structure():
+        try:
+            is_valid_structure = self.is_valid_structure()
+        finally:
+            self.old_file_provider.close()
+        if is_valid_structure:
             print_color('The files are valid', LOG_COLORS.GREEN)
             return 0
         else:
             print_color('The files were found as invalid, the exact error message can be located above', LOG_COLORS.RED)
             return 1
 
-    @staticmethod
-    def get_current_working_branch():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        return branch_name_reg.group(1)
+    def run_validations(self, validations):
+        """Runs validations of files, in worker processes if jobs > 1.
+
+        The output of the validations is printed in their order, and an error raised by one of them is raised
+        after the output of the validations that precede it, as if they were run one after the other.
+
+        Args:
+            validations (iterable): Tuples of the name of a validation method and its arguments.
+
+        Returns:
+            bool. Whether all the validations passed.
+        """
+        validations = list(validations)
+        is_valid = True
+        if self.jobs == 1 or len(validations) < 2:
+            for method_name, *args in validations:
+                if not getattr(self, method_name)(*args):
+                    is_valid = False
+            return is_valid
+
+        # the workers use the docker tags the parent resolved, and its resolver settings, however they were started
+        worker_args = (self.get_worker_kwargs(), docker_tag_resolver.get_state())
+        for is_valid_validation, check_stats in run_in_workers(validations, self.jobs, _create_worker_validator,
+                                                               worker_args, _run_validation):
+            self.check_stats.merge(check_stats)
+            if not is_valid_validation:
+                is_valid = False
+
+        return is_valid
+
+    def get_worker_kwargs(self):
+        """Gets the arguments of the FilesValidator of a worker process, which validates single files."""
+        return {
+            'is_backward_check': self.is_backward_check,
+            'prev_ver': self.prev_ver,
+            'is_circle': self.is_circle,
+            'print_ignored_files': self.print_ignored_files,
+            'validate_conf_json': False,
+            'validate_id_set': self.validate_id_set,
+            'file_path': self.file_path,
+            'configuration': self.configuration,
+            'git_context': self.git_context,
+            'old_file_provider': self.old_file_provider,
+            'verdict_cache': self.verdict_cache,
+            'only_checks': self.only_checks,
+            'skipped_checks': self.skipped_checks,
+        }
+
+    def get_current_working_branch(self):
+        return self.git_context.branch
 
     @staticmethod
     def get_modified_files(files_string, tag='master', print_ignored_files=False):
@@ -183,10 +252,9 @@ class FilesValidator:
         # Two dots is the default in git diff, it will compare with the last known commit as the base
         # Three dots will compare with the last known shared commit as the base
         compare_type = '.' if 'master' in tag else ''
-        all_changed_files_string = run_command(
-            'git diff --name-status {tag}..{compare_type}refs/heads/{branch}'.format(tag=tag,
-                                                                                     branch=self.branch_name,
-                                                                                     compare_type=compare_type))
+        all_changed_files_string = self.git_context.get_name_status(
+            '{tag}..{compare_type}refs/heads/{branch}'.format(tag=tag, branch=self.branch_name,
+                                                              compare_type=compare_type))
 
         modified_files, added_files, _, old_format_files = self.get_modified_files(
             all_changed_files_string,
@@ -194,11 +262,11 @@ class FilesValidator:
             print_ignored_files=self.print_ignored_files)
 
         if not self.is_circle:
-            files_string = run_command('git diff --name-status --no-merges HEAD')
+            files_string = self.git_context.get_name_status('--no-merges', 'HEAD')
             nc_modified_files, nc_added_files, nc_deleted_files, nc_old_format_files = self.get_modified_files(
                 files_string, print_ignored_files=self.print_ignored_files)
 
-            all_changed_files_string = run_command('git diff --name-status {}'.format(tag))
+            all_changed_files_string = self.git_context.get_name_status(tag)
             modified_files_from_tag, added_files_from_tag, _, _ = \
                 self.get_modified_files(all_changed_files_string,
                                         print_ignored_files=self.print_ignored_files)
@@ -240,9 +308,46 @@ class FilesValidator:
         return packs
 
     def is_valid_release_notes(self, file_path):
-        release_notes_validator = ReleaseNotesValidator(file_path)
-        if not release_notes_validator.is_file_valid():
-            self._is_valid = False
+        release_notes_validator = ReleaseNotesValidator(file_path, git_context=self.git_context)
+        return release_notes_validator.is_file_valid()
+
+    def run_checks(self, file_inputs, checks):
+        """Runs the selected checks of a file.
+
+        Args:
+            file_inputs (FileInputs): The inputs of the file, shared by its checks.
+            checks (list): The names of the checks of the file, in the order they are run.
+
+        Returns:
+            bool. Whether the file passed all the checks that were run.
+        """
+        is_valid = True
+        for name in checks:
+            check = CHECKS[name]
+            if check.is_backward_check and not self.is_backward_check:
+                continue
+
+            if name not in self.selected_checks:
+                self.check_stats.skipped_checks[name] = self.check_stats.skipped_checks.get(name, 0) + 1
+                continue
+
+            self.check_stats.run_checks[name] = self.check_stats.run_checks.get(name, 0) + 1
+            if not check.function(file_inputs):
+                is_valid = False
+
+        return is_valid
+
+    @property
+    def id_set_validator(self):
+        if self._id_set_validator is None:
+            self._id_set_validator = IDSetValidator(is_circle=self.is_circle, configuration=self.configuration)
+        return self._id_set_validator
+
+    @property
+    def conf_json_validator(self):
+        if self._conf_json_validator is None:
+            self._conf_json_validator = ConfJsonValidator()
+        return self._conf_json_validator
 
     def validate_modified_files(self, modified_files):  # noqa: C901
         """Validate the modified files from your branch.
@@ -252,114 +357,123 @@ class FilesValidator:
         Args:
             modified_files (set): A set of the modified files in the current branch.
         """
-        for file_path in modified_files:
-            old_file_path = None
-            if isinstance(file_path, tuple):
-                old_file_path, file_path = file_path
-
-            print('Validating {}'.format(file_path))
-            if not checked_type(file_path):
-                print_warning('- Skipping validation of non-content entity file.')
-                continue
+        # the old version of renamed files is taken from their old path
+        old_file_paths = [file_path[0] if isinstance(file_path, tuple) else file_path for file_path in modified_files]
+        self.old_file_provider.prefetch(old_file_path for old_file_path in old_file_paths
+                                        if old_file_path.endswith(('.yml', '.json')))
+        self.prefetch_docker_tags(file_path[1] if isinstance(file_path, tuple) else file_path
+                                  for file_path in modified_files)
+        if not self.run_validations(('validate_modified_file', file_path) for file_path in modified_files):
+            self._is_valid = False
+
+    def prefetch_docker_tags(self, file_paths, is_added=False):
+        """Resolves the latest tags of the docker images of changed integrations and scripts concurrently.
+
+        Every image is resolved once, before the files are validated (and before the worker processes start), so the
+        docker image checks of the files do not query docker hub.
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+        Args:
+            file_paths (iterable): The paths of the changed files.
+            is_added (bool): Whether the files were added. The docker image of added scripts is not checked.
+        """
+        checked_entity_types = set()
+        if 'integration-docker-image' in self.selected_checks:
+            checked_entity_types.add('integration')
+        if 'script-docker-image' in self.selected_checks and self.is_backward_check and not is_added:
+            checked_entity_types.add('script')
+
+        image_names = set()
+        for file_path in file_paths:
+            path_info = path_classifier.classify(file_path)
+            if path_info.entity_type not in checked_entity_types:
                 continue
+            yml_paths = [file_path] if path_info.schema else glob.glob(os.path.join(path_info.package_root, '*.yml'))
+            for yml_path in yml_paths:
+                try:
+                    yml_data = get_content_entity(yml_path).data
+                except Exception:
+                    # the file is reported by its validation
+                    continue
+                script = yml_data.get('script')
+                docker_image = script.get('dockerimage', '') if isinstance(script, dict) else \
+                    yml_data.get('dockerimage', '')
+                image_names.add(get_image_name(docker_image))
+        # images which are not of demisto format are reported by the check
+        docker_tag_resolver.resolve(image_name for image_name in image_names if image_name)
+
+    def validate_modified_file(self, file_path):  # noqa: C901
+        """Validate a modified file.
 
-            structure_validator = StructureValidator(file_path, old_file_path)
-            if not structure_validator.is_valid_file():
-                self._is_valid = False
+        Args:
+            file_path (str|tuple): The path of the file, or a tuple of its old and new paths if it was renamed.
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if self.is_backward_check and not integration_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not integration_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif checked_type(file_path, [SCRIPT_REGEX]):
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook(is_new_playbook=False):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file():
-                    self._is_valid = False
-                if self.is_backward_check and not incident_field_validator.is_backward_compatible():
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout():
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, [REPUTATION_REGEX]):
-                print_color(
-                    F'Skipping validation for file {file_path} since no validation is currently defined.',
-                    LOG_COLORS.YELLOW)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+        Returns:
+            bool. Whether the file is valid.
+        """
+        old_file_path = None
+        if isinstance(file_path, tuple):
+            old_file_path, file_path = file_path
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
-                self._is_valid = False
+        print('Validating {}'.format(file_path))
+        if not checked_type(file_path):
+            print_warning('- Skipping validation of non-content entity file.')
+            return True
+
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            return True
+
+        file_inputs = FileInputs(self, file_path, old_file_path, stats=self.check_stats)
+        is_valid = self.run_checks(file_inputs, ['structure'])
+
+        if self.validate_id_set:
+            checks = ['id-set']
+
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES):
+            checks = ['image', 'description', 'integration-backward-compatibility', 'integration',
+                      'integration-docker-image']
+
+        elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
+            checks = ['image', 'beta-description', 'beta-integration']
+
+        elif checked_type(file_path, [SCRIPT_REGEX]):
+            checks = ['script-backward-compatibility', 'script-docker-image', 'script']
+
+        elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
+            checks = ['playbook']
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
+            file_inputs.is_package = True
+            checks = ['script-backward-compatibility', 'script-docker-image', 'script']
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            checks = ['image']
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
+            checks = ['incident-field', 'incident-field-backward-compatibility']
+
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
+            checks = ['layout']
+
+        elif 'CHANGELOG' in file_path:
+            checks = ['release-notes']
+
+        elif checked_type(file_path, [REPUTATION_REGEX]):
+            print_color(
+                F'Skipping validation for file {file_path} since no validation is currently defined.',
+                LOG_COLORS.YELLOW)
+            checks = []
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            checks = []
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            return False
+
+        return self.run_checks(file_inputs, checks) and is_valid
 
     def validate_added_files(self, added_files):  # noqa: C901
         """Validate the added files from your branch.
@@ -369,93 +483,73 @@ class FilesValidator:
         Args:
             added_files (set): A set of the modified files in the current branch.
         """
-        for file_path in added_files:
-            print('Validating {}'.format(file_path))
+        self.prefetch_docker_tags(added_files, is_added=True)
+        if not self.run_validations(('validate_added_file', file_path) for file_path in added_files):
+            self._is_valid = False
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                continue
+    def validate_added_file(self, file_path):  # noqa: C901
+        """Validate an added file.
 
-            structure_validator = StructureValidator(file_path)
-            if not structure_validator.is_valid_file():
-                self._is_valid = False
+        Args:
+            file_path (str): The path of the file.
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-                if self.id_set_validator.is_file_has_used_id(file_path):
-                    self._is_valid = False
-
-            elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_file(validate_rn=False):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-
-                if not script_validator.is_valid_file(validate_rn=False):
-                    self._is_valid = False
-
-            elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout():
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, [REPUTATION_REGEX]):
-                print_color(
-                    F'Skipping validation for file {file_path} since no validation is currently defined.',
-                    LOG_COLORS.YELLOW)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+        Returns:
+            bool. Whether the file is valid.
+        """
+        print('Validating {}'.format(file_path))
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("validate command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
-                self._is_valid = False
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            return True
+
+        file_inputs = FileInputs(self, file_path, is_added=True, stats=self.check_stats)
+        is_valid = self.run_checks(file_inputs, ['structure'])
+
+        if self.validate_id_set:
+            checks = ['id-set', 'id-set-used-id']
+
+        elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            checks = ['playbook']
+
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES):
+            checks = ['image', 'description', 'integration', 'integration-docker-image']
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
+            file_inputs.is_package = True
+            checks = ['script']
+
+        elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
+                re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
+            checks = ['beta-description', 'beta-integration']
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            checks = ['image']
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
+            checks = ['incident-field']
+
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
+            checks = ['layout']
+
+        elif 'CHANGELOG' in file_path:
+            checks = ['release-notes']
+
+        elif checked_type(file_path, [REPUTATION_REGEX]):
+            print_color(
+                F'Skipping validation for file {file_path} since no validation is currently defined.',
+                LOG_COLORS.YELLOW)
+            checks = []
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            checks = []
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("validate command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            return False
+
+        return self.run_checks(file_inputs, checks) and is_valid
 
     def validate_no_old_format(self, old_format_files):
         """ Validate there are no files in the old format(unified yml file for the code and configuration).
@@ -503,6 +597,19 @@ class FilesValidator:
 
     def validate_all_files(self):
         """Validate all files in the repo are in the right format."""
+        if self.verdict_cache is not None:
+            self.verdict_cache.start_run()
+
+        if not self.run_validations(self.get_all_files_validations()):
+            self._is_valid = False
+
+        if self.verdict_cache is not None:
+            # The verdicts of files that no longer exist or changed
+            self.verdict_cache.prune()
+
+    @staticmethod
+    def get_all_files_validations():
+        """Gets the validations of all files in the repo, in the order they are run and reported."""
         # go over packs
         for root, dirs, _ in os.walk(PACKS_DIR):
             for dir_in_dirs in dirs:
@@ -513,17 +620,11 @@ class FilesValidator:
                                 continue
 
                             project_dir = os.path.join(inner_root, inner_dir)
-                            _, file_path = get_yml_paths_in_dir(os.path.normpath(project_dir),
-                                                                Errors.no_yml_file(project_dir))
-                            if file_path:
-                                print("Validating {}".format(file_path))
-                                structure_validator = StructureValidator(file_path)
-                                if not structure_validator.is_valid_scheme():
-                                    self._is_valid = False
+                            yield 'validate_package_scheme', project_dir, os.path.normpath(project_dir)
 
         # go over regular content entities
         for directory in DIR_LIST_FOR_REGULAR_ENTETIES:
-            print_color('Validating {} directory:'.format(directory), LOG_COLORS.GREEN)
+            yield 'print_directory_header', directory
             for root, dirs, files in os.walk(directory):
                 for file_name in files:
                     file_path = os.path.join(root, file_name)
@@ -531,10 +632,7 @@ class FilesValidator:
                     if not file_name.endswith('.yml'):
                         continue
 
-                    print('Validating ' + file_name)
-                    structure_validator = StructureValidator(file_path)
-                    if not structure_validator.is_valid_scheme():
-                        self._is_valid = False
+                    yield 'validate_file_scheme', file_path, file_name
 
         # go over regular PACKAGE_SUPPORTING_DIRECTORIES entities
         for directory in PACKAGE_SUPPORTING_DIRECTORIES:
@@ -544,12 +642,63 @@ class FilesValidator:
                         continue
 
                     project_dir = os.path.join(root, inner_dir)
-                    _, file_path = get_yml_paths_in_dir(project_dir, Errors.no_yml_file(project_dir))
-                    if file_path:
-                        print('Validating ' + file_path)
-                        structure_validator = StructureValidator(file_path)
-                        if not structure_validator.is_valid_scheme():
-                            self._is_valid = False
+                    yield 'validate_package_scheme', project_dir, project_dir
+
+    @staticmethod
+    def print_directory_header(directory):
+        print_color('Validating {} directory:'.format(directory), LOG_COLORS.GREEN)
+        return True
+
+    def validate_package_scheme(self, project_dir, yml_dir):
+        """Validate the scheme of the yml file of a package.
+
+        Args:
+            project_dir (str): The package directory.
+            yml_dir (str): The directory to look for the yml file in.
+
+        Returns:
+            bool. Whether the yml file is valid, True if there is none.
+        """
+        _, file_path = get_yml_paths_in_dir(yml_dir, Errors.no_yml_file(project_dir))
+        if not file_path:
+            return True
+
+        return self.validate_file_scheme(file_path, file_path)
+
+    def validate_file_scheme(self, file_path, display_name):
+        """Validate the scheme of a file.
+
+        Args:
+            file_path (str): The path of the file.
+            display_name (str): The name of the file in the output.
+
+        Returns:
+            bool. Whether the file is valid.
+        """
+        print('Validating ' + display_name)
+        if self.verdict_cache is None:
+            return self.is_valid_file_scheme(file_path)
+
+        entry_path = self.verdict_cache.get_entry_path(file_path)
+        verdict = self.verdict_cache.get(entry_path)
+        if verdict is not None:
+            sys.stdout.write(verdict.output)
+            return verdict.is_valid
+
+        output = io.StringIO()
+        try:
+            with redirect_stdout(output):
+                is_valid = self.is_valid_file_scheme(file_path)
+        finally:
+            sys.stdout.write(output.getvalue())
+
+        self.verdict_cache.set(entry_path, Verdict(is_valid, output.getvalue()))
+        return is_valid
+
+    def is_valid_file_scheme(self, file_path):
+        structure_validator = StructureValidator(file_path, git_context=self.git_context,
+                                                 old_file_provider=self.old_file_provider)
+        return structure_validator.is_valid_scheme()
 
     def is_valid_structure(self):
         """Check if the structure is valid for the case we are in, master - all files, branch - changed files.
@@ -558,7 +707,8 @@ class FilesValidator:
             (bool). Whether the structure is valid or not.
         """
         if self.validate_conf_json:
-            if not self.conf_json_validator.is_valid_conf_json():
+            conf_json_inputs = FileInputs(self, ConfJsonValidator.CONF_PATH, stats=self.check_stats)
+            if not self.run_checks(conf_json_inputs, ['conf-json']):
                 self._is_valid = False
         if self.use_git:
             if self.branch_name != 'master' and (not self.branch_name.startswith('19.') and
@@ -614,3 +764,36 @@ class FilesValidator:
             return True
 
         return False
+
+
+def _create_worker_validator(validator_kwargs, docker_tag_resolver_state):
+    """Creates the FilesValidator of a worker process.
+
+    Args:
+        validator_kwargs (dict): The arguments of the FilesValidator.
+        docker_tag_resolver_state (dict): The state of the docker tag resolver of the parent process, its settings and
+            the tags it resolved.
+
+    Returns:
+        FilesValidator. The validator of the worker.
+    """
+    docker_tag_resolver.set_state(docker_tag_resolver_state)
+    return FilesValidator(**validator_kwargs)
+
+
+def _run_validation(files_validator, validation):
+    """Runs a validation in a worker process.
+
+    Args:
+        files_validator (FilesValidator): The validator of the worker.
+        validation (tuple): The name of a FilesValidator validation method and its arguments.
+
+    Returns:
+        (bool, CheckStats). Whether the validation passed and the stats of the checks it ran.
+    """
+    method_name, *args = validation
+    try:
+        is_valid = getattr(files_validator, method_name)(*args)
+    finally:
+        check_stats, files_validator.check_stats = files_validator.check_stats, CheckStats()
+    return bool(is_valid), check_stats
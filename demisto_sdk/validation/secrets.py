@@ -1,22 +1,42 @@
+import hashlib
 import io
 import os
 import math
 import json
 import string
-import PyPDF2
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
 from demisto_sdk.common.constants import re, REQUIRED_YML_FILE_TYPES, PACKS_DIR, PACKS_WHITELIST_FILE_NAME, \
     INTEGRATION_README_REGEX, EXTERNAL_PR_REGEX
-from demisto_sdk.common.tools import run_command, print_error, print_color, LOG_COLORS, checked_type, \
+from demisto_sdk.common.tools import print_error, print_color, print_warning, LOG_COLORS, checked_type, \
     is_file_path_in_pack, get_pack_name
 
 # secrets settings
 # Entropy score is determined by shanon's entropy algorithm, most English words will score between 1.5 and 3.5
 from demisto_sdk.common.configuration import Configuration
+from demisto_sdk.common.git_context import BlobReader, GitContext, get_added_line_numbers
+from demisto_sdk.common.parallel import run_in_workers
+from demisto_sdk.common.substring_matcher import SubstringMatcher, SubstringSet
+from demisto_sdk.common.text_extractor import TextExtractor, extract_text_from_pdf, extract_text_from_md_html
 
 ENTROPY_THRESHOLD = 4.0
+# The entropy counts only printable characters, summed in this order
+PRINTABLE_CHARACTERS_ORDER = {char: index for index, char in enumerate(string.printable)}
+# Batches of fewer strings are scored in Python, numpy does not pay off for them
+NUMPY_MIN_BATCH = 64
+NUMPY_CHUNK_SIZE = 4096
+# numpy scores within this distance of the threshold are computed again in Python, whose sum order they do not keep
+ENTROPY_EPSILON = 1e-9
+# The candidate strings of a file are scored in batches of this size, so a large file does not keep all its strings
+ENTROPY_BATCH_SIZE = 100000
+# Files larger than this (in MB), or whose scan takes longer than this (in seconds), are left for a manual review
+DEFAULT_MAX_FILE_SIZE = 10
+DEFAULT_FILE_TIME_BUDGET = 60
 ACCEPTED_FILE_STATUSES = ['m', 'a']
+# The git modes of the scanned blobs - regular and executable files, not symbolic links or submodules
+SCANNED_BLOB_MODES = {'100644', '100755'}
 SKIPPED_FILES = {'secrets_white_list', 'id_set.json', 'conf.json', 'Pipfile', 'secrets-ignore', 'ami_builds.json',
                  'secrets_test.py', 'secrets.py', 'constants.py', 'core.py'}
 TEXT_FILE_TYPES = {'.yml', '.py', '.json', '.md', '.txt', '.sh', '.ini', '.eml', '', '.csv', '.js', '.pdf', '.html',
@@ -24,7 +44,6 @@ TEXT_FILE_TYPES = {'.yml', '.py', '.json', '.md', '.txt', '.sh', '.ini', '.eml',
 SKIP_FILE_TYPE_ENTROPY_CHECKS = {'.eml'}
 SKIP_DEMISTO_TYPE_ENTROPY_CHECKS = {'playbook-'}
 YML_FILE_EXTENSION = '.yml'
-
 # disable-secrets-detection-start
 # secrets
 URLS_REGEX = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
@@ -51,23 +70,117 @@ IPV4_REGEX = r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0
 DATES_REGEX = r'((\d{4}[/.-]\d{2}[/.-]\d{2})[T\s](\d{2}:?\d{2}:?\d{2}:?(\.\d{5,10})?([+-]\d{2}:?\d{2})?Z?)?)'
 # false positives
 UUID_REGEX = r'([\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{8,12})'
+DOCKER_VERSION_REGEX = r'dockerimage:\s*\w*demisto/\w+:(\d+.\d+.\d+.\d+)'
+FALSE_POSITIVE_REGEX = r'([^\s]*[(\[{].*[)\]}][^\s]*)'
+BASE64_REGEX = r'(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{4})'
 # disable-secrets-detection-end
+# Base64 strings longer than this are not scanned
+MAX_BASE64_LENGTH = 500
+
+# The regexes are compiled once, and every line is matched only against the regexes whose required literals (the
+# characters every match contains) are in the line - most lines have no '@', '::' or 'http' and skip the expensive
+# regexes. Each regex still scans the whole line on its own, so overlapping matches (e.g. a url and the ip in it)
+# are found as before.
+DATES_PATTERN = re.compile(DATES_REGEX)
+UUID_PATTERN = re.compile(UUID_REGEX)
+DOCKER_VERSION_PATTERN = re.compile(DOCKER_VERSION_REGEX)
+URLS_PATTERN = re.compile(URLS_REGEX)
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+IPV6_PATTERN = re.compile(IPV6_REGEX)
+IPV4_PATTERN = re.compile(IPV4_REGEX)
+FALSE_POSITIVE_PATTERN = re.compile(FALSE_POSITIVE_REGEX)
+BASE64_PATTERN = re.compile(BASE64_REGEX)
+# A base64 string longer than MAX_BASE64_LENGTH has a run of at least this many base64 characters, before its padding
+LONG_BASE64_RUN_PATTERN = re.compile(r'[A-Za-z0-9+/]{%d}' % (MAX_BASE64_LENGTH - 1))
+DISABLE_SECRETS_DETECTION = 'disable-secrets-detection'
+# A reference to a group by its number in a whitelist entry, a backreference (\1) or a condition ((?(1)...))
+GROUP_REFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?\([1-9]')
+
+
+@lru_cache(maxsize=None)
+def compile_white_list_regex(white_list):
+    """Compiles the entries of a pack whitelist, which are regexes as well, into a single regex.
+
+    The single regex removes the matches of all the entries in one pass over the text, unlike a re.sub per entry:
+    of the entries which match at the same position the one with the longest source is removed (not the one with the
+    longest match), and a match that the removal of another match would expose is not removed.
+    :param white_list: frozenset of the whitelist entries.
+    :return: list of the compiled regexes - the single regex, or a regex per entry if the entries can not be combined
+    (e.g. an entry sets an inline flag, or refers to a group by its number, which would be another group once the
+    entries are combined).
+    """
+    # longer entries first, so of the entries which match at the same position the longest is removed
+    entries = sorted(white_list, key=lambda entry: (-len(entry), entry))
+    if any(GROUP_REFERENCE_REGEX.search(entry) for entry in entries):
+        return [re.compile(entry) for entry in entries]
+    try:
+        return [re.compile('|'.join('(?:{})'.format(entry) for entry in entries))] if entries else []
+    except re.error:
+        return [re.compile(entry) for entry in entries]
+
+
+class WhiteList(object):
+    """The whitelist of the repository or of a pack, loaded and compiled once per run.
+
+    Attributes:
+        strings (set): the whitelisted strings, which are whitelisted in any string that contains them.
+        iocs (set): the whitelisted IOCs, which are whitelisted in any IOC that contains them.
+        files (set): the paths of the files which are not scanned.
+        strings_matcher (SubstringMatcher): the lower case whitelisted strings.
+        iocs_matcher (SubstringMatcher): the lower case whitelisted IOCs.
+        digest (str): the hash of the whitelisted strings and IOCs, which the secrets found in a file depend on.
+    """
+
+    def __init__(self, strings, iocs, files):
+        self.strings = strings
+        self.iocs = iocs
+        self.files = files
+        self.strings_matcher = SubstringMatcher(white_list_string.lower() for white_list_string in strings)
+        self.iocs_matcher = SubstringMatcher(ioc.lower() for ioc in iocs)
+        self.digest = hashlib.sha256(json.dumps([sorted(strings), sorted(iocs)]).encode('utf-8')).hexdigest()
 
 
 class SecretsValidator(object):
 
-    def __init__(self, configuration=Configuration(), is_circle=False, ignore_entropy=False, white_list_path=''):
-        self.configuration = configuration
+    def __init__(self, configuration=None, is_circle=False, ignore_entropy=False, white_list_path='', git_context=None,
+                 jobs=1, max_file_size=DEFAULT_MAX_FILE_SIZE, file_time_budget=DEFAULT_FILE_TIME_BUDGET,
+                 scan_all=False, since=None, secrets_cache=None, diff_only=False, text_extractor=None):
+        self.configuration = configuration or Configuration()
+        self.git_context = git_context or GitContext()
         self.is_circle = is_circle
         self.white_list_path = white_list_path
         self.ignore_entropy = ignore_entropy
+        # The number of processes to scan the files in, 1 scans them in the current process
+        self.jobs = max(1, jobs or 1)
+        # The maximal size of a scanned file in MB and the maximal duration of its scan in seconds, 0 for no limit
+        self.max_file_size = max_file_size
+        self.file_time_budget = file_time_budget
+        # The paths of the files which were not scanned completely, and the reasons
+        self.manual_review_files = []  # type: list
+        # Whether to scan all the files of HEAD, or the revision since which to scan the committed files, instead of
+        # the changed files, and the cache of the secrets found in the scanned blobs
+        self.scan_all = scan_all
+        self.since = since
+        self.secrets_cache = secrets_cache
+        # Whether to scan only the lines the changes add to the changed files, instead of the whole files
+        self.diff_only = diff_only
+        # The extractor of the texts of pdf files and integration READMEs, created with the limits of the scan if None
+        self._text_extractor = text_extractor
+        self._blob_reader = None
+        # The whitelists by their paths, and the matchers of the temporary whitelists by their strings
+        self._white_lists = {}  # type: dict
+        self._temp_white_list_matchers = {}  # type: dict
 
     def get_secrets(self, branch_name, is_circle):
         secrets_found = {}
         # make sure not in middle of merge
-        if not run_command('git rev-parse -q --verify MERGE_HEAD'):
-            secrets_file_paths = self.get_all_diff_text_files(branch_name, is_circle)
-            secrets_found = self.search_potential_secrets(secrets_file_paths, self.ignore_entropy)
+        if not self.git_context.is_merging:
+            if self.scan_all or self.since:
+                secrets_found = self.search_history_secrets(self.ignore_entropy)
+            else:
+                secrets_file_paths = self.get_all_diff_text_files(branch_name, is_circle)
+                diff_revs = self.get_diff_revs(branch_name, is_circle) if self.diff_only else None
+                secrets_found = self.search_potential_secrets(secrets_file_paths, self.ignore_entropy, diff_revs)
             if secrets_found:
                 secrets_found_string = 'Secrets were found in the following files:'
                 for file_name in secrets_found:
@@ -85,6 +198,9 @@ class SecretsValidator(object):
                 secrets_found_string += 'For more information about whitelisting visit: ' \
                                         'https://github.com/demisto/internal-content/tree/master/documentation/secrets'
                 print_error(secrets_found_string)
+            if self.manual_review_files:
+                print_warning('The following files were not scanned completely, review them manually:\n{}'.format(
+                    '\n'.join('{} - {}'.format(file_path, reason) for file_path, reason in self.manual_review_files)))
         return secrets_found
 
     def get_all_diff_text_files(self, branch_name, is_circle):
@@ -94,10 +210,29 @@ class SecretsValidator(object):
         :param is_circle: boolean to check if being ran from circle
         :return: list: list of text files
         """
-        changed_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name)) \
-            if is_circle else run_command("git diff --name-status --no-merges HEAD")
+        changed_files_string = self.git_context.get_name_status('origin/master...{}'.format(branch_name)) \
+            if is_circle else self.git_context.get_name_status('--no-merges', 'HEAD')
         return list(self.get_diff_text_files(changed_files_string))
 
+    @staticmethod
+    def get_diff_revs(branch_name, is_circle):
+        """
+        Get the revisions the changed files are diffed against, the same as in get_all_diff_text_files
+        :param branch_name: current branch being worked on
+        :param is_circle: boolean to check if being ran from circle
+        :return: tuple: the revisions to diff
+        """
+        return ('origin/master...{}'.format(branch_name),) if is_circle else ('HEAD',)
+
+    def get_added_line_numbers(self, file_path, diff_revs):
+        """
+        Get the numbers of the lines the changes of a file add to it
+        :param file_path: path of the file
+        :param diff_revs: the revisions to diff the file against
+        :return: set: the numbers of the added lines, starting at 1
+        """
+        return get_added_line_numbers(self.git_context.get_file_diff(file_path, *diff_revs, unified=0))
+
     def get_diff_text_files(self, files_string):
         """Filter out only added/modified text files from git diff
         :param files_string: string representing the git diff files
@@ -129,85 +264,364 @@ class SecretsValidator(object):
             return True
         return False
 
-    def search_potential_secrets(self, secrets_file_paths: list, ignore_entropy: bool = False):
+    def search_potential_secrets(self, secrets_file_paths: list, ignore_entropy: bool = False, diff_revs=None):
         """Returns potential secrets(sensitive data) found in committed and added files
         :param secrets_file_paths: paths of files that are being commited to git repo
         :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+        :param diff_revs: the revisions to diff the files against to scan only the lines they add, None for the
+            whole files
 
         :return: dictionary(filename: (list)secrets) of strings sorted by file name for secrets found in files
         """
         secrets_found = {}
-        for file_path in secrets_file_paths:
-            # Get if file path in pack and pack name
-            is_pack = is_file_path_in_pack(file_path)
-            pack_name = get_pack_name(file_path)
-            # Get generic/ioc/files white list sets based on if pack or not
-            secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
-            # Skip white listed files
-            if file_path in files_white_list:
-                print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
-                continue
-            # Init vars for current loop
-            file_name = os.path.basename(file_path)
-            high_entropy_strings = []
-            secrets_found_with_regex = []
-            _, file_extension = os.path.splitext(file_path)
-            skip_secrets = {'skip_once': False, 'skip_multi': False}
-            # get file contents
-            file_contents = self.get_file_contents(file_path, file_extension)
-            # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
-            if is_pack:
-                file_contents = self.remove_white_list_regex(file_contents, secrets_white_list)
-
-            yml_file_contents = self.get_related_yml_contents(file_path)
-            # Add all context output paths keywords to whitelist temporary
-            if file_extension == YML_FILE_EXTENSION or yml_file_contents:
-                temp_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
-                secrets_white_list = secrets_white_list.union(temp_white_list)
-            # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
-            for line in file_contents.split('\n'):
-                # if detected disable-secrets comments, skip the line/s
-                skip_secrets = self.is_secrets_disabled(line, skip_secrets)
-                if skip_secrets['skip_once'] or skip_secrets['skip_multi']:
-                    skip_secrets['skip_once'] = False
-                    continue
-                # REGEX scanning for IOCs and false positive groups
-                regex_secrets, false_positives = self.regex_for_secrets(line)
-                for regex_secret in regex_secrets:
-                    if not any(ioc.lower() in regex_secret.lower() for ioc in ioc_white_list):
-                        secrets_found_with_regex.append(regex_secret)
-                # added false positives into white list array before testing the strings in line
-
-                secrets_white_list = secrets_white_list.union(false_positives)
-
-                if not ignore_entropy:
-                    # due to nature of eml files, skip string by string secret detection - only regex
-                    if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
-                            any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
-                        continue
-                    line = self.remove_false_positives(line)
-                    # calculate entropy for each string in the file
-                    for string_ in line.split():
-                        # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                                white_list_string.lower() in string_.lower()
-                                for white_list_string in secrets_white_list):
-
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                high_entropy_strings.append(string_)
-
-            if high_entropy_strings or secrets_found_with_regex:
-                # uniquify identical matches between lists
-                file_secrets = list(set(high_entropy_strings + secrets_found_with_regex))
+        # the files are scanned in the order of their paths, in worker processes if jobs > 1
+        scans = [(file_path, ignore_entropy, None,
+                  None if diff_revs is None else self.get_added_line_numbers(file_path, diff_revs))
+                 for file_path in sorted(secrets_file_paths)]
+        for file_name, file_secrets in self.scan_files(scans):
+            if file_secrets:
                 secrets_found[file_name] = file_secrets
 
         return secrets_found
 
+    def search_history_secrets(self, ignore_entropy=False):
+        """Returns potential secrets found in all the text files of HEAD, or in all their versions committed since
+        the revision of self.since.
+        Every blob is scanned once for all the paths it is committed in (with the same settings), and the secrets
+        found in it are kept in the secrets cache, so a repeated scan only scans the new blobs.
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+
+        :return: dictionary(file path: (list)secrets) of the secrets found in the versions of the files
+        """
+        # the paths of the blobs by the blob hashes and the settings they are scanned with
+        blob_paths = OrderedDict()  # type: OrderedDict
+        for file_path, blob_hash in self.get_history_blobs():
+            white_list = self.get_white_list(is_file_path_in_pack(file_path), get_pack_name(file_path))
+            if file_path in white_list.files:
+                continue
+            blob_key = (blob_hash, tuple(self.get_scan_settings(file_path, ignore_entropy)))
+            blob_paths.setdefault(blob_key, []).append(file_path)
+
+        file_secrets = {}  # type: dict
+        scanned_blobs = []
+        for blob_key, file_paths in blob_paths.items():
+            entry_path = self.secrets_cache.get_entry_path(*blob_key) if self.secrets_cache else None
+            blob_secrets = self.secrets_cache.get(entry_path) if entry_path else None
+            if blob_secrets is None:
+                scanned_blobs.append((blob_key, file_paths, entry_path))
+            else:
+                for file_path in file_paths:
+                    file_secrets.setdefault(file_path, set()).update(blob_secrets)
+
+        try:
+            manual_review_count = len(self.manual_review_files)
+            scans = [(file_paths[0], ignore_entropy, blob_key[0], None) for blob_key, file_paths, _ in scanned_blobs]
+            for (blob_key, file_paths, entry_path), (_, blob_secrets) in zip(scanned_blobs, self.scan_files(scans)):
+                # the secrets of a blob which was not scanned completely are not cached
+                if entry_path and len(self.manual_review_files) == manual_review_count:
+                    self.secrets_cache.set(entry_path, blob_secrets)
+                manual_review_count = len(self.manual_review_files)
+                for file_path in file_paths:
+                    file_secrets.setdefault(file_path, set()).update(blob_secrets)
+        finally:
+            if self._blob_reader is not None:
+                self._blob_reader.close()
+
+        print('Scanned {} blobs of {} files, the secrets of {} blobs were cached'.format(
+            len(scanned_blobs), len(set(file_path for file_paths in blob_paths.values() for file_path in file_paths)),
+            len(blob_paths) - len(scanned_blobs)))
+        return {file_path: sorted(file_secrets[file_path]) for file_path in sorted(file_secrets)
+                if file_secrets[file_path]}
+
+    def get_history_blobs(self):
+        """Gets the text files to scan - the files of HEAD, or the versions of the files committed since self.since.
+        :return: sorted list of the paths of the files and the hashes of their blobs
+        """
+        blobs = set()
+        if self.since:
+            # every raw diff field (":<old mode> <new mode> <old blob> <new blob> <status>") is followed by a path
+            fields = self.git_context.run('log', '--raw', '--no-abbrev', '--no-renames', '-z', '--format=',
+                                          '--diff-filter=d', '{}..HEAD'.format(self.since)).split('\0')
+            for raw_diff, file_path in zip(fields[::2], fields[1::2]):
+                _, mode, _, blob_hash, _ = raw_diff.strip().split()
+                blobs.add((mode, blob_hash, file_path))
+        else:
+            for tree_entry in self.git_context.run('ls-tree', '-r', '-z', '--full-tree', 'HEAD').split('\0'):
+                if tree_entry:
+                    object_info, file_path = tree_entry.split('\t', 1)
+                    mode, _, blob_hash = object_info.split()
+                    blobs.add((mode, blob_hash, file_path))
+
+        return sorted((file_path, blob_hash) for mode, blob_hash, file_path in blobs
+                      if mode in SCANNED_BLOB_MODES and self.is_text_file(file_path) and
+                      not any(skipped_file in file_path for skipped_file in SKIPPED_FILES))
+
+    def get_scan_settings(self, file_path, ignore_entropy):
+        """Gets the settings the secrets found in a file depend on, other than its content.
+        :param file_path: path of the file
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+        :return: list of strings
+        """
+        is_pack = is_file_path_in_pack(file_path)
+        white_list = self.get_white_list(is_pack, get_pack_name(file_path))
+        file_name = os.path.basename(file_path)
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        temp_white_list = sorted(self.create_temp_white_list(yml_file_contents)) if yml_file_contents else None
+        return [white_list.digest, str(is_pack), os.path.splitext(file_path)[1], str(ignore_entropy),
+                str(any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS)),
+                hashlib.sha256(json.dumps(temp_white_list).encode('utf-8')).hexdigest()]
+
+    @property
+    def blob_reader(self):
+        if self._blob_reader is None:
+            self._blob_reader = BlobReader(self.git_context)
+        return self._blob_reader
+
+    @property
+    def text_extractor(self):
+        if self._text_extractor is None:
+            self._text_extractor = TextExtractor(processes=self.jobs, timeout=self.file_time_budget)
+        return self._text_extractor
+
+    def scan_file(self, file_path, ignore_entropy, blob_hash=None, line_numbers=None, extracted_text=None):
+        """Scans a file of the working tree, or a version of it from the git history.
+        :param file_path: path of the file
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+        :param blob_hash: the hash of the blob of the version of the file, None to scan the file in the working tree
+        :param line_numbers: the numbers of the lines to scan, None to scan all the lines
+        :param extracted_text: the ExtractedText of a pdf file or an integration README, None to extract it
+        :return: the name of the file and the sorted list of the secrets found in it
+        """
+        content = self.read_blob(file_path, blob_hash) if blob_hash is not None else None
+        return self.search_file_secrets(file_path, ignore_entropy, content, line_numbers, extracted_text)
+
+    def read_blob(self, file_path, blob_hash):
+        content = self.blob_reader.read(blob_hash)
+        if content is None:
+            raise LookupError('The blob {} of {} was not found'.format(blob_hash, file_path))
+        return content
+
+    def scan_files(self, scans):
+        """Scans files for secrets, in worker processes if jobs > 1.
+
+        The output of the scans is printed in the order of the files, and an error raised by one of them is raised
+        after the output of the scans of the files that precede it, as if they were scanned one after the other.
+        :param scans: list of the arguments of scan_file for every file.
+        :return: generator of the names of the files and the sorted lists of their secrets, in the order of the files.
+        """
+        scans = self.add_extracted_texts(scans)
+        if self.jobs == 1 or len(scans) < 2:
+            for scan in scans:
+                yield self.scan_file(*scan)
+            return
+
+        for file_name, file_secrets, manual_review_files in run_in_workers(
+                scans, self.jobs, _create_worker_validator, (self.get_worker_kwargs(),), _scan_file):
+            self.manual_review_files += manual_review_files
+            yield file_name, file_secrets
+
+    def add_extracted_texts(self, scans):
+        """Extracts the texts of the pdf files and integration READMEs of the scans at once, in the processes of the
+        text extractor - the worker processes of a parallel scan can not start processes of their own.
+        :param scans: list of the arguments of scan_file for every file, without extracted texts
+        :return: list of the scans, with the extracted texts of the pdf files and integration READMEs
+        """
+        extractions = []
+        for index, (file_path, _, blob_hash, _) in enumerate(scans):
+            extract_function = self.get_extract_function(file_path, os.path.splitext(file_path)[1])
+            if extract_function is None:
+                continue
+            if blob_hash is not None:
+                content = self.read_blob(file_path, blob_hash)
+            elif os.path.isfile(file_path):
+                with open(file_path, 'rb') as extracted_file:
+                    content = extracted_file.read()
+            else:
+                # the scan reports the missing file
+                continue
+            # files which are too large are left for a manual review without being extracted
+            if not self.max_file_size or len(content) <= self.max_file_size * 1024 * 1024:
+                extractions.append((index, content, extract_function))
+        if not extractions:
+            return scans
+
+        scans = list(scans)
+        extracted_texts = self.text_extractor.extract_texts([(content, extract_function)
+                                                             for _, content, extract_function in extractions])
+        for (index, _, _), extracted_text in zip(extractions, extracted_texts):
+            scans[index] = tuple(scans[index]) + (extracted_text,)
+        return scans
+
+    def get_worker_kwargs(self):
+        """Gets the arguments of the SecretsValidator of a worker process, which scans single files."""
+        return {
+            'configuration': self.configuration,
+            'is_circle': self.is_circle,
+            'ignore_entropy': self.ignore_entropy,
+            'white_list_path': self.white_list_path,
+            'max_file_size': self.max_file_size,
+            'file_time_budget': self.file_time_budget,
+            'git_context': self.git_context,
+        }
+
+    def search_file_secrets(self, file_path, ignore_entropy=False, content=None, line_numbers=None,
+                            extracted_text=None):
+        """Returns potential secrets(sensitive data) found in a file
+        :param file_path: path of the file
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+        :param content: the content of the file (bytes), None to read it from the file
+        :param line_numbers: the numbers of the lines to scan, None to scan all the lines. The other lines are only
+            checked for disable-secrets-detection comments. Ignored in files whose text is extracted (pdf, README).
+        :param extracted_text: the ExtractedText of a pdf file or an integration README, None to extract it
+
+        :return: the name of the file and the sorted list of the secrets found in it
+        """
+        file_name = os.path.basename(file_path)
+        # Get if file path in pack and pack name
+        is_pack = is_file_path_in_pack(file_path)
+        pack_name = get_pack_name(file_path)
+        # Get generic/ioc/files white list sets based on if pack or not
+        white_list = self.get_white_list(is_pack, pack_name)
+        # Skip white listed files
+        if file_path in white_list.files:
+            print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
+            return file_name, []
+        # Init vars for the scan
+        high_entropy_strings = set()
+        entropy_candidates = []
+        secrets_found_with_regex = []
+        _, file_extension = os.path.splitext(file_path)
+        skip_secrets = {'skip_once': False, 'skip_multi': False}
+        extract_function = self.get_extract_function(file_path, file_extension)
+        if extract_function is not None:
+            line_numbers = None
+        elif line_numbers is not None and not line_numbers:
+            # nothing was added to the file
+            return file_name, []
+        if content is not None:
+            file_size = len(content)
+        else:
+            file_size = os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+        # only the added lines of a large file are scanned, which fit the budget of the other files
+        if line_numbers is None and self.max_file_size and file_size > self.max_file_size * 1024 * 1024:
+            self.add_manual_review_file(file_path, 'larger than {} MB'.format(self.max_file_size))
+            return file_name, []
+        text = None
+        if extract_function is not None:
+            if extracted_text is None:
+                extracted_text = self.extract_text(file_path, extract_function, content)
+            if extracted_text.error is not None:
+                self.add_manual_review_file(file_path, extracted_text.error)
+                return file_name, []
+            text = self.ignore_base64(extracted_text.text)
+
+        white_list_matchers = [white_list.strings_matcher]
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        # Add all context output paths keywords to whitelist temporary
+        if yml_file_contents:
+            white_list_matchers.append(self.get_temp_white_list_matcher(self.create_temp_white_list(yml_file_contents)))
+        elif file_extension == YML_FILE_EXTENSION:
+            # the context paths of the whole file are whitelisted in all its lines, so they are collected first
+            temp_white_list = set()  # type: set
+            for line in self.get_scanned_lines(file_path, file_extension, white_list if is_pack else None, content):
+                temp_white_list.update(self.create_temp_white_list(line))
+            white_list_matchers.append(self.get_temp_white_list_matcher(temp_white_list))
+        # the lower case false positives of the lines so far, which are whitelisted in the following strings
+        false_positives_white_list = SubstringSet()
+        white_list_matchers.append(false_positives_white_list)
+        deadline = time.monotonic() + self.file_time_budget if self.file_time_budget else None
+        # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
+        scanned_lines = self.get_scanned_lines(file_path, file_extension, white_list if is_pack else None, content,
+                                               line_numbers, text)
+        for line_number, line in enumerate(scanned_lines, 1):
+            if deadline is not None and time.monotonic() > deadline:
+                self.add_manual_review_file(file_path, 'not scanned within {} seconds'.format(self.file_time_budget))
+                break
+            # if detected disable-secrets comments, skip the line/s
+            skip_secrets = self.is_secrets_disabled(line, skip_secrets)
+            if skip_secrets['skip_once'] or skip_secrets['skip_multi']:
+                skip_secrets['skip_once'] = False
+                continue
+            if line_numbers is not None and line_number not in line_numbers:
+                continue
+            # REGEX scanning for IOCs and false positive groups
+            regex_secrets, false_positives = self.regex_for_secrets(line)
+            for regex_secret in regex_secrets:
+                if not white_list.iocs_matcher.search(regex_secret.lower()):
+                    secrets_found_with_regex.append(regex_secret)
+            # added false positives into white list array before testing the strings in line
+            false_positives_white_list.update(false_positive.lower() for false_positive in false_positives)
+
+            if not ignore_entropy:
+                # due to nature of eml files, skip string by string secret detection - only regex
+                if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
+                        any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
+                    continue
+                line = self.remove_false_positives(line)
+                # the entropy of the strings of the line is calculated with the strings of other lines
+                for string_ in line.split():
+                    # compare the lower case of the string against both generic whitelist & temp white list
+                    lower_string = string_.lower()
+                    if not any(matcher.search(lower_string) for matcher in white_list_matchers):
+                        entropy_candidates.append(string_)
+                if len(entropy_candidates) >= ENTROPY_BATCH_SIZE:
+                    high_entropy_strings.update(self.get_high_entropy_strings(entropy_candidates))
+                    entropy_candidates = []
+
+        high_entropy_strings.update(self.get_high_entropy_strings(entropy_candidates))
+        # uniquify identical matches between lists
+        return file_name, sorted(high_entropy_strings.union(secrets_found_with_regex))
+
+    def add_manual_review_file(self, file_path, reason):
+        print_warning('Skipping secrets detection for the rest of file: {} as it is {} - ***Review Manually***'.format(
+            file_path, reason))
+        self.manual_review_files.append((file_path, reason))
+
+    def get_scanned_lines(self, file_path, file_extension, pack_white_list=None, content=None, line_numbers=None,
+                          text=None):
+        """Yields the lines of a file to scan, without long base64 strings and the whitelisted regexes of its pack.
+        Text files are read line by line, so only a line of a large file is in memory at a time.
+        :param file_path: path of the file
+        :param file_extension: the extension of the file
+        :param pack_white_list: the whitelist of the pack of the file, whose entries are regexes as well
+        :param content: the content of the file (bytes), None to read it from the file
+        :param line_numbers: the numbers of the lines to clean, None to clean all the lines. The other lines are
+            yielded as they are.
+        :param text: the extracted text of a pdf file or an integration README, cleaned of base64 strings, whose
+            lines are scanned instead of the lines of the file
+        """
+        if text is not None:
+            lines = text.split('\n')
+            line_numbers = None
+        else:
+            lines = self.read_file_lines(file_path, content)
+        for line_number, line in enumerate(lines, 1):
+            if line_numbers is not None and line_number not in line_numbers:
+                yield line
+                continue
+            # the extracted text is cleaned of base64 strings as a whole
+            if text is None:
+                line = self.ignore_base64(line)
+            # in packs regard all items as regex as well
+            if pack_white_list is not None:
+                line = self.remove_white_list_regex(line, pack_white_list.strings)
+            yield line
+
+    def read_file_lines(self, file_path, content=None):
+        try:
+            # Open each file, read its contents in UTF-8 encoding to avoid unicode characters
+            with io.open(file_path, mode="r", encoding="utf-8", errors='ignore') if content is None else \
+                    io.StringIO(content.decode('utf-8', errors='ignore'), newline=None) as commited_file:
+                for line in commited_file:
+                    yield line[:-1] if line.endswith('\n') else line
+        except Exception as ex:
+            print("Failed opening file: {}. Exception: {}".format(file_path, ex))
+            raise
+
     @staticmethod
     def remove_white_list_regex(file_contents, secrets_white_list):
-        for regex in secrets_white_list:
-            file_contents = re.sub(regex, '', file_contents)
+        for white_list_regex in compile_white_list_regex(frozenset(secrets_white_list)):
+            file_contents = white_list_regex.sub('', file_contents)
         return file_contents
 
     @staticmethod
@@ -221,6 +635,13 @@ class SecretsValidator(object):
 
         return temp_white_list
 
+    def get_temp_white_list_matcher(self, temp_white_list):
+        """Gets the matcher of the temporary whitelist of a yml, compiled once for the yml and its related files."""
+        temp_white_list = frozenset(temp_white_list)
+        if temp_white_list not in self._temp_white_list_matchers:
+            self._temp_white_list_matchers[temp_white_list] = SubstringMatcher(temp_white_list)
+        return self._temp_white_list_matchers[temp_white_list]
+
     def get_related_yml_contents(self, file_path):
         # if script or readme file, search for yml in order to retrieve temp white list
         yml_file_contents = ''
@@ -248,38 +669,32 @@ class SecretsValidator(object):
         false_positives = []
 
         # Dates REGEX for false positive preventing since they have high entropy
-        dates = re.findall(DATES_REGEX, line)
-        if dates:
-            false_positives += [date[0].lower() for date in dates]
+        false_positives += [date[0].lower() for date in DATES_PATTERN.findall(line)]
         # UUID REGEX
-        uuids = re.findall(UUID_REGEX, line)
-        if uuids:
-            false_positives += uuids
+        if line.count('-') >= 4:
+            false_positives += UUID_PATTERN.findall(line)
         # docker images version are detected as ips. so we ignore and whitelist them
         # example: dockerimage: demisto/duoadmin:1.0.0.147
-        re_res = re.search(r'dockerimage:\s*\w*demisto/\w+:(\d+.\d+.\d+.\d+)', line)
-        if re_res:
-            docker_version = re_res.group(1)
-            false_positives.append(docker_version)
-            line = line.replace(docker_version, '')
+        if 'dockerimage:' in line:
+            re_res = DOCKER_VERSION_PATTERN.search(line)
+            if re_res:
+                docker_version = re_res.group(1)
+                false_positives.append(docker_version)
+                line = line.replace(docker_version, '')
         # URL REGEX
-        urls = re.findall(URLS_REGEX, line)
-        if urls:
-            potential_secrets += urls
+        if 'http' in line:
+            potential_secrets += URLS_PATTERN.findall(line)
         # EMAIL REGEX
-        emails = re.findall(EMAIL_REGEX, line)
-        if emails:
-            potential_secrets += emails
-        # IPV6 REGEX
-        ipv6_list = re.findall(IPV6_REGEX, line)
-        if ipv6_list:
-            for ipv6 in ipv6_list:
+        if '@' in line:
+            potential_secrets += EMAIL_PATTERN.findall(line)
+        # IPV6 REGEX - an address has '::', or at least 6 ':' if it is not shortened
+        if '::' in line or line.count(':') >= 6:
+            for ipv6 in IPV6_PATTERN.findall(line):
                 if ipv6 != '::' and len(ipv6) > 4:
                     potential_secrets.append(ipv6)
         # IPV4 REGEX
-        ipv4_list = re.findall(IPV4_REGEX, line)
-        if ipv4_list:
-            potential_secrets += ipv4_list
+        if line.count('.') >= 3:
+            potential_secrets += IPV4_PATTERN.findall(line)
 
         return potential_secrets, false_positives
 
@@ -293,18 +708,77 @@ class SecretsValidator(object):
         if not data:
             return 0
         entropy = 0
-        # each unicode code representation of all characters which are considered printable
-        for char in (ord(c) for c in string.printable):
+        # each character which is considered printable, counted in a single pass over the data
+        char_counts = [(char, count) for char, count in Counter(data).items() if char in PRINTABLE_CHARACTERS_ORDER]
+        # the terms are summed in the order of string.printable, so the score does not depend on the data order
+        char_counts.sort(key=lambda char_count: PRINTABLE_CHARACTERS_ORDER[char_count[0]])
+        for _, count in char_counts:
             # probability of event X
-            p_x = float(data.count(chr(char))) / len(data)
-            if p_x > 0:
-                # the information in every possible news, in bits
-                entropy += - p_x * math.log(p_x, 2)
+            p_x = float(count) / len(data)
+            # the information in every possible news, in bits
+            entropy += - p_x * math.log(p_x, 2)
         return entropy
 
+    @staticmethod
+    def calculate_shannon_entropies(strings):
+        """Calculates the entropy of many strings at once, vectorized over their character histograms when numpy is
+        installed.
+        :param strings: list of strings.
+        :return: list of the entropy scores of the strings. The numpy scores may differ from calculate_shannon_entropy
+        in the last bits.
+        """
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        if numpy is None or len(strings) < NUMPY_MIN_BATCH:
+            return [SecretsValidator.calculate_shannon_entropy(string_) for string_ in strings]
+
+        printable_codes = numpy.zeros(128, dtype=bool)
+        printable_codes[[ord(char) for char in string.printable]] = True
+        entropies = []  # type: list
+        for chunk_start in range(0, len(strings), NUMPY_CHUNK_SIZE):
+            chunk = strings[chunk_start:chunk_start + NUMPY_CHUNK_SIZE]
+            lengths = numpy.array([len(string_) for string_ in chunk])
+            codes = numpy.frombuffer(''.join(chunk).encode('utf-32-le'), dtype=numpy.uint32)
+            string_indexes = numpy.repeat(numpy.arange(len(chunk)), lengths)
+            is_printable = codes < 128
+            is_printable[is_printable] = printable_codes[codes[is_printable]]
+            histograms = numpy.bincount(string_indexes[is_printable] * 128 + codes[is_printable],
+                                        minlength=len(chunk) * 128).reshape(len(chunk), 128)
+            probabilities = histograms / numpy.maximum(lengths, 1)[:, None]
+            information = numpy.zeros_like(probabilities)
+            numpy.log2(probabilities, out=information, where=probabilities > 0)
+            entropies.extend((-(probabilities * information).sum(axis=1)).tolist())
+        return entropies
+
+    @staticmethod
+    def get_high_entropy_strings(strings):
+        """Gets the strings whose entropy is at least ENTROPY_THRESHOLD, scoring every distinct string once.
+        :param strings: list of the candidate strings of a file.
+        :return: list of the high entropy strings, in their order in the given list.
+        """
+        distinct_strings = list(dict.fromkeys(strings))
+        is_high_entropy = {}
+        for string_, entropy in zip(distinct_strings, SecretsValidator.calculate_shannon_entropies(distinct_strings)):
+            if abs(entropy - ENTROPY_THRESHOLD) < ENTROPY_EPSILON:
+                entropy = SecretsValidator.calculate_shannon_entropy(string_)
+            is_high_entropy[string_] = entropy >= ENTROPY_THRESHOLD
+        return [string_ for string_ in strings if is_high_entropy[string_]]
+
+    def get_white_list(self, is_pack, pack_name):
+        """Gets the whitelist of a pack, or the generic whitelist, read and compiled once per run."""
+        whitelist_path = self.get_white_list_path(is_pack, pack_name)
+        if whitelist_path not in self._white_lists:
+            self._white_lists[whitelist_path] = WhiteList(*self.get_white_listed_items(is_pack, pack_name))
+        return self._white_lists[whitelist_path]
+
+    def get_white_list_path(self, is_pack, pack_name):
+        return os.path.join(PACKS_DIR, pack_name, PACKS_WHITELIST_FILE_NAME) if is_pack else self.white_list_path
+
     def get_white_listed_items(self, is_pack, pack_name):
-        whitelist_path = os.path.join(PACKS_DIR, pack_name, PACKS_WHITELIST_FILE_NAME) if is_pack \
-            else self.white_list_path
+        whitelist_path = self.get_white_list_path(is_pack, pack_name)
         final_white_list, ioc_white_list, files_while_list = self.get_packs_white_list(whitelist_path) if is_pack else \
             self.get_generic_white_list(whitelist_path)
 
@@ -343,16 +817,30 @@ class SecretsValidator(object):
                 final_white_list = secrets_white_list_file.read().split('\n')
         return final_white_list, [], []
 
+    def get_extract_function(self, file_path, file_extension):
+        """Gets the function which extracts the text of a pdf file or an integration README, None for files which
+        are read line by line"""
+        if file_extension == '.pdf':
+            return extract_text_from_pdf
+        if self.is_integration_readme(file_path, file_extension):
+            return extract_text_from_md_html
+        return None
+
+    @staticmethod
+    def is_integration_readme(file_path, file_extension):
+        return file_extension == '.md' and re.match(pattern=INTEGRATION_README_REGEX, string=file_path,
+                                                    flags=re.IGNORECASE) is not None
+
     def get_file_contents(self, file_path, file_extension):
+        """Gets the contents of a file to scan, the text of pdf files and integration READMEs."""
         try:
             # if pdf or README.md file, parse text
-            integration_readme = re.match(pattern=INTEGRATION_README_REGEX,
-                                          string=file_path,
-                                          flags=re.IGNORECASE)
-            if file_extension == '.pdf':
-                file_contents = self.extract_text_from_pdf(file_path)
-            elif file_extension == '.md' and integration_readme:
-                file_contents = self.extract_text_from_md_html(file_path)
+            extract_function = self.get_extract_function(file_path, file_extension)
+            if extract_function is not None:
+                extracted_text = self.extract_text(file_path, extract_function)
+                if extracted_text.error is not None:
+                    raise ValueError('The text of the file is {}'.format(extracted_text.error))
+                file_contents = extracted_text.text
             else:
                 # Open each file, read its contents in UTF-8 encoding to avoid unicode characters
                 with io.open(file_path, mode="r", encoding="utf-8", errors='ignore') as commited_file:
@@ -363,38 +851,23 @@ class SecretsValidator(object):
             print("Failed opening file: {}. Exception: {}".format(file_path, ex))
             raise
 
-    @staticmethod
-    def extract_text_from_pdf(file_path):
-        page_num = 0
-        file_contents = ''
-        try:
-            pdf_file_obj = open('./' + file_path, 'rb')
-            pdf_reader = PyPDF2.PdfFileReader(pdf_file_obj)
-            num_pages = pdf_reader.numPages
-        except PyPDF2.utils.PdfReadError:
-            print('ERROR: Could not parse PDF file in path: {} - ***Review Manually***'.format(file_path))
-            return file_contents
-        while page_num < num_pages:
-            pdf_page = pdf_reader.getPage(page_num)
-            page_num += 1
-            file_contents += pdf_page.extractText()
-
-        return file_contents
-
-    @staticmethod
-    def extract_text_from_md_html(file_path):
-        try:
-            with open(file_path, mode='r') as html_page:
-                soup = BeautifulSoup(html_page, features="html.parser")
-                file_contents = soup.text
-                return file_contents
-        except Exception as ex:
-            print_error('Unable to parse the following file {} due to error {}'.format(file_path, ex))
-            raise
+    def extract_text(self, file_path, extract_function, content=None):
+        """Extracts the text of a pdf file or an integration README in the processes of the text extractor.
+        :param file_path: path of the file
+        :param extract_function: the function which extracts the text, of get_extract_function
+        :param content: the content of the file (bytes), None to read it from the file
+        :return: the ExtractedText of the file
+        """
+        if content is None:
+            with open(file_path, 'rb') as extracted_file:
+                content = extracted_file.read()
+        return self.text_extractor.extract_text(content, extract_function)
 
     @staticmethod
     def remove_false_positives(line):
-        false_positive = re.search(r'([^\s]*[(\[{].*[)\]}][^\s]*)', line)
+        if '(' not in line and '[' not in line and '{' not in line:
+            return line
+        false_positive = FALSE_POSITIVE_PATTERN.search(line)
         if false_positive:
             false_positive = false_positive.group(1)
             line = line.replace(false_positive, '')
@@ -402,29 +875,27 @@ class SecretsValidator(object):
 
     @staticmethod
     def is_secrets_disabled(line, skip_secrets):
-        if bool(re.findall(r'(disable-secrets-detection-start)', line)):
+        if DISABLE_SECRETS_DETECTION not in line:
+            return skip_secrets
+        if DISABLE_SECRETS_DETECTION + '-start' in line:
             skip_secrets['skip_multi'] = True
-        elif bool(re.findall(r'(disable-secrets-detection-end)', line)):
+        elif DISABLE_SECRETS_DETECTION + '-end' in line:
             skip_secrets['skip_multi'] = False
-        elif bool(re.findall(r'(disable-secrets-detection)', line)):
+        else:
             skip_secrets['skip_once'] = True
         return skip_secrets
 
     @staticmethod
     def ignore_base64(file_contents):
-        base64_strings = re.findall(r'(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|'
-                                    r'[A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{4})', file_contents)
-        for base64_string in base64_strings:
-            if len(base64_string) > 500:
-                file_contents = file_contents.replace(base64_string, '')
-        return file_contents
+        """Removes the base64 strings longer than MAX_BASE64_LENGTH, in a single pass over the contents."""
+        if not LONG_BASE64_RUN_PATTERN.search(file_contents):
+            return file_contents
+        return BASE64_PATTERN.sub(
+            lambda base64_match: '' if len(base64_match.group()) > MAX_BASE64_LENGTH else base64_match.group(),
+            file_contents)
 
-    @staticmethod
-    def get_branch_name():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        branch_name = branch_name_reg.group(1)
-        return branch_name
+    def get_branch_name(self):
+        return self.git_context.branch
 
     def find_secrets(self):
         print_color('Starting secrets detection', LOG_COLORS.GREEN)
@@ -445,3 +916,25 @@ class SecretsValidator(object):
 
         else:
             return 0
+
+
+def _create_worker_validator(validator_kwargs):
+    """Creates the SecretsValidator of a worker process, which loads the whitelist of every pack once.
+    :param validator_kwargs: the arguments of the SecretsValidator.
+    :return: SecretsValidator. The validator of the worker.
+    """
+    return SecretsValidator(**validator_kwargs)
+
+
+def _scan_file(secrets_validator, scan):
+    """Scans a file for secrets in a worker process.
+    :param secrets_validator: the validator of the worker.
+    :param scan: the arguments of SecretsValidator.scan_file - the path of the file, whether to ignore the entropy
+    algorithm and the hash of the scanned blob.
+    :return: the name of the file, its secrets and the files the scan left for a manual review.
+    """
+    try:
+        file_name, file_secrets = secrets_validator.scan_file(*scan)
+    finally:
+        manual_review_files, secrets_validator.manual_review_files = secrets_validator.manual_review_files, []
+    return file_name, file_secrets, manual_review_files
@@ -0,0 +1,304 @@
+"""Registry of the checks `validate` runs on changed files, and of the inputs each of them needs.
+
+A check declares the inputs it uses - the parsed current file, its old version, the id_set, conf.json, the git diff
+or the latest docker tag. The inputs of a file are resolved lazily by FileInputs, the first time a check uses them,
+and are shared by all the checks of the file. So a check that is not selected (see `validate --only/--skip`) does not
+cost the parsing, git queries or network lookups of its inputs, and CheckStats reports what was saved.
+"""
+import time
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Iterable, List, Optional, Set  # noqa: F401
+
+from demisto_sdk.common.hook_validations.description import DescriptionValidator
+from demisto_sdk.common.hook_validations.docker import DockerImageValidator
+from demisto_sdk.common.hook_validations.image import ImageValidator
+from demisto_sdk.common.hook_validations.incident_field import IncidentFieldValidator
+from demisto_sdk.common.hook_validations.integration import IntegrationValidator
+from demisto_sdk.common.hook_validations.layout import LayoutValidator
+from demisto_sdk.common.hook_validations.playbook import PlaybookValidator
+from demisto_sdk.common.hook_validations.script import ScriptValidator
+from demisto_sdk.common.hook_validations.structure import StructureValidator
+from demisto_sdk.common.content_entity import get_content_entity
+from demisto_sdk.yaml_tools.unifier import Unifier
+
+CURRENT_FILE = 'current-file'
+OLD_FILE = 'old-file'
+ID_SET = 'id-set'
+CONF_JSON = 'conf-json'
+GIT_DIFF = 'git-diff'
+DOCKER_TAG = 'docker-tag'
+
+Check = namedtuple('Check', ['name', 'inputs', 'function', 'is_backward_check'])
+
+# The checks by their names, in the order they were registered
+CHECKS = OrderedDict()  # type: Dict[str, Check]
+
+
+def register_check(name, inputs, is_backward_check=False):
+    """Registers a check of a file.
+
+    Args:
+        name (str): the name of the check, used by `validate --only/--skip`.
+        inputs (list): the inputs the check uses.
+        is_backward_check (bool): whether the check is a backward compatibility check, which runs only if
+            backward compatibility is checked.
+
+    Returns:
+        The decorator of the function of the check, which gets the FileInputs of the file and returns whether the file
+        passed the check.
+    """
+    def decorator(function):
+        CHECKS[name] = Check(name, tuple(inputs), function, is_backward_check)
+        return function
+    return decorator
+
+
+def select_checks(only_checks=None, skipped_checks=None):
+    # type: (Optional[Iterable[str]], Optional[Iterable[str]]) -> Set[str]
+    """Gets the names of the selected checks.
+
+    Args:
+        only_checks (list): the names of the checks to run, None to run all the checks.
+        skipped_checks (list): the names of the checks not to run.
+
+    Raises:
+        ValueError: if one of the names is not the name of a check.
+    """
+    only_checks = list(only_checks or [])
+    skipped_checks = list(skipped_checks or [])
+    unknown_checks = sorted(set(only_checks + skipped_checks) - set(CHECKS))
+    if unknown_checks:
+        raise ValueError('Unknown checks: {}. The checks are: {}'.format(', '.join(unknown_checks),
+                                                                         ', '.join(CHECKS)))
+    return set(only_checks or CHECKS) - set(skipped_checks)
+
+
+class CheckStats:
+    """Counts of the checks that were run and skipped and of the inputs that were resolved.
+
+    Attributes:
+        run_checks (dict): the number of files each check was run on.
+        skipped_checks (dict): the number of files each check was skipped for.
+        resolved_inputs (dict): the number of files each input was resolved for.
+        input_durations (dict): the total time it took to resolve each input, in seconds.
+    """
+
+    def __init__(self):
+        self.run_checks = {}  # type: Dict[str, int]
+        self.skipped_checks = {}  # type: Dict[str, int]
+        self.resolved_inputs = {}  # type: Dict[str, int]
+        self.input_durations = {}  # type: Dict[str, float]
+
+    @staticmethod
+    def _add(counts, key, value=1):
+        counts[key] = counts.get(key, 0) + value
+
+    def merge(self, other):
+        # type: (CheckStats) -> None
+        """Adds the counts of another CheckStats, e.g. of a worker process."""
+        for counts, other_counts in [(self.run_checks, other.run_checks),
+                                     (self.skipped_checks, other.skipped_checks),
+                                     (self.resolved_inputs, other.resolved_inputs),
+                                     (self.input_durations, other.input_durations)]:
+            for key, value in other_counts.items():
+                self._add(counts, key, value)
+
+    def get_saved_inputs(self):
+        # type: () -> Dict[str, int]
+        """Gets the inputs of the skipped checks, with the number of files they were skipped for."""
+        saved_inputs = {}  # type: Dict[str, int]
+        for name, count in self.skipped_checks.items():
+            for input_name in CHECKS[name].inputs:
+                self._add(saved_inputs, input_name, count)
+        return saved_inputs
+
+    def get_report(self):
+        # type: () -> str
+        lines = ['Checks: ' + (', '.join('{} ({})'.format(name, count)
+                                         for name, count in sorted(self.run_checks.items())) or 'none')]
+        if self.skipped_checks:
+            lines.append('Skipped checks: ' + ', '.join('{} ({})'.format(name, count)
+                                                        for name, count in sorted(self.skipped_checks.items())))
+        lines.append('Resolved inputs: ' + (', '.join(
+            '{} ({}, {:.0f}ms)'.format(name, count, self.input_durations.get(name, 0) * 1000)
+            for name, count in sorted(self.resolved_inputs.items())) or 'none'))
+        saved_inputs = self.get_saved_inputs()
+        if saved_inputs:
+            lines.append('Inputs of skipped checks: ' + ', '.join(
+                '{} ({})'.format(name, count) for name, count in sorted(saved_inputs.items())))
+        return '\n'.join(lines)
+
+
+class FileInputs:
+    """The inputs of the checks of a file, resolved on first use and shared by the checks.
+
+    Attributes:
+        files_validator (FilesValidator): the validator of the run, which holds the inputs of all the files.
+        file_path (str): the path of the file.
+        old_file_path (str): the path of the file in the old version, if it was renamed.
+        is_added (bool): whether the file was added, rather than modified.
+        is_package (bool): whether the file is a part of a script or integration package, whose yml is checked.
+        stats (CheckStats): the stats of the run.
+    """
+
+    def __init__(self, files_validator, file_path, old_file_path=None, is_added=False, stats=None):
+        self.files_validator = files_validator
+        self.file_path = file_path
+        self.old_file_path = old_file_path
+        self.is_added = is_added
+        self.is_package = False
+        self.stats = stats or CheckStats()
+        self._inputs = {}  # type: dict
+        self._script_structure_validator = None  # type: Optional[StructureValidator]
+
+    def get(self, name):
+        """Gets an input of the file, resolving it on the first call."""
+        if name not in self._inputs:
+            start_time = time.perf_counter()
+            self._inputs[name] = getattr(self, '_resolve_' + name.replace('-', '_'))()
+            self.stats._add(self.stats.input_durations, name, time.perf_counter() - start_time)
+            self.stats._add(self.stats.resolved_inputs, name)
+        return self._inputs[name]
+
+    def _resolve_current_file(self):
+        return StructureValidator(self.file_path, self.old_file_path, git_context=self.files_validator.git_context,
+                                  old_file_provider=self.files_validator.old_file_provider)
+
+    def _resolve_old_file(self):
+        return self.structure_validator.old_file
+
+    def _resolve_id_set(self):
+        return self.files_validator.id_set_validator
+
+    def _resolve_conf_json(self):
+        return self.files_validator.conf_json_validator
+
+    def _resolve_git_diff(self):
+        # The diffs are queried through the git context of the run, once for all the files
+        return self.files_validator.git_context
+
+    def _resolve_docker_tag(self):
+        return DockerImageValidator(self.script_structure_validator.entity, is_modified_file=True,
+                                    is_integration=self.structure_validator.scheme_name == 'integration')
+
+    @property
+    def structure_validator(self):
+        # type: () -> StructureValidator
+        return self.get(CURRENT_FILE)
+
+    @property
+    def script_structure_validator(self):
+        # type: () -> StructureValidator
+        """The structure validator of the yml file of a script or an integration, also if the file is in a package."""
+        if self._script_structure_validator is None:
+            structure_validator = self.structure_validator
+            if self.is_package:
+                yml_path, _ = Unifier(structure_validator.entity).get_script_package_data()
+                # Set file path to the yml file
+                structure_validator.entity = get_content_entity(yml_path)
+                structure_validator.file_path = yml_path
+            self._script_structure_validator = structure_validator
+        return self._script_structure_validator
+
+
+@register_check('structure', [CURRENT_FILE, OLD_FILE])
+def check_structure(file_inputs):
+    return file_inputs.structure_validator.is_valid_file()
+
+
+@register_check('id-set', [CURRENT_FILE, ID_SET])
+def check_id_set(file_inputs):
+    return file_inputs.get(ID_SET).is_file_valid_in_set(file_inputs.structure_validator.entity)
+
+
+@register_check('id-set-used-id', [CURRENT_FILE, ID_SET])
+def check_id_set_used_id(file_inputs):
+    return not file_inputs.get(ID_SET).is_file_has_used_id(file_inputs.structure_validator.entity)
+
+
+@register_check('image', [CURRENT_FILE])
+def check_image(file_inputs):
+    return ImageValidator(file_inputs.structure_validator.entity).is_valid()
+
+
+@register_check('description', [CURRENT_FILE])
+def check_description(file_inputs):
+    return DescriptionValidator(file_inputs.structure_validator.entity).is_valid()
+
+
+@register_check('beta-description', [CURRENT_FILE])
+def check_beta_description(file_inputs):
+    return DescriptionValidator(file_inputs.structure_validator.entity).is_valid_beta_description()
+
+
+@register_check('integration-backward-compatibility', [CURRENT_FILE, OLD_FILE], is_backward_check=True)
+def check_integration_backward_compatibility(file_inputs):
+    return IntegrationValidator(file_inputs.structure_validator).is_backward_compatible()
+
+
+@register_check('integration', [CURRENT_FILE, GIT_DIFF])
+def check_integration(file_inputs):
+    return IntegrationValidator(file_inputs.structure_validator).is_valid_file(validate_rn=not file_inputs.is_added,
+                                                                               validate_docker=False)
+
+
+@register_check('integration-docker-image', [CURRENT_FILE, DOCKER_TAG])
+def check_integration_docker_image(file_inputs):
+    integration_validator = IntegrationValidator(file_inputs.structure_validator)
+    return integration_validator.is_docker_image_valid(file_inputs.get(DOCKER_TAG))
+
+
+@register_check('beta-integration', [CURRENT_FILE])
+def check_beta_integration(file_inputs):
+    return IntegrationValidator(file_inputs.structure_validator).is_valid_beta_integration()
+
+
+@register_check('script-backward-compatibility', [CURRENT_FILE, OLD_FILE], is_backward_check=True)
+def check_script_backward_compatibility(file_inputs):
+    return ScriptValidator(file_inputs.script_structure_validator).is_backward_compatible(validate_docker=False)
+
+
+@register_check('script-docker-image', [CURRENT_FILE, OLD_FILE, DOCKER_TAG], is_backward_check=True)
+def check_script_docker_image(file_inputs):
+    # The docker image of a script is checked with its backward compatibility, only if it has an old version
+    script_validator = ScriptValidator(file_inputs.script_structure_validator)
+    if not script_validator.old_file:
+        return True
+    # is_docker_image_valid returns whether the image breaks backward compatibility
+    return not script_validator.is_docker_image_valid(file_inputs.get(DOCKER_TAG))
+
+
+@register_check('script', [CURRENT_FILE, GIT_DIFF])
+def check_script(file_inputs):
+    return ScriptValidator(file_inputs.script_structure_validator).is_valid_file(
+        validate_rn=not file_inputs.is_added)
+
+
+@register_check('playbook', [CURRENT_FILE])
+def check_playbook(file_inputs):
+    return PlaybookValidator(file_inputs.structure_validator).is_valid_playbook(is_new_playbook=file_inputs.is_added)
+
+
+@register_check('incident-field', [CURRENT_FILE, GIT_DIFF])
+def check_incident_field(file_inputs):
+    return IncidentFieldValidator(file_inputs.structure_validator).is_valid_file()
+
+
+@register_check('incident-field-backward-compatibility', [CURRENT_FILE, OLD_FILE], is_backward_check=True)
+def check_incident_field_backward_compatibility(file_inputs):
+    return IncidentFieldValidator(file_inputs.structure_validator).is_backward_compatible()
+
+
+@register_check('layout', [CURRENT_FILE])
+def check_layout(file_inputs):
+    return LayoutValidator(file_inputs.structure_validator).is_valid_layout()
+
+
+@register_check('release-notes', [GIT_DIFF])
+def check_release_notes(file_inputs):
+    return file_inputs.files_validator.is_valid_release_notes(file_inputs.file_path)
+
+
+@register_check('conf-json', [CONF_JSON])
+def check_conf_json(file_inputs):
+    return file_inputs.get(CONF_JSON).is_valid_conf_json()
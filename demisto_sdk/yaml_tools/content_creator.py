@@ -2,15 +2,16 @@ import os
 import io
 import re
 import glob
-import yaml
 import json
 import shutil
 import zipfile
 from typing import List
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.yaml_tools.unifier import Unifier
 from demisto_sdk.common.tools import get_child_directories, get_child_files, print_warning, \
     get_yml_paths_in_dir, print_error
+from demisto_sdk.common.git_context import GitContext
 from demisto_sdk.common.git_tools import get_current_working_branch
 from demisto_sdk.common.constants import INTEGRATIONS_DIR, MISC_DIR, PLAYBOOKS_DIR, REPORTS_DIR, DASHBOARDS_DIR, \
     WIDGETS_DIR, SCRIPTS_DIR, INCIDENT_FIELDS_DIR, CLASSIFIERS_DIR, LAYOUTS_DIR, CONNECTIONS_DIR, \
@@ -21,7 +22,8 @@ from demisto_sdk.common.constants import INTEGRATIONS_DIR, MISC_DIR, PLAYBOOKS_D
 class ContentCreator:
 
     def __init__(self, artifacts_path: str, content_version='', content_bundle_path='',
-                 test_bundle_path='', packs_bundle_path='', preserve_bundles=False):
+                 test_bundle_path='', packs_bundle_path='', preserve_bundles=False, git_context=None):
+        self.git_context = git_context or GitContext()
         self.artifacts_path = artifacts_path if artifacts_path else '/home/circleci/project/artifacts'
         self.content_version = content_version
         self.preserve_bundles = preserve_bundles
@@ -174,7 +176,7 @@ class ContentCreator:
                 self.long_file_names.append(path)
 
             with open(path, 'r') as file_:
-                yml_info = yaml.safe_load(file_)
+                yml_info = yaml_backend.safe_load(file_)
 
             ver = yml_info.get('fromversion', '0')
             print(f' - processing: {ver} ({path})')
@@ -344,10 +346,10 @@ class ContentCreator:
             print_warning(f'Could not open CommonServerPython File - {ex}')
 
     @staticmethod
-    def update_branch(path: str = './Scripts/CommonServerPython/CommonServerPython.py'):
+    def update_branch(path: str = './Scripts/CommonServerPython/CommonServerPython.py', git_context: GitContext = None):
 
         regex = r'CONTENT_BRANCH_NAME = .*'
-        branch_name = get_current_working_branch()
+        branch_name = get_current_working_branch(git_context)
         try:
             with open(path, 'r+') as file_:
                 content = file_.read()
@@ -365,7 +367,7 @@ class ContentCreator:
         """
         # update content_version in commonServerPython
         self.update_content_version(self.content_version)
-        branch_name = self.update_branch()
+        branch_name = self.update_branch(git_context=self.git_context)
         print(f'Updated CommonServerPython with branch {branch_name} and content version {self.content_version}')
         print('Starting to create content artifact...')
 
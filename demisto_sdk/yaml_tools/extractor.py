@@ -1,13 +1,12 @@
-import yaml
 import os
 import base64
 import subprocess
 import shutil
 import tempfile
 from io import open
-from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import SingleQuotedScalarString
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.configuration import Configuration
 from demisto_sdk.common.tools import print_color, LOG_COLORS, get_docker_images, get_python_version, get_pipenv_dir
 
@@ -43,8 +42,7 @@ class Extractor:
         self.extract_long_description("{}/{}_description.md".format(output_path, base_name))
         yaml_out = "{}/{}.yml".format(output_path, base_name)
         print("Creating yml file: {} ...".format(yaml_out))
-        ryaml = YAML()
-        ryaml.preserve_quotes = True
+        ryaml = yaml_backend.round_trip_yaml()
         with open(self.yml_path, 'r') as yf:
             yaml_obj = ryaml.load(yf)
         script_obj = yaml_obj
@@ -125,7 +123,7 @@ class Extractor:
         if common_server:
             common_server = "CommonServerPython" not in self.yml_path
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_backend.safe_load(yml_file)
             script = yml_data['script']
             if yml_type == INTEGRATION:  # in integration the script is stored at a second level
                 script = script['script']
@@ -148,7 +146,7 @@ class Extractor:
             return 0  # no image in script type
         print("Extracting image to: {} ...".format(output_path))
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_backend.safe_load(yml_file)
             image_b64 = yml_data['image'].split(',')[1]
         with open(output_path, 'wb') as image_file:
             image_file.write(base64.decodebytes(image_b64.encode('utf-8')))
@@ -159,7 +157,7 @@ class Extractor:
         if yml_type == SCRIPT:
             return 0  # no long description in script type
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_backend.safe_load(yml_file)
             long_description = yml_data.get('detaileddescription')
         if long_description:
             print("Extracting long description to: {} ...".format(output_path))
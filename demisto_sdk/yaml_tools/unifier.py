@@ -1,12 +1,13 @@
 import os
 import io
 import glob
-import yaml
 import base64
 import re
-from typing import Tuple
+from typing import Tuple, Union
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.constants import Errors
+from demisto_sdk.common.content_entity import ContentEntity
 from demisto_sdk.common.tools import get_yaml, server_version_compare, get_yml_paths_in_dir, print_error, print_color, \
     LOG_COLORS
 from demisto_sdk.common.constants import TYPE_TO_EXTENSION, INTEGRATIONS_DIR, DIR_TO_PREFIX, DEFAULT_IMAGE_PREFIX, \
@@ -15,9 +16,15 @@ from demisto_sdk.common.constants import TYPE_TO_EXTENSION, INTEGRATIONS_DIR, DI
 
 class Unifier:
 
-    def __init__(self, indir: str, dir_name=INTEGRATIONS_DIR, outdir='',
+    def __init__(self, indir: Union[str, ContentEntity], dir_name=INTEGRATIONS_DIR, outdir='',
                  image_prefix=DEFAULT_IMAGE_PREFIX):
 
+        # an entity of a package yml/code file stands for its package directory
+        self.entity = None
+        if isinstance(indir, ContentEntity):
+            self.entity = indir
+            indir = os.path.dirname(indir.path)
+
         directory_name = ""
         for optional_dir_name in DIR_TO_PREFIX:
             if optional_dir_name in indir:
@@ -115,7 +122,7 @@ class Unifier:
                 break
 
         with open(yml_path, 'r') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_backend.safe_load(yml_file)
 
         script_obj = yml_data
 
@@ -148,7 +155,7 @@ class Unifier:
         else:
             yml_text = 'image: ' + image_data + '\n' + yml_text
         # verify that our yml is good (loads and returns the image)
-        mod_yml_data = yaml.safe_load(yml_text)
+        mod_yml_data = yaml_backend.safe_load(yml_text)
         yml_image = mod_yml_data.get('image')
         assert yml_image.strip() == image_data.strip()
 
@@ -242,7 +249,7 @@ class Unifier:
         yml_text = yml_text.replace("script: '-'", "script: " + script_code)
 
         # verify that our yml is good (loads and returns the code)
-        mod_yml_data = yaml.safe_load(yml_text)
+        mod_yml_data = yaml_backend.safe_load(yml_text)
         if self.dir_name == 'Scripts':
             yml_script = mod_yml_data.get('script')
         else:
@@ -257,7 +264,10 @@ class Unifier:
         if not yml_path:
             raise Exception("No yml files found in package path: {}. "
                             "Is this really a package dir? If not remove it.".format(self.package_path))
-        code_type = get_yaml(yml_path).get('type')
+        if self.entity is not None and os.path.normpath(self.entity.path) == os.path.normpath(yml_path):
+            code_type = self.entity.data.get('type')
+        else:
+            code_type = get_yaml(yml_path).get('type')
         unifier = Unifier(self.package_path)
         code_path = unifier.get_code_file(TYPE_TO_EXTENSION[code_type])
         with open(code_path, 'r') as code_file:
@@ -1,8 +1,7 @@
 import os
 import sys
-import yaml
-import yamlordereddictloader
 
+from demisto_sdk.common import yaml_backend
 from demisto_sdk.common.tools import print_color, LOG_COLORS
 from demisto_sdk.common.hook_validations.structure import StructureValidator
 
@@ -33,7 +32,7 @@ class BaseUpdateYML:
 
         try:
             self.yml_data = self.get_yml_data_as_dict()
-        except yaml.YAMLError:
+        except yaml_backend.YAMLError:
             print_color('Provided file is not a valid YML.', LOG_COLORS.RED)
             sys.exit(1)
 
@@ -67,7 +66,7 @@ class BaseUpdateYML:
         print(F'Reading YML data')
 
         with open(self.source_file) as f:
-            return yaml.load(f, Loader=yamlordereddictloader.SafeLoader)
+            return yaml_backend.ordered_load(f)
 
     def get_id_and_version_path_object(self):
         """Gets the dict that holds the id and version fields.
@@ -106,21 +105,8 @@ class BaseUpdateYML:
         """Safely saves formatted YML data to destination file."""
         print(F'Saving output YML file to {self.output_file_name}')
 
-        # Configure safe dumper (multiline for strings)
-        yaml.SafeDumper.org_represent_str = yaml.SafeDumper.represent_str
-
-        def repr_str(dumper, data):
-            if '\n' in data:
-                return dumper.represent_scalar(u'tag:yaml.org,2002:str', data, style='|')
-            return dumper.org_represent_str(data)
-        yaml.add_representer(str, repr_str, Dumper=yamlordereddictloader.SafeDumper)
-
         with open(self.output_file_name, 'w') as f:
-            yaml.dump(
-                self.yml_data,
-                f,
-                Dumper=yamlordereddictloader.SafeDumper,
-                default_flow_style=False)
+            yaml_backend.ordered_dump(self.yml_data, f, multiline_strings=True, default_flow_style=False)
 
     def update_yml(self):
         """Manager function for the generic YML updates."""
@@ -1,5 +1,10 @@
+import os
+import subprocess
+import threading
 import warnings
+from http.server import ThreadingHTTPServer
 
+import pytest
 import urllib3
 
 
@@ -11,3 +16,47 @@ def pytest_sessionstart(session):
 def pytest_sessionfinish(session):
     # return warnings to default
     warnings.simplefilter("default", urllib3.exceptions.HTTPWarning)
+
+
+def git(repo, *args):
+    """Runs a git command in the repository, committing as a test user."""
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@test.com'] + list(args), cwd=repo,
+                   check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def write(repo, path, content):
+    """Writes a file of the repository, creating its directories."""
+    full_path = os.path.join(repo, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'w') as f:
+        f.write(content)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """An empty git repository on the master branch."""
+    repo = str(tmp_path)
+    git(repo, 'init', '-q', '-b', 'master')
+    return repo
+
+
+@pytest.fixture
+def http_server():
+    """Starts stand-in HTTP servers on local ports for the test.
+
+    Returns:
+        function. Gets a request handler class, starts a server which serves it and returns the url of the server.
+    """
+    servers = []
+
+    def start(handler_class):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+        thread.start()
+        servers.append(server)
+        return 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
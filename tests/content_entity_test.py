@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from demisto_sdk.common import content_entity
+from demisto_sdk.common.content_entity import ContentEntity, Integration, Script, Playbook, IncidentField, Layout, \
+    get_content_entity
+
+XDR_PACKAGE = os.path.join('tests', 'test_files', 'CortexXDR', 'Integrations', 'PaloAltoNetworks_XDR')
+XDR_YML = os.path.join(XDR_PACKAGE, 'PaloAltoNetworks_XDR.yml')
+
+
+@pytest.mark.parametrize('path, entity_class', [
+    ('Integrations/integration-Zoom.yml', Integration),
+    ('Packs/Zoom/Integrations/Zoom/Zoom.yml', Integration),
+    ('Scripts/script-Hello.yml', Script),
+    ('Playbooks/playbook-Hello.yml', Playbook),
+    ('IncidentFields/incidentfield-Hello.json', IncidentField),
+    ('Layouts/layout-details-Hello.json', Layout),
+    ('README.md', ContentEntity),
+])
+def test_get_content_entity(path, entity_class):
+    assert type(get_content_entity(path)) is entity_class
+
+
+def test_get_content_entity_returns_given_entity():
+    entity = Integration(XDR_YML)
+    assert get_content_entity(entity) is entity
+
+
+def test_entity_has_no_instance_dict():
+    entity = Integration(XDR_YML)
+    assert not hasattr(entity, '__dict__')
+    with pytest.raises(AttributeError):
+        entity.unknown_attribute = True
+
+
+def test_attributes_are_lazy_and_memoized(mocker):
+    get_yaml = mocker.spy(content_entity, 'get_yaml')
+    entity = Integration(XDR_YML)
+    assert get_yaml.call_count == 0
+
+    assert entity.id == 'Cortex XDR - IR'
+    assert entity.name == 'Cortex XDR - IR'
+    assert 'xdr-get-incidents' in entity.commands
+    assert entity.docker_image
+    assert get_yaml.call_count == 1
+
+
+def test_unload_keeps_derived_attributes(mocker):
+    entity = Integration(XDR_YML)
+    commands = entity.commands
+    entity.unload()
+
+    get_yaml = mocker.spy(content_entity, 'get_yaml')
+    assert entity.commands == commands
+    assert get_yaml.call_count == 0
+
+
+def test_package_files():
+    entity = Integration(XDR_YML)
+    assert not entity.is_unified
+    assert entity.package_path == XDR_PACKAGE
+    assert entity.image_path == os.path.join(XDR_PACKAGE, 'PaloAltoNetworks_XDR_image.png')
+    assert entity.description_path == os.path.join(XDR_PACKAGE, 'PaloAltoNetworks_XDR_description.md')
+
+
+def test_unified_integration_has_no_package_files():
+    entity = Integration('Integrations/integration-Zoom.yml')
+    assert entity.is_unified
+    assert entity.package_path is None
+    assert entity.image_path is None
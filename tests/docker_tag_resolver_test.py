@@ -0,0 +1,176 @@
+import json
+import pickle
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse
+
+import pytest
+
+from demisto_sdk.common.docker_tag_resolver import DockerTagResolver, get_image_name, docker_tag_resolver
+from demisto_sdk.common.hook_validations.docker import DockerImageValidator
+from demisto_sdk.common.hook_validations.integration import IntegrationValidator
+from demisto_sdk.common.hook_validations.structure import StructureValidator
+
+TOKEN = 'registry-token'
+# disable-secrets-detection-start
+HUB_TAGS = {
+    'demisto/python3': [{'name': '3.7.4.2245', 'last_updated': '2019-10-23T09:13:30.84299Z'},
+                        {'name': '3.7.4.977', 'last_updated': '2019-08-16T06:47:29.631011Z'}],
+    'demisto/slack': [{'name': '1.0.0.4', 'last_updated': '2019-10-16T06:47:29.631011Z'}],
+}
+# images which are not on docker hub, only in the registry
+REGISTRY_TAGS = {
+    'demisto/private': ['1.0.0.9', '1.0.0.10', 'latest'],
+}
+# disable-secrets-detection-end
+
+
+class DockerRegistryHandler(BaseHTTPRequestHandler):
+    """A stand-in for docker hub, the docker registry and its token service."""
+    requests = []  # type: list
+
+    def send_json(self, data, status=200, headers=None):
+        content = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        self.requests.append(path)
+        if path.startswith('/hub/v2/repositories/'):
+            image_name = path[len('/hub/v2/repositories/'):-len('/tags')]
+            if image_name in HUB_TAGS:
+                self.send_json({'results': HUB_TAGS[image_name]})
+            else:
+                self.send_json({}, status=404)
+        elif path == '/registry/v2/':
+            realm = 'http://{}:{}/token'.format(*self.server.server_address)
+            self.send_json({}, status=401, headers={
+                'Www-Authenticate': 'Bearer realm="{}",service="registry.test"'.format(realm)})
+        elif path == '/token':
+            self.send_json({'token': TOKEN})
+        elif path.startswith('/registry/v2/'):
+            image_name = path[len('/registry/v2/'):-len('/tags/list')]
+            if self.headers.get('Authorization') != 'Bearer {}'.format(TOKEN):
+                self.send_json({}, status=401)
+            elif image_name in REGISTRY_TAGS:
+                self.send_json({'name': image_name, 'tags': REGISTRY_TAGS[image_name]})
+            else:
+                self.send_json({}, status=404)
+        else:
+            self.send_json({}, status=404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    DockerRegistryHandler.requests = []
+    return http_server(DockerRegistryHandler)
+
+
+def create_resolver(base_url, **kwargs):
+    return DockerTagResolver(hub_url=base_url + '/hub', registry_url=base_url + '/registry', max_workers=4, **kwargs)
+
+
+def test_resolve_once_per_run(server):
+    resolver = create_resolver(server)
+    resolver.resolve(['demisto/python3', 'demisto/slack', 'demisto/python3'])
+    assert sorted(DockerRegistryHandler.requests) == ['/hub/v2/repositories/demisto/python3/tags',
+                                                      '/hub/v2/repositories/demisto/slack/tags']
+
+    assert resolver.get_latest_tag('demisto/python3') == '3.7.4.2245'
+    assert resolver.get_latest_tag('demisto/slack') == '1.0.0.4'
+    assert len(DockerRegistryHandler.requests) == resolver.requests_count == 2
+
+
+def test_registry_fallback(server):
+    resolver = create_resolver(server)
+    assert resolver.get_latest_tag('demisto/private') == '1.0.0.10'
+    assert DockerRegistryHandler.requests == ['/hub/v2/repositories/demisto/private/tags', '/registry/v2/', '/token',
+                                              '/registry/v2/demisto/private/tags/list']
+
+
+def test_failure_is_not_retried(server):
+    resolver = create_resolver(server)
+    resolver.resolve(['demisto/missing'])
+    requests_count = resolver.requests_count
+    for _ in range(2):
+        with pytest.raises(Exception):
+            resolver.get_latest_tag('demisto/missing')
+    assert resolver.requests_count == requests_count
+
+
+def test_disk_cache_ttl(server, tmp_path):
+    create_resolver(server, cache_dir=str(tmp_path)).resolve(['demisto/python3'])
+    assert len(DockerRegistryHandler.requests) == 1
+
+    resolver = create_resolver(server, cache_dir=str(tmp_path))
+    assert resolver.get_latest_tag('demisto/python3') == '3.7.4.2245'
+    assert resolver.requests_count == 0
+
+    expired_resolver = create_resolver(server, cache_dir=str(tmp_path), ttl=0)
+    assert expired_resolver.get_latest_tag('demisto/python3') == '3.7.4.2245'
+    assert expired_resolver.requests_count == 1
+
+
+def test_offline(server, tmp_path):
+    create_resolver(server, cache_dir=str(tmp_path)).resolve(['demisto/python3'])
+
+    resolver = create_resolver(server, cache_dir=str(tmp_path), ttl=0, offline=True)
+    assert resolver.get_latest_tag('demisto/python3') == '3.7.4.2245'
+    with pytest.raises(LookupError):
+        resolver.get_latest_tag('demisto/slack')
+    assert resolver.requests_count == 0
+
+
+def test_offline_tag_check_is_skipped(mocker, capsys):
+    mocker.patch.object(docker_tag_resolver, 'offline', True)
+    mocker.patch.object(docker_tag_resolver, 'disk_cache', None)
+    mocker.patch.dict(docker_tag_resolver._tags, clear=True)
+    docker_image_validator = DockerImageValidator('tests/test_files/integration-Zoom.yml', is_modified_file=False,
+                                                  is_integration=True)
+    assert docker_image_validator.is_docker_image_valid()
+    output = capsys.readouterr().out
+    assert 'demisto/pyjwt is not cached' in output and 'skipping the docker image tag check' in output
+
+    integration_validator = IntegrationValidator(StructureValidator('tests/test_files/integration-Zoom.yml'))
+    assert integration_validator.is_docker_image_valid()
+
+
+@pytest.mark.parametrize('latest_tag, is_valid', [('1.0', True), ('1.0.0.9', False)])
+def test_integration_docker_image_check(mocker, latest_tag, is_valid):
+    mocker.patch.object(docker_tag_resolver, 'offline', False)
+    mocker.patch.dict(docker_tag_resolver._tags, {'demisto/pyjwt': latest_tag}, clear=True)
+    integration_validator = IntegrationValidator(StructureValidator('tests/test_files/integration-Zoom.yml'))
+    docker_image_validator = DockerImageValidator('tests/test_files/integration-Zoom.yml', is_modified_file=False,
+                                                  is_integration=True)
+    assert integration_validator.is_docker_image_valid(docker_image_validator) is is_valid
+    assert integration_validator.is_valid is is_valid
+
+
+def test_state(server, tmp_path):
+    resolver = create_resolver(server, cache_dir=str(tmp_path), ttl=5, offline=False)
+    resolver.resolve(['demisto/python3', 'demisto/missing'])
+    resolver.offline = True
+
+    worker_resolver = DockerTagResolver()
+    worker_resolver.set_state(pickle.loads(pickle.dumps(resolver.get_state())))
+    assert (worker_resolver.ttl, worker_resolver.offline) == (5, True)
+    assert worker_resolver.disk_cache.cache_dir == str(tmp_path)
+    assert worker_resolver.get_latest_tag('demisto/python3') == '3.7.4.2245'
+    with pytest.raises(Exception):
+        worker_resolver.get_latest_tag('demisto/missing')
+    assert worker_resolver.requests_count == 0
+
+
+@pytest.mark.parametrize('docker_image, image_name', [('demisto/python3:3.7.4.2245', 'demisto/python3'),
+                                                      ('demisto/python3', 'demisto/python3'),
+                                                      ('', 'demisto/python'),
+                                                      ('blah/blah:1.2.3.4', '')])
+def test_get_image_name(docker_image, image_name):
+    assert get_image_name(docker_image) == image_name
@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+import shutil
+
+import pytest
+
+from demisto_sdk.common.docker_tag_resolver import docker_tag_resolver
+from demisto_sdk.validation.file_validator import FilesValidator
+
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+CONTENT_FILES = {
+    'Playbooks/playbook-invalid.yml': 'Playbooks.playbook-invalid.yml',
+    'Playbooks/playbook-test.yml': 'Playbooks.playbook-test.yml',
+    'Scripts/script-valid.yml': 'script-valid.yml',
+    'Scripts/script-invalid.yml': 'script-invalid.yml',
+    'Integrations/Zoom/Zoom.yml': 'integration-Zoom.yml',
+    'Integrations/Test/Test.yml': 'integration-test.yml',
+    'IncidentFields/incidentfield-valid.json': 'incidentfield-valid.json',
+}
+
+
+@pytest.fixture
+def content_repo(tmp_path, monkeypatch):
+    for path, test_file in CONTENT_FILES.items():
+        os.makedirs(os.path.dirname(str(tmp_path / path)), exist_ok=True)
+        shutil.copy(os.path.join(TEST_FILES, test_file), str(tmp_path / path))
+    monkeypatch.chdir(tmp_path)
+
+
+def validate_all_files(jobs):
+    files_validator = FilesValidator(validate_conf_json=False, jobs=jobs)
+    files_validator.validate_all_files()
+    return files_validator._is_valid
+
+
+@pytest.mark.parametrize('jobs', [2, 3])
+def test_parallel_validation_is_like_serial_validation(content_repo, capsys, jobs):
+    is_valid = validate_all_files(jobs=1)
+    serial_output = capsys.readouterr().out
+    assert not is_valid
+    assert 'Validating Zoom' not in serial_output and 'Validating Integrations/Zoom/Zoom.yml' in serial_output
+
+    assert validate_all_files(jobs=jobs) == is_valid
+    assert capsys.readouterr().out == serial_output
+
+
+def test_parallel_validation_of_valid_files(content_repo, capsys):
+    os.remove('Playbooks/playbook-invalid.yml')
+    os.remove('Scripts/script-invalid.yml')
+    assert validate_all_files(jobs=1) == validate_all_files(jobs=2)
+
+
+def test_error_is_raised_after_the_preceding_output(capsys):
+    files_validator = FilesValidator(validate_conf_json=False, jobs=2)
+    validations = [('print_directory_header', 'Playbooks'), ('validate_file_scheme', 'missing.yml', 'missing.yml'),
+                   ('print_directory_header', 'Scripts')]
+    with pytest.raises(FileNotFoundError):
+        files_validator.run_validations(validations)
+
+    output = capsys.readouterr().out
+    assert 'Validating Playbooks directory:' in output
+    assert 'Validating missing.yml' in output
+    assert 'Validating Scripts directory:' not in output
+
+
+@pytest.mark.parametrize('validate', ['validate_modified_file', 'validate_added_file'])
+@pytest.mark.parametrize('is_valid', [True, False])
+def test_release_notes_validation(mocker, validate, is_valid):
+    from demisto_sdk.common import tools
+    from demisto_sdk.common.hook_validations.release_notes import ReleaseNotesValidator
+    from demisto_sdk.common.hook_validations.structure import StructureValidator
+    # release notes are not content entities, only the release notes check runs on them
+    mocker.patch('demisto_sdk.validation.file_validator.checked_type',
+                 side_effect=lambda file_path, regexes=None: regexes is None or tools.checked_type(file_path, regexes))
+    mocker.patch.object(StructureValidator, '__init__', return_value=None)
+    mocker.patch.object(StructureValidator, 'is_valid_file', return_value=True)
+    mocker.patch.object(ReleaseNotesValidator, '__init__', return_value=None)
+    mocker.patch.object(ReleaseNotesValidator, 'is_file_valid', return_value=is_valid)
+    files_validator = FilesValidator(validate_conf_json=False)
+    assert getattr(files_validator, validate)('Packs/Zoom/CHANGELOG.md') is is_valid
+
+
+def test_prefetch_docker_tags(content_repo, mocker):
+    resolve = mocker.patch('demisto_sdk.validation.file_validator.docker_tag_resolver.resolve')
+    files_validator = FilesValidator(validate_conf_json=False)
+    files_validator.prefetch_docker_tags(['Integrations/Zoom/Zoom.yml', 'Integrations/Test/Test.yml',
+                                          'Scripts/script-valid.yml', 'Playbooks/playbook-test.yml'])
+    assert sorted(resolve.call_args[0][0]) == ['demisto/pyjwt', 'demisto/python']
+
+    FilesValidator(validate_conf_json=False, skipped_checks=['integration-docker-image']).prefetch_docker_tags(
+        ['Integrations/Zoom/Zoom.yml', 'Scripts/script-valid.yml'], is_added=True)
+    assert list(resolve.call_args[0][0]) == []
+
+
+def test_spawned_workers_use_the_docker_tags_of_the_parent(content_repo, mocker, capsys):
+    # spawned workers (the default on macOS and windows) do not inherit the resolver of the parent
+    mocker.patch('demisto_sdk.common.parallel.Pool', multiprocessing.get_context('spawn').Pool)
+    mocker.patch.object(docker_tag_resolver, 'offline', True)
+    mocker.patch.object(docker_tag_resolver, 'disk_cache', None)
+    mocker.patch.dict(docker_tag_resolver._tags, {'demisto/pyjwt': '1.0'}, clear=True)
+    FilesValidator(validate_conf_json=False, jobs=2).run_validations([
+        ('validate_added_file', 'Integrations/Zoom/Zoom.yml'), ('validate_added_file', 'Integrations/Test/Test.yml')])
+
+    output = capsys.readouterr().out
+    # the prefetched tag is used, and the tags which were not prefetched are not queried in offline mode
+    assert 'demisto/pyjwt is not cached' not in output
+    assert 'demisto/python is not cached' in output
+    assert 'Failed getting tag' not in output
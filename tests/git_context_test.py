@@ -0,0 +1,96 @@
+import subprocess
+
+import pytest
+
+from demisto_sdk.common.git_context import GitContext, ChangedFile, split_diff, get_added_line_numbers
+from tests.conftest import git, write
+
+
+@pytest.fixture
+def repo(git_repo):
+    repo = git_repo
+    write(repo, 'Integrations/Zoom/Zoom.yml', 'name: Zoom\nfromversion: 4.5.0\n')
+    write(repo, 'Scripts/Old Name/script.yml', 'name: script\n')
+    write(repo, 'CHANGELOG.md', '## [Unreleased]\n')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'initial')
+    git(repo, 'checkout', '-q', '-b', 'feature')
+
+    write(repo, 'Integrations/Zoom/Zoom.yml', 'name: Zoom\nfromversion: 5.0.0\n')
+    git(repo, 'mv', 'Scripts/Old Name', 'Scripts/New Name')
+    write(repo, 'Playbooks/playbook-New.yml', 'id: New\n')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'change')
+    write(repo, 'CHANGELOG.md', '## [Unreleased]\n  - Fixed an issue.\n')
+    return repo
+
+
+def test_branch_and_head(repo):
+    git_context = GitContext(cwd=repo)
+    assert git_context.branch == 'feature'
+    assert len(git_context.head) == 40
+    assert not git_context.is_merging
+
+
+def test_get_changed_files(repo):
+    git_context = GitContext(cwd=repo)
+    changed_files = git_context.get_branch_changed_files('master')
+    assert ChangedFile('M', 'Integrations/Zoom/Zoom.yml', None) in changed_files
+    assert ChangedFile('A', 'Playbooks/playbook-New.yml', None) in changed_files
+    assert ChangedFile('R100', 'Scripts/New Name/script.yml', 'Scripts/Old Name/script.yml') in changed_files
+
+    assert git_context.get_changed_files() == [ChangedFile('M', 'CHANGELOG.md', None)]
+
+
+def test_get_name_status(repo):
+    name_status = GitContext(cwd=repo).get_name_status('master', 'HEAD')
+    assert 'M\tIntegrations/Zoom/Zoom.yml\n' in name_status
+    assert 'R100\tScripts/Old Name/script.yml\tScripts/New Name/script.yml\n' in name_status
+
+
+def test_get_file_diff(repo):
+    git_context = GitContext(cwd=repo)
+    zoom_diff = git_context.get_file_diff('Integrations/Zoom/Zoom.yml', 'master')
+    assert zoom_diff.startswith('diff --git a/Integrations/Zoom/Zoom.yml')
+    assert '+fromversion: 5.0.0\n' in zoom_diff
+    assert 'CHANGELOG' not in zoom_diff
+    assert '+  - Fixed an issue.' in git_context.get_file_diff('./CHANGELOG.md', 'master')
+    assert git_context.get_file_diff('Playbooks/playbook-Other.yml', 'master') == ''
+
+
+@pytest.mark.parametrize('path', ['Integrations/Zoom/Zoom.yml', 'Scripts/New Name/script.yml',
+                                  'Scripts/Old Name/script.yml', 'CHANGELOG.md'])
+def test_get_file_diff_is_the_diff_of_the_file(repo, path):
+    expected_diff = subprocess.run(['git', 'diff', 'master', '--', path], cwd=repo,
+                                   stdout=subprocess.PIPE, universal_newlines=True).stdout
+    assert GitContext(cwd=repo).get_file_diff(path, 'master') == expected_diff
+
+
+def test_queries_run_once(repo):
+    git_context = GitContext(cwd=repo)
+    for _ in range(3):
+        assert git_context.branch == 'feature'
+        git_context.get_name_status('--no-merges', 'HEAD')
+        git_context.get_file_diff('Integrations/Zoom/Zoom.yml', 'master')
+        git_context.get_file_diff('CHANGELOG.md', 'master')
+        git_context.get_file_diff('CHANGELOG.md', 'master', unified=100)
+
+    assert git_context.command_count == 4
+
+
+def test_split_diff_of_deleted_and_binary_files():
+    diff = 'diff --git a/a.txt b/a.txt\ndeleted file mode 100644\n--- a/a.txt\n+++ /dev/null\n@@ -1 +0,0 @@\n-a\n' \
+           'diff --git a/b.png b/b.png\nindex 1..2 100644\nBinary files a/b.png and b/b.png differ\n'
+    file_diffs = split_diff(diff)
+    assert sorted(file_diffs) == ['a.txt', 'b.png']
+    assert file_diffs['a.txt'].endswith('-a\n')
+    assert ''.join(file_diffs.values()) == diff
+
+
+def test_get_added_line_numbers(repo):
+    write(repo, 'Integrations/Zoom/Zoom.yml', 'id: Zoom\nname: Zoom\nfromversion: 5.0.0\ntoversion: 6.0.0\n')
+    git_context = GitContext(repo)
+    assert get_added_line_numbers(git_context.get_file_diff('Integrations/Zoom/Zoom.yml', 'HEAD', unified=0)) == {1, 4}
+    assert get_added_line_numbers(git_context.get_file_diff('Integrations/Zoom/Zoom.yml', 'HEAD')) == {1, 4}
+    assert get_added_line_numbers(git_context.get_file_diff('CHANGELOG.md', 'HEAD')) == {2}
+    assert get_added_line_numbers(git_context.get_file_diff('Playbooks/missing.yml', 'HEAD')) == set()
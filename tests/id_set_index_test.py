@@ -0,0 +1,61 @@
+from demisto_sdk.common.id_set_index import IdSetIndex, parse_version
+
+INSTANCES = [
+    {'Test': {'name': 'Test', 'file_path': 'B', 'fromversion': '3.5.0', 'toversion': '4.5.0'}},
+    {'Other': {'name': 'Other'}},
+    {'Test': {'name': 'Test', 'file_path': 'A', 'fromversion': '3.0.0', 'toversion': '3.6.0'}},
+    {'Test': {'name': 'Test', 'file_path': 'D', 'fromversion': '4.5.0'}},
+]
+
+
+def test_parse_version():
+    assert parse_version('4.5.0') == (4, 5, 0)
+    assert parse_version('4.10.0') > parse_version('4.9.1')
+    assert parse_version('5') < parse_version('5.0.0')
+
+
+def test_entries_are_sorted_by_version_range():
+    id_set_index = IdSetIndex(INSTANCES)
+    assert 'Test' in id_set_index and 'Missing' not in id_set_index
+    assert list(id_set_index) == ['Test', 'Other']
+    assert [entry.data['file_path'] for entry in id_set_index.get_entries('Test')] == ['A', 'B', 'D']
+    assert id_set_index.get_entries('Other')[0].to_version == (99, 99, 99)
+    assert id_set_index.get_entries('Missing') == []
+
+
+def test_find():
+    id_set_index = IdSetIndex(INSTANCES)
+    assert [entry.data['file_path'] for entry in id_set_index.find('Test', (3, 5, 0), (4, 5, 0))] == ['B']
+    assert id_set_index.find('Test', (3, 5, 0), (4, 6, 0)) == []
+    assert id_set_index.find('Missing', (3, 5, 0), (4, 5, 0)) == []
+
+
+def test_find_overlapping():
+    id_set_index = IdSetIndex(INSTANCES)
+
+    def find_overlapping(from_version, to_version=None):
+        return [entry.data['file_path'] for entry in id_set_index.find_overlapping('Test', from_version, to_version)]
+
+    assert find_overlapping((3, 5, 2), (3, 5, 4)) == ['A', 'B']
+    assert find_overlapping((3, 6, 0), (4, 0, 0)) == ['A', 'B']
+    assert find_overlapping((4, 5, 0)) == ['B', 'D']
+    assert find_overlapping((1, 0, 0), (2, 0, 0)) == []
+    assert id_set_index.find_overlapping('Missing', (1, 0, 0)) == []
+
+
+def test_add():
+    instances = list(INSTANCES)
+    id_set_index = IdSetIndex(instances)
+    id_set_index.add({'Test': {'name': 'Test', 'file_path': 'C', 'fromversion': '3.5.2', 'toversion': '3.5.4'}})
+    assert len(instances) == len(INSTANCES) + 1
+    assert [entry.data['file_path'] for entry in id_set_index.get_entries('Test')] == ['A', 'B', 'C', 'D']
+
+
+def test_update():
+    instances = [dict(instance) for instance in INSTANCES]
+    id_set_index = IdSetIndex(instances)
+    entry = id_set_index.get_entries('Test')[0]
+    id_set_index.update(entry, {'name': 'Test', 'file_path': 'A', 'fromversion': '5.0.0'})
+    assert instances[2]['Test']['fromversion'] == '5.0.0'
+    assert [entry.data['file_path'] for entry in id_set_index.get_entries('Test')] == ['B', 'D', 'A']
+    assert [entry.data['file_path'] for entry in id_set_index.find('Test', (5, 0, 0), (99, 99, 99))] == ['A']
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from demisto_sdk.common.git_context import GitContext
+from demisto_sdk.common.hook_validations.structure import StructureValidator
+from demisto_sdk.common.old_file_provider import OldFileProvider, GitOldFileProvider
+from tests.conftest import git, write
+
+ZOOM_YML = os.path.join('tests', 'test_files', 'integration-Zoom.yml')
+
+
+class RecordingProvider(OldFileProvider):
+    def __init__(self):
+        self.requested_paths = []
+
+    def get_old_file(self, file_path):
+        self.requested_paths.append(file_path)
+        return {'name': 'remote'}
+
+
+@pytest.fixture
+def repo(git_repo):
+    repo = git_repo
+    write(repo, 'Integrations/Zoom/Zoom.yml', 'name: Zoom\nfromversion: 4.5.0\n')
+    write(repo, 'IncidentFields/incidentfield-Old Name.json', '{"id": "old"}')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'initial')
+    write(repo, 'Integrations/Zoom/Zoom.yml', 'name: Zoom\nfromversion: 5.0.0\n')
+    write(repo, 'Scripts/script-New.yml', 'name: New\n')
+    return repo
+
+
+def test_get_old_file(repo):
+    git_context = GitContext(cwd=repo)
+    provider = GitOldFileProvider('master', git_context)
+    assert provider.get_old_file('Integrations/Zoom/Zoom.yml') == {'name': 'Zoom', 'fromversion': '4.5.0'}
+    assert provider.get_old_file('./IncidentFields/incidentfield-Old Name.json') == {'id': 'old'}
+    assert provider.get_old_file('Scripts/script-New.yml') == {}
+    assert provider.get_old_file('Integrations/Zoom') == {}
+    assert provider.get_old_file('Integrations/Zoom/Zoom.yml') == {'name': 'Zoom', 'fromversion': '4.5.0'}
+
+    # rev-parse of the tree and a single cat-file process
+    assert git_context.command_count == 2
+    provider.close()
+
+
+def test_fallback_when_revision_is_missing(repo):
+    fallback = RecordingProvider()
+    provider = GitOldFileProvider('origin/master', GitContext(cwd=repo), fallback=fallback)
+    assert provider.get_old_file('Integrations/Zoom/Zoom.yml') == {'name': 'remote'}
+    assert fallback.requested_paths == ['Integrations/Zoom/Zoom.yml']
+
+
+def test_old_file_is_loaded_lazily():
+    provider = RecordingProvider()
+    structure_validator = StructureValidator(ZOOM_YML, old_file_provider=provider)
+    assert provider.requested_paths == []
+
+    assert structure_validator.is_valid_scheme()
+    assert provider.requested_paths == []
+
+    assert structure_validator.old_file == {'name': 'remote'}
+    assert structure_validator.old_file == {'name': 'remote'}
+    assert provider.requested_paths == [ZOOM_YML]
+
+
+def test_old_file_of_renamed_file():
+    provider = RecordingProvider()
+    structure_validator = StructureValidator(ZOOM_YML, 'Integrations/integration-Zoom.yml',
+                                             old_file_provider=provider)
+    assert structure_validator.old_file
+    assert provider.requested_paths == ['Integrations/integration-Zoom.yml']
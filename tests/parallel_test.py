@@ -0,0 +1,34 @@
+import pytest
+
+from demisto_sdk.common.parallel import run_in_workers
+
+
+class Multiplier:
+    def __init__(self, factor):
+        self.factor = factor
+
+
+def create_multiplier(factor):
+    return Multiplier(factor)
+
+
+def multiply(multiplier, number):
+    print('multiplying {}'.format(number))
+    if number < 0:
+        raise ValueError(number)
+    return number * multiplier.factor
+
+
+def test_results_and_output_in_the_order_of_the_tasks(capsys):
+    results = list(run_in_workers(list(range(10)), 2, create_multiplier, (3,), multiply))
+    assert results == [number * 3 for number in range(10)]
+    assert capsys.readouterr().out == ''.join('multiplying {}\n'.format(number) for number in range(10))
+
+
+def test_error_is_raised_after_the_preceding_output(capsys):
+    results = []
+    with pytest.raises(ValueError):
+        for result in run_in_workers([1, 2, -1, 3], 2, create_multiplier, (2,), multiply):
+            results.append(result)
+    assert results == [2, 4]
+    assert capsys.readouterr().out == 'multiplying 1\nmultiplying 2\nmultiplying -1\n'
@@ -0,0 +1,205 @@
+import datetime
+import os
+import pickle
+import subprocess
+import json
+
+import yaml
+
+from demisto_sdk.common import tools
+from demisto_sdk.common.parse_cache import ParsedFileCache, DiskParseCache, parsed_file_cache, get_default_cache_dir, \
+    is_tracked_by_git
+
+
+class TestParsedFileCache:
+    def test_hit_and_miss_counters(self, tmp_path):
+        file_path = str(tmp_path / 'integration.yml')
+        with open(file_path, 'w') as f:
+            f.write('name: test\n')
+
+        cache = ParsedFileCache()
+        assert cache.get_or_load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert cache.get_or_load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        file_path = str(tmp_path / 'integration.yml')
+        with open(file_path, 'w') as f:
+            f.write('name: test\n')
+
+        cache = ParsedFileCache()
+        cache.get_or_load(file_path, yaml.safe_load)
+        with open(file_path, 'w') as f:
+            f.write('name: changed\n')
+
+        assert cache.get_or_load(file_path, yaml.safe_load) == {'name': 'changed'}
+        assert cache.misses == 2
+
+    def test_mutating_returned_data_does_not_affect_cache(self, tmp_path):
+        file_path = str(tmp_path / 'field.json')
+        with open(file_path, 'w') as f:
+            json.dump({'id': 'field', 'values': [1, 2]}, f)
+
+        cache = ParsedFileCache()
+        first = cache.get_or_load(file_path, json.load)
+        first['values'].append(3)
+        second = cache.get_or_load(file_path, json.load)
+        second['id'] = 'other'
+
+        assert cache.get_or_load(file_path, json.load) == {'id': 'field', 'values': [1, 2]}
+
+    def test_lru_eviction(self, tmp_path):
+        paths = []
+        for index in range(3):
+            file_path = str(tmp_path / 'file{}.yml'.format(index))
+            with open(file_path, 'w') as f:
+                f.write('name: {}\n'.format(index))
+            paths.append(file_path)
+
+        cache = ParsedFileCache(max_bytes=2 * os.path.getsize(paths[0]))
+        for file_path in paths:
+            cache.get_or_load(file_path, yaml.safe_load)
+
+        assert cache.stats()['entries'] == 2
+        cache.get_or_load(paths[0], yaml.safe_load)
+        assert cache.misses == 4
+
+    def test_get_yaml_uses_shared_cache(self):
+        file_path = './tests/test_files/integration-Zoom.yml'
+        parsed_file_cache.invalidate(file_path)
+        misses = parsed_file_cache.misses
+        hits = parsed_file_cache.hits
+
+        assert tools.get_yaml(file_path) == tools.get_yaml(file_path)
+        assert parsed_file_cache.misses == misses + 1
+        assert parsed_file_cache.hits == hits + 1
+
+
+class TestDiskParseCache:
+    @staticmethod
+    def write_file(tmp_path, content='name: test\n'):
+        file_path = str(tmp_path / 'integration.yml')
+        with open(file_path, 'w') as f:
+            f.write(content)
+        return file_path
+
+    def test_second_run_is_served_from_disk(self, tmp_path, mocker):
+        file_path = self.write_file(tmp_path)
+        cache_dir = str(tmp_path / 'cache')
+        first_run = DiskParseCache(cache_dir, sdk_version='1.0.0')
+        assert first_run.load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert first_run.misses == 1
+
+        second_run = DiskParseCache(cache_dir, sdk_version='1.0.0')
+        load_spy = mocker.spy(yaml, 'load')
+        assert second_run.load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert second_run.hits == 1
+        assert load_spy.call_count == 0
+        assert os.path.isfile(os.path.join(cache_dir, '.gitignore'))
+
+    def test_key_includes_content_and_sdk_version(self, tmp_path):
+        file_path = self.write_file(tmp_path)
+        cache_dir = str(tmp_path / 'cache')
+        DiskParseCache(cache_dir, sdk_version='1.0.0').load(file_path, yaml.safe_load)
+
+        upgraded = DiskParseCache(cache_dir, sdk_version='1.0.1')
+        upgraded.load(file_path, yaml.safe_load)
+        assert upgraded.misses == 1
+
+        self.write_file(tmp_path, 'name: changed\n')
+        changed = DiskParseCache(cache_dir, sdk_version='1.0.0')
+        assert changed.load(file_path, yaml.safe_load) == {'name': 'changed'}
+        assert changed.misses == 1
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path):
+        file_path = self.write_file(tmp_path)
+        disk_cache = DiskParseCache(str(tmp_path / 'cache'), sdk_version='1.0.0')
+        disk_cache.load(file_path, yaml.safe_load)
+        entry_path = disk_cache.get_entry_path(b'name: test\n', disk_cache.get_load_function_name(yaml.safe_load))
+        with open(entry_path, 'wb') as f:
+            f.write(b'truncated')
+
+        assert disk_cache.load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert disk_cache.misses == 2
+        assert [name for name in os.listdir(os.path.dirname(entry_path)) if name.endswith('.tmp')] == []
+
+    def test_unnamed_load_function_is_not_stored(self, tmp_path):
+        file_path = self.write_file(tmp_path)
+        cache_dir = str(tmp_path / 'cache')
+        disk_cache = DiskParseCache(cache_dir)
+        assert disk_cache.load(file_path, lambda f: yaml.safe_load(f)) == {'name': 'test'}
+        assert not os.path.exists(cache_dir)
+
+    def test_memory_cache_uses_disk_cache(self, tmp_path):
+        file_path = self.write_file(tmp_path)
+        cache = ParsedFileCache()
+        cache.enable_disk_cache(str(tmp_path / 'cache'))
+        cache.get_or_load(file_path, yaml.safe_load)
+
+        other_run = ParsedFileCache()
+        other_run.enable_disk_cache(str(tmp_path / 'cache'))
+        assert other_run.get_or_load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert other_run.disk_cache.hits == 1
+
+    def test_entries_are_json(self, tmp_path):
+        data = {'name': 'test', 1: [(1, 'a'), b'\x00\xff'], (2, 3): datetime.date(2020, 1, 1),
+                'created': datetime.datetime(2020, 1, 1, 10, 30, tzinfo=datetime.timezone.utc),
+                '__type__': 'tuple', 'value': None}
+        disk_cache = DiskParseCache(str(tmp_path / 'cache'), sdk_version='1.0.0')
+        entry_path = disk_cache.get_entry_path(b'content', 'load')
+        disk_cache.set(entry_path, data)
+        with open(entry_path) as entry_file:
+            json.load(entry_file)
+        assert disk_cache.get(entry_path) == (True, data)
+
+    def test_pickled_entry_is_a_miss(self, tmp_path):
+        disk_cache = DiskParseCache(str(tmp_path / 'cache'), sdk_version='1.0.0')
+        entry_path = disk_cache.get_entry_path(b'content', 'load')
+        os.makedirs(os.path.dirname(entry_path))
+        with open(entry_path, 'wb') as entry_file:
+            pickle.dump({'name': 'test'}, entry_file)
+        assert disk_cache.get(entry_path) == (False, None)
+
+    def test_default_cache_dir_is_out_of_the_repository(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        assert get_default_cache_dir() == str(tmp_path / 'demisto-sdk')
+
+    def test_cache_dir_tracked_by_git(self, tmp_path):
+        cache_dir = tmp_path / 'cache'
+        assert not is_tracked_by_git(str(cache_dir))
+        cache_dir.mkdir()
+        subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+        (cache_dir / 'entry.json').write_text('{}')
+        assert not is_tracked_by_git(str(cache_dir))
+        subprocess.run(['git', 'add', 'cache/entry.json'], cwd=str(tmp_path), check=True)
+        assert is_tracked_by_git(str(cache_dir))
+
+    def test_tracked_cache_dir_is_not_used(self, tmp_path):
+        file_path = str(tmp_path / 'integration.yml')
+        with open(file_path, 'w') as f:
+            f.write('name: test\n')
+        cache_dir = tmp_path / 'cache'
+        cache_dir.mkdir()
+        subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+        (cache_dir / 'committed.json').write_text('{}')
+        subprocess.run(['git', 'add', 'cache/committed.json'], cwd=str(tmp_path), check=True)
+
+        disk_cache = DiskParseCache(str(cache_dir), sdk_version='1.0.0')
+        assert disk_cache.load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert disk_cache.load(file_path, yaml.safe_load) == {'name': 'test'}
+        assert disk_cache.hits == 0
+        assert os.listdir(str(cache_dir)) == ['committed.json']
+
+    def test_cache_dir_is_checked_once_when_used(self, tmp_path, mocker):
+        from click.testing import CliRunner
+        from demisto_sdk.main import main
+        is_tracked_by_git = mocker.patch('demisto_sdk.common.parse_cache.is_tracked_by_git', return_value=False)
+        result = CliRunner().invoke(main, ['--cache-dir', str(tmp_path / 'cli-cache'), '-v'])
+        assert result.exit_code == 0
+        assert not is_tracked_by_git.called
+
+        disk_cache = DiskParseCache(str(tmp_path / 'used-cache'), sdk_version='1.0.0')
+        disk_cache.get(str(tmp_path / 'entry.json'))
+        disk_cache.get(str(tmp_path / 'entry.json'))
+        assert is_tracked_by_git.call_count == 1
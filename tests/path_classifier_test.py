@@ -0,0 +1,86 @@
+import re
+
+import pytest
+
+from demisto_sdk.common import constants
+from demisto_sdk.common.path_classifier import PathClassifier, path_classifier
+
+PATHS = [
+    'Integrations/integration-Zoom.yml',
+    './Integrations/Zoom/Zoom.yml',
+    'Integrations/Zoom/Zoom.py',
+    'Integrations/Zoom/Zoom_test.py',
+    'Integrations/Zoom/Zoom_image.png',
+    'Integrations/Zoom/Zoom_description.md',
+    'Beta_Integrations/integration-Beta.yml',
+    'Packs/Zoom/Integrations/Zoom/Zoom.yml',
+    'Packs/Zoom/Integrations/Zoom/Zoom.py',
+    'Packs/Zoom/Scripts/ZoomScript/ZoomScript.yml',
+    'Scripts/script-Hello.yml',
+    'Scripts/Hello/Hello.js',
+    'Playbooks/playbook-Hello.yml',
+    'TestPlaybooks/playbook-Hello_Test.yml',
+    'IncidentFields/incidentfield-Hello.json',
+    'IndicatorFields/incidentfield-Hello.json',
+    'Layouts/layout-details-Hello.json',
+    'Widgets/widget-Hello.json',
+    'Reports/report-Hello.json',
+    'Misc/reputations.json',
+    'Misc/reputation-Hello.json',
+    'Tests/conf.json',
+    'README.md',
+]
+REGEX_LISTS = [
+    constants.CHECKED_TYPES_REGEXES,
+    constants.CODE_FILES_REGEX,
+    constants.PACKAGE_SCRIPTS_REGEXES,
+    constants.YML_INTEGRATION_REGEXES,
+    constants.JSON_INDICATOR_AND_INCIDENT_FIELDS,
+    constants.IGNORED_TYPES_REGEXES,
+]
+
+
+def old_checked_type(file_path, compared_regexes):
+    for regex in compared_regexes:
+        if re.match(regex, file_path, re.IGNORECASE):
+            return regex
+    return None
+
+
+@pytest.mark.parametrize('path', PATHS)
+def test_match_is_the_same_as_regex_loop(path):
+    for regexes in REGEX_LISTS:
+        assert path_classifier.match(path, regexes) == old_checked_type(path, regexes)
+
+
+def test_match_sees_changed_regex_list():
+    regexes = [constants.INTEGRATION_REGEX]
+    assert path_classifier.match('tests/test_files/fake_integration.yml', regexes) is None
+    regexes.append('tests/test_files/fake_integration.yml')
+    assert path_classifier.match('tests/test_files/fake_integration.yml', regexes) is not None
+
+
+@pytest.mark.parametrize('path, entity_type, schema, pack_name, package_root', [
+    ('Integrations/integration-Zoom.yml', 'integration', 'integration', None, None),
+    ('Packs/Zoom/Integrations/Zoom/Zoom.py', 'integration', None, 'Zoom', 'Packs/Zoom/Integrations/Zoom'),
+    ('./Scripts/Hello/Hello.yml', 'script', 'script', None, 'Scripts/Hello'),
+    ('TestPlaybooks/playbook-Hello_Test.yml', 'playbook', 'playbook', None, None),
+    ('IndicatorFields/incidentfield-Hello.json', 'indicatorfield', 'incidentfield', None, None),
+    ('Misc/reputation-Hello.json', 'reputation', 'reputation', None, None),
+    ('README.md', 'description', None, None, None),
+])
+def test_classify(path, entity_type, schema, pack_name, package_root):
+    path_info = PathClassifier().classify(path)
+    assert path_info.entity_type == entity_type
+    assert path_info.schema == schema
+    assert path_info.pack_name == pack_name
+    assert path_info.package_root == package_root
+
+
+def test_file_type_without_schema():
+    assert PathClassifier().classify('Reports/report-Hello.json').file_type == 'reports'
+
+
+def test_classify_is_memoized():
+    classifier = PathClassifier()
+    assert classifier.classify('Scripts/script-Hello.yml') is classifier.classify('Scripts/script-Hello.yml')
@@ -0,0 +1,25 @@
+import threading
+
+from demisto_sdk.common.pooled_http_client import PooledHttpClient
+
+
+def test_run_concurrently():
+    client = PooledHttpClient(max_workers=2)
+    results = {}
+    lock = threading.Lock()
+
+    def square(number):
+        if number == 3:
+            raise ValueError(number)
+        with lock:
+            results[number] = number * number
+
+    client.run_concurrently(square, range(5))
+    assert results == {0: 0, 1: 1, 2: 4, 4: 16}
+    client.run_concurrently(square, [])
+
+
+def test_session():
+    client = PooledHttpClient(max_workers=3)
+    assert client.session is client.session
+    assert client.session.get_adapter('https://github.com')._pool_maxsize == 3
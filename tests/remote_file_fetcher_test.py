@@ -0,0 +1,93 @@
+import hashlib
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from demisto_sdk.common.git_context import GitContext
+from demisto_sdk.common.remote_file_fetcher import RemoteFileFetcher
+
+FILES = {
+    '/master/Integrations/Zoom/Zoom.yml': b'name: Zoom\n',
+    '/master/IncidentFields/incidentfield-Hello.json': b'{"id": "Hello"}',
+}
+
+
+class ContentRepositoryHandler(BaseHTTPRequestHandler):
+    """A stand-in for raw.githubusercontent.com, which serves FILES with ETags."""
+    requests = []  # type: list
+
+    def do_GET(self):
+        if_none_match = self.headers.get('If-None-Match')
+        self.requests.append((self.path, if_none_match))
+        content = FILES.get(self.path)
+        if content is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = '"{}"'.format(hashlib.sha1(content).hexdigest())
+        if if_none_match == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    ContentRepositoryHandler.requests = []
+    return http_server(ContentRepositoryHandler)
+
+
+def create_fetcher(base_url, cache_dir=None):
+    # the tests run outside of a content repository, so tags are not resolved to commits
+    return RemoteFileFetcher(base_url, max_workers=4, cache_dir=cache_dir, git_context=GitContext(cwd='/'))
+
+
+def test_fetch_once_per_run(server):
+    fetcher = create_fetcher(server)
+    assert fetcher.fetch('Integrations/Zoom/Zoom.yml', 'origin/master') == b'name: Zoom\n'
+    assert fetcher.fetch('Integrations/Zoom/Zoom.yml', 'origin/master') == b'name: Zoom\n'
+    assert len(ContentRepositoryHandler.requests) == 1
+    assert len(fetcher.latencies) == 1
+
+
+def test_fetch_missing_file(server):
+    fetcher = create_fetcher(server)
+    with pytest.raises(Exception):
+        fetcher.fetch('Integrations/Missing/Missing.yml')
+
+
+def test_prefetch(server):
+    fetcher = create_fetcher(server)
+    fetcher.prefetch(list(path[len('/master/'):] for path in FILES) + ['Integrations/Missing/Missing.yml'])
+    assert len(ContentRepositoryHandler.requests) == 3
+
+    assert fetcher.fetch('IncidentFields/incidentfield-Hello.json') == b'{"id": "Hello"}'
+    assert len(ContentRepositoryHandler.requests) == 3
+    assert sorted(fetcher.get_latency_percentiles()) == [50, 90, 99]
+    assert fetcher.get_latency_report().startswith('Fetched 3 remote files, latency: p50=')
+
+
+def test_disk_cache_revalidation(server, tmp_path):
+    assert create_fetcher(server, str(tmp_path)).fetch('Integrations/Zoom/Zoom.yml') == b'name: Zoom\n'
+    assert ContentRepositoryHandler.requests[-1] == ('/master/Integrations/Zoom/Zoom.yml', None)
+
+    assert create_fetcher(server, str(tmp_path)).fetch('Integrations/Zoom/Zoom.yml') == b'name: Zoom\n'
+    etag = '"{}"'.format(hashlib.sha1(b'name: Zoom\n').hexdigest())
+    assert ContentRepositoryHandler.requests[-1] == ('/master/Integrations/Zoom/Zoom.yml', etag)
+
+
+def test_latency_percentiles():
+    fetcher = RemoteFileFetcher()
+    assert fetcher.get_latency_report() == 'No remote files were fetched.'
+    fetcher.latencies = [i / 1000 for i in range(1, 101)]
+    assert fetcher.get_latency_percentiles() == {50: 0.05, 90: 0.09, 99: 0.099}
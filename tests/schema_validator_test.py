@@ -0,0 +1,146 @@
+import glob
+import json
+import os
+
+import pytest
+from pykwalify.core import Core
+
+from demisto_sdk.common import yaml_backend
+from demisto_sdk.common.hook_validations.structure import StructureValidator
+from demisto_sdk.common.schema_validator import SCHEMAS_DIR, get_schema_validator
+
+# the schema of the test files, by the prefix of their names
+SCHEMA_BY_PREFIX = [
+    ('format_New_Integration', 'integration'),
+    ('format_New_script', 'script'),
+    ('format_new_playbook', 'playbook'),
+    ('fake_integration', 'integration'),
+    ('fake-script', 'script'),
+    ('Playbooks.playbook', 'playbook'),
+    ('integration', 'integration'),
+    ('script', 'script'),
+    ('playbook', 'playbook'),
+    ('incidentfield', 'incidentfield'),
+    ('indicatorfield', 'incidentfield'),
+    ('indicator-field', 'incidentfield'),
+    ('layout', 'layout'),
+    ('dashboard', 'dashboard'),
+    ('widget', 'widget'),
+]
+
+
+def get_test_files():
+    for file_path in sorted(glob.glob('tests/test_files/**/*.*', recursive=True)):
+        file_name = os.path.basename(file_path)
+        if not file_path.endswith(('.yml', '.json')):
+            continue
+        for prefix, schema_name in SCHEMA_BY_PREFIX:
+            if file_name.startswith(prefix):
+                yield file_path, schema_name
+                break
+
+
+def validate_with_pykwalify(file_path, schema_name):
+    try:
+        Core(source_file=file_path, schema_files=[os.path.join(SCHEMAS_DIR, schema_name + '.yml')]).validate(True)
+    except Exception as err:
+        return str(err)
+    return None
+
+
+def validate_with_schema_validator(file_path, schema_name):
+    try:
+        with open(file_path) as f:
+            data = json.load(f) if file_path.endswith('.json') else yaml_backend.safe_load_yaml12(f)
+        get_schema_validator(schema_name).validate(data)
+    except Exception as err:
+        return str(err)
+    return None
+
+
+def assert_conformance(file_path, schema_name):
+    expected_error = validate_with_pykwalify(file_path, schema_name)
+    error = validate_with_schema_validator(file_path, schema_name)
+    if expected_error and 'found duplicate key' in expected_error:
+        # ruamel.yaml adds a reference to its documentation
+        assert error and expected_error.startswith(error)
+    else:
+        assert error == expected_error
+
+
+@pytest.mark.parametrize('file_path, schema_name', list(get_test_files()))
+def test_conformance_with_pykwalify(file_path, schema_name):
+    assert_conformance(file_path, schema_name)
+
+
+def test_schema_is_compiled_once():
+    schema_validator = get_schema_validator('widget')
+    assert get_schema_validator('widget') is schema_validator
+    with open('tests/test_files/widget-valid.json') as f:
+        schema_validator.validate(json.load(f))
+    root_rule = schema_validator._root_rule
+    with pytest.raises(Exception):
+        schema_validator.validate({'id': 'x'})
+    assert schema_validator._root_rule is root_rule
+
+
+def test_partial_schemas_of_other_schemas():
+    # the playbook and script schemas define partial schemas, which pykwalify keeps in a global dict
+    test_files = dict((schema_name, file_path) for file_path, schema_name in get_test_files())
+    for schema_name in ['playbook', 'script', 'playbook', 'integration', 'playbook']:
+        assert_conformance(test_files[schema_name], schema_name)
+
+
+# plain scalars which are booleans in YAML 1.1 (PyYAML) and strings in YAML 1.2 (ruamel.yaml, which pykwalify uses)
+YAML_1_1_BOOLEANS = ['yes', 'no', 'on', 'off', 'Yes', 'NO', 'On', 'OFF']
+
+
+def write_zoom_integration(tmp_path, description, options, required='true'):
+    with open('tests/test_files/integration-Zoom.yml') as f:
+        content = f.read()
+    content = content.replace('description: Use the Zoom integration manage your Zoom users and meetings',
+                              'description: {}'.format(description))
+    parameter = '- display: Region\n  name: region\n  type: 15\n  required: {}\n  options:\n{}'.format(
+        required, ''.join('  - {}\n'.format(option) for option in options))
+    content = content.replace('configuration:\n', 'configuration:\n' + parameter)
+    file_path = str(tmp_path / 'integration-Zoom.yml')
+    with open(file_path, 'w') as f:
+        f.write(content)
+    return file_path
+
+
+@pytest.mark.parametrize('description', YAML_1_1_BOOLEANS)
+def test_yaml_1_1_booleans_are_strings(tmp_path, description):
+    file_path = write_zoom_integration(tmp_path, description, YAML_1_1_BOOLEANS)
+    assert validate_with_pykwalify(file_path, 'integration') is None
+    assert StructureValidator(file_path, predefined_scheme='integration').is_valid_scheme()
+
+
+@pytest.mark.parametrize('description, options, required', [
+    ('yes', ['on', 'off'], 'yes'),
+    ('1:20', ['1:20', '017', '0o17', '1e3', '1_000'], 'true'),
+    ('true', ['y', 'n'], 'off'),
+])
+def test_yaml_1_2_scalars_conformance(tmp_path, description, options, required):
+    file_path = write_zoom_integration(tmp_path, description, options, required)
+    assert_conformance(file_path, 'integration')
+    error = validate_with_pykwalify(file_path, 'integration')
+    assert StructureValidator(file_path, predefined_scheme='integration').is_valid_scheme() is (error is None)
+
+
+def test_duplicate_key(tmp_path):
+    file_path = write_zoom_integration(tmp_path, 'Zoom\ndescription: Zoom meetings', ['a', 'b'])
+    assert 'found duplicate key "description"' in validate_with_pykwalify(file_path, 'integration')
+    assert_conformance(file_path, 'integration')
+    assert not StructureValidator(file_path, predefined_scheme='integration').is_valid_scheme()
+
+
+def test_yml_is_loaded_once_for_the_schema(tmp_path, mocker):
+    file_path = write_zoom_integration(tmp_path, 'yes', ['a', 'b'])
+    structure_validator = StructureValidator(file_path, predefined_scheme='integration')
+    yaml_load = mocker.spy(yaml_backend.yaml, 'load')
+    yaml_compose = mocker.spy(yaml_backend.yaml, 'compose')
+    assert structure_validator.is_valid_scheme()
+    assert structure_validator.is_valid_scheme()
+    assert yaml_load.call_count == 1
+    assert not yaml_compose.called
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMANDS = ['split-yml', 'extract-code', 'unify', 'validate', 'create-content-artifacts', 'secrets', 'lint', 'format',
+            'upload', 'run', 'run-playbook', 'json-to-outputs', 'generate-test-playbook', 'init']
+
+# Modules which are slow to import and are not needed to parse the command line
+HEAVY_MODULES = {'demisto_client', 'dateparser', 'PyPDF2', 'bs4', 'pykwalify.core', 'ruamel.yaml', 'requests',
+                 'pkg_resources', 'docker'}
+COMMAND_PACKAGES = ('demisto_sdk.validation', 'demisto_sdk.yaml_tools', 'demisto_sdk.dev_tools', 'demisto_sdk.runners',
+                    'demisto_sdk.json_to_outputs', 'demisto_sdk.test_playbook_generator')
+# Loose on purpose - the import of demisto_sdk.main took over 500ms when it imported all the commands
+STARTUP_BUDGET_US = 400 * 1000
+
+
+def get_import_times(args):
+    """Runs the CLI with `python -X importtime` and gets the cumulative import time of every imported module.
+
+    Args:
+        args (list): the command line arguments of demisto-sdk.
+
+    Returns:
+        dict. Module name to its cumulative import time in microseconds.
+    """
+    code = 'import sys; sys.argv = ["demisto-sdk"] + sys.argv[1:]; from demisto_sdk.main import main; main()'
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code] + args, cwd=REPO_ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0, result.stderr
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize('command', COMMANDS)
+def test_command_help_does_not_import_commands(command):
+    import_times = get_import_times([command, '-h'])
+    assert 'demisto_sdk.main' in import_times
+    assert not HEAVY_MODULES.intersection(import_times)
+    assert not [module for module in import_times if module.startswith(COMMAND_PACKAGES)]
+
+
+def test_version_startup_time():
+    import_times = get_import_times(['-v'])
+    assert not HEAVY_MODULES.intersection(import_times)
+    assert import_times['demisto_sdk.main'] < STARTUP_BUDGET_US
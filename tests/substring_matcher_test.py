@@ -0,0 +1,43 @@
+import random
+
+from demisto_sdk.common.substring_matcher import SubstringMatcher, SubstringSet
+
+SUBSTRINGS = ['he', 'she', 'his', 'hers', 'sade@sade.sade', 'ip-172-31']
+
+
+def test_search():
+    matcher = SubstringMatcher(SUBSTRINGS)
+    assert len(matcher) == len(SUBSTRINGS)
+    assert matcher.search('ushers')
+    assert matcher.search('this')
+    assert matcher.search('host-ip-172-31-15-237')
+    assert not matcher.search('hi sh')
+    assert not matcher.search('')
+    assert not SubstringMatcher([]).search('anything')
+    assert SubstringMatcher(['']).search('anything')
+
+
+def test_search_like_any_in():
+    random_generator = random.Random(3)
+
+    def random_string(max_length):
+        return ''.join(random_generator.choice('abc.-') for _ in range(random_generator.randint(1, max_length)))
+
+    substrings = {random_string(6) for _ in range(300)}
+    matcher = SubstringMatcher(substrings)
+    substring_set = SubstringSet(substrings)
+    for _ in range(2000):
+        text = random_string(12)
+        expected = any(substring in text for substring in substrings)
+        assert matcher.search(text) == expected, text
+        assert substring_set.search(text) == expected, text
+
+
+def test_substring_set_update():
+    substring_set = SubstringSet()
+    assert not substring_set.search('2019-10-23')
+    substring_set.update(['2019-10-23', '1.0.0.147', '2019-10-23'])
+    assert len(substring_set) == 2
+    assert substring_set.search('date:2019-10-23t09:13:30z')
+    assert substring_set.search('1.0.0.147')
+    assert not substring_set.search('1.0.0.14')
@@ -0,0 +1,79 @@
+import time
+
+from demisto_sdk.common.text_extractor import TextExtractor, ExtractedText, extract_text_from_pdf, \
+    extract_text_from_md_html
+
+# disable-secrets-detection-start
+SECRET = '7ZtAVfdsjknjGdsnKNvw34235nkjsdNNUIEW'
+# disable-secrets-detection-end
+
+
+def create_pdf(text):
+    """Creates a single page pdf which shows the text."""
+    stream = 'BT /F1 12 Tf 72 720 Td ({}) Tj ET'.format(text).encode('utf-8')
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>',
+               b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+               b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R '
+               b'/Resources << /Font << /F1 5 0 R >> >> >>',
+               b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream),
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, pdf_object in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, pdf_object)
+    xref_offset = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    return pdf
+
+
+def slow_extract(content):
+    time.sleep(30)
+
+
+def greedy_extract(content):
+    return len(bytearray(512 * 1024 * 1024))
+
+
+def test_extract_texts():
+    extractor = TextExtractor(processes=2)
+    html = '<h1>Zoom</h1><p>key {}</p>'.format(SECRET).encode('utf-8')
+    assert extractor.extract_texts([(create_pdf('key ' + SECRET), extract_text_from_pdf),
+                                    (html, extract_text_from_md_html),
+                                    (html, extract_text_from_md_html)]) == [ExtractedText('key ' + SECRET, None),
+                                                                            ExtractedText('Zoomkey ' + SECRET, None),
+                                                                            ExtractedText('Zoomkey ' + SECRET, None)]
+    # the same content is extracted once
+    assert extractor.extractions_count == 2
+    assert extractor.extract_text(html, extract_text_from_md_html).text == 'Zoomkey ' + SECRET
+    assert extractor.extractions_count == 2
+
+
+def test_extraction_failures():
+    extractor = TextExtractor(processes=2, timeout=1, memory_limit=64)
+    start = time.monotonic()
+    extracted_texts = extractor.extract_texts([(b'not a pdf', extract_text_from_pdf), (b'slow', slow_extract),
+                                               (b'greedy', greedy_extract),
+                                               (b'<p>html</p>', extract_text_from_md_html)])
+    assert time.monotonic() - start < 10
+    assert extracted_texts[0].text is None
+    assert extracted_texts[0].error.startswith('not parsable')
+    assert extracted_texts[1:] == [ExtractedText(None, 'not extracted within 1 seconds'),
+                                   ExtractedText(None, 'not extracted within the memory limit'),
+                                   ExtractedText('html', None)]
+
+
+def test_disk_cache(tmp_path):
+    html = '<p>key {}</p>'.format(SECRET).encode('utf-8')
+    extractor = TextExtractor(cache_dir=str(tmp_path), sdk_version='1.0.0')
+    assert extractor.extract_text(html, extract_text_from_md_html).text == 'key ' + SECRET
+    # failures are not cached
+    assert extractor.extract_text(b'not a pdf', extract_text_from_pdf).error is not None
+
+    extractor = TextExtractor(cache_dir=str(tmp_path), sdk_version='1.0.0')
+    assert extractor.extract_text(html, extract_text_from_md_html).text == 'key ' + SECRET
+    assert extractor.extractions_count == 0
+    assert extractor.extract_text(b'not a pdf', extract_text_from_pdf).error is not None
+    assert extractor.extractions_count == 1
@@ -1,9 +1,13 @@
+import json
 import os
 import unittest
 import pytest
 from collections import OrderedDict
 from demisto_sdk.common.scripts.update_id_set import has_duplicate, get_integration_data, get_script_data, \
-    get_playbook_data
+    get_playbook_data, find_duplicates, add_new_object_to_id_set, re_create_id_set, \
+    get_playbooks_paths, update_id_set, update_object_in_id_set
+from demisto_sdk.common.git_context import GitContext
+from tests.conftest import git
 
 MOCKED_DATA = [
     (
@@ -86,6 +90,26 @@ def test_had_duplicates(id_set, id_to_check, result):
     assert result == has_duplicate(id_set, id_to_check)
 
 
+def test_find_duplicates():
+    id_set = {
+        'scripts': [],
+        'integrations': MOCKED_DATA[0][0],
+        'playbooks': MOCKED_DATA[2][0],
+        'TestPlaybooks': MOCKED_DATA[1][0],
+    }
+    assert find_duplicates(id_set) == ([], ['BluecatAddressManager'], ['Test3'], [])
+
+
+def test_add_new_object_to_id_set():
+    instances = [{'Test': {'name': 'Test', 'fromversion': '4.5.0'}}]
+    add_new_object_to_id_set('Test', {'Test': {'name': 'Updated', 'fromversion': '4.5.0'}}, instances)
+    assert instances == [{'Test': {'name': 'Updated', 'fromversion': '4.5.0'}}]
+
+    add_new_object_to_id_set('Test', {'Test': {'name': 'Test', 'toversion': '4.4.9'}}, instances)
+    assert instances == [{'Test': {'name': 'Updated', 'fromversion': '4.5.0'}},
+                         {'Test': {'name': 'Test', 'toversion': '4.4.9'}}]
+
+
 INTEGRATION_DATA = {
     "Cortex XDR - IR": OrderedDict(
         [
@@ -132,6 +156,32 @@ PLAYBOOK_DATA = {
 }
 
 
+@pytest.mark.parametrize('version_field, version', [
+    ('fromversion', '5.0'),
+    ('fromversion', '5.0.0-beta'),
+    ('toversion', '4.9.9.9'),
+    ('toversion', ''),
+])
+def test_update_object_with_malformed_version(mocker, version_field, version):
+    git_context = GitContext()
+    get_file_diff = mocker.patch.object(git_context, 'get_file_diff', return_value='')
+    instances = [{'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml'}}]
+    obj_data = {'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml', version_field: version}}
+    with pytest.raises(ValueError, match='Playbooks/playbook-c.yml {} is invalid'.format(version_field)):
+        update_object_in_id_set('c', obj_data, 'Playbooks/playbook-c.yml', instances, git_context)
+    assert instances == [{'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml'}}]
+    assert not get_file_diff.called
+
+
+def test_update_object_with_valid_version(mocker):
+    git_context = GitContext()
+    mocker.patch.object(git_context, 'get_file_diff', return_value='+fromversion: 5.0.0\n')
+    instances = [{'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml'}}]
+    obj_data = {'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml', 'fromversion': '5.0.0'}}
+    update_object_in_id_set('c', obj_data, 'Playbooks/playbook-c.yml', instances, git_context)
+    assert instances == [obj_data]
+
+
 class TestIntegration(unittest.TestCase):
     def test_get_integration_data(self):
         """
@@ -173,3 +223,71 @@ class TestIntegration(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+def write_yml(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as yml_file:
+        yml_file.write(content)
+
+
+def test_re_create_id_set(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('Tests')
+    write_yml('Integrations/Zoom/Zoom.yml', 'commonfields:\n  id: Zoom\nname: Zoom\nscript:\n  commands:\n'
+                                            '  - name: zoom-create-user\n')
+    write_yml('Scripts/script-b.yml', 'commonfields:\n  id: b\nname: b\nscript: ""\ntype: python\n')
+    write_yml('Scripts/A/A.yml', 'commonfields:\n  id: A\nname: A\nscript: ""\ntype: python\n')
+    write_yml('Scripts/A/A.py', "demisto.executeCommand('createNewIncident', {})\n")
+    write_yml('Playbooks/playbook-c.yml', 'id: c\nname: c\ntoversion: 4.9.9\ntasks: {}\n')
+    write_yml('Playbooks/playbook-c_new.yml', 'id: c\nname: c\nfromversion: 5.0.0\ntasks: {}\n')
+    write_yml('TestPlaybooks/playbook-Test.yml', 'id: Test\nname: Test\ntasks: {}\n')
+    write_yml('TestPlaybooks/script-a.yml', 'commonfields:\n  id: a\nname: a\nscript: ""\ntype: python\n')
+
+    re_create_id_set(processes=2)
+    with open('Tests/id_set.json') as id_set_file:
+        id_set = json.load(id_set_file)
+    assert list(id_set) == ['scripts', 'playbooks', 'integrations', 'TestPlaybooks']
+    # sorted by the lower case ids, the entities with the same id in the order of their paths
+    assert [list(script)[0] for script in id_set['scripts']] == ['A', 'a', 'b']
+    assert id_set['scripts'][0]['A']['script_executions'] == ['createNewIncident']
+    assert [playbook['c']['file_path'] for playbook in id_set['playbooks']] == get_playbooks_paths()
+    assert id_set['integrations'] == [{'Zoom': {'name': 'Zoom', 'file_path': 'Integrations/Zoom/Zoom.yml',
+                                                'commands': ['zoom-create-user']}}]
+    assert id_set['TestPlaybooks'] == [{'Test': {'name': 'Test', 'file_path': 'TestPlaybooks/playbook-Test.yml'}}]
+
+
+def test_update_id_set(git_repo, monkeypatch):
+    monkeypatch.chdir(git_repo)
+    id_set = OrderedDict([
+        ('scripts', [{'b': {'name': 'b', 'file_path': 'Scripts/script-b.yml'}}]),
+        ('playbooks', [{'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml'}}]),
+        ('integrations', [{'Zoom': {'name': 'Zoom', 'file_path': 'Integrations/Zoom/Zoom.yml', 'toversion': '4.9.9'}},
+                          {'Zoom': {'name': 'Zoom', 'file_path': 'Integrations/Zoom/Zoom.yml',
+                                    'fromversion': '5.0.0'}}]),
+        ('TestPlaybooks', []),
+    ])
+    write_yml('Tests/id_set.json', json.dumps(id_set, indent=4))
+    write_yml('Integrations/Zoom/Zoom.yml', 'commonfields:\n  id: Zoom\nname: Zoom\nfromversion: 5.0.0\n')
+    write_yml('Playbooks/playbook-c.yml', 'id: c\nname: c\ntasks: {}\n')
+    git(git_repo, 'add', '.')
+    git(git_repo, 'commit', '-q', '-m', 'initial')
+    git(git_repo, 'update-ref', 'refs/remotes/origin/master', 'HEAD')
+    git(git_repo, 'checkout', '-q', '-b', 'feature')
+
+    write_yml('Integrations/Zoom/Zoom.yml', 'commonfields:\n  id: Zoom\nname: Zoom\nfromversion: 5.0.0\nscript:\n'
+                                            '  commands:\n  - name: zoom-create-user\n')
+    # the added fromversion replaces the instance of any version
+    write_yml('Playbooks/playbook-c.yml', 'id: c\nname: c\nfromversion: 5.0.0\ntasks: {}\n')
+    write_yml('Scripts/script-a.yml', 'commonfields:\n  id: a\nname: a\nscript: ""\ntype: python\n')
+    git(git_repo, 'add', 'Scripts/script-a.yml')
+
+    update_id_set(GitContext())
+    with open('Tests/id_set.json') as id_set_file:
+        updated_id_set = json.load(id_set_file, object_pairs_hook=OrderedDict)
+    assert [list(script)[0] for script in updated_id_set['scripts']] == ['a', 'b']
+    assert updated_id_set['playbooks'] == [{'c': {'name': 'c', 'file_path': 'Playbooks/playbook-c.yml',
+                                                  'fromversion': '5.0.0'}}]
+    assert updated_id_set['integrations'][0] == id_set['integrations'][0]
+    assert updated_id_set['integrations'][1]['Zoom']['commands'] == ['zoom-create-user']
+    assert len(updated_id_set['integrations']) == 2
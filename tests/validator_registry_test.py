@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from demisto_sdk.validation.file_validator import FilesValidator
+from demisto_sdk.validation.validator_registry import (CHECKS, CURRENT_FILE, DOCKER_TAG, ID_SET, CheckStats,
+                                                       FileInputs, select_checks)
+
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+VALID_SCRIPT = os.path.join(TEST_FILES, 'script-valid.yml')
+
+
+def test_select_checks():
+    assert select_checks() == set(CHECKS)
+    assert select_checks(only_checks=['structure', 'playbook']) == {'structure', 'playbook'}
+    assert select_checks(skipped_checks=['structure']) == set(CHECKS) - {'structure'}
+    assert select_checks(only_checks=['structure', 'playbook'], skipped_checks=['playbook']) == {'structure'}
+
+
+def test_select_unknown_check():
+    with pytest.raises(ValueError) as error:
+        select_checks(only_checks=['structure', 'no-such-check'])
+    assert 'no-such-check' in str(error.value)
+
+
+def test_inputs_are_resolved_once():
+    stats = CheckStats()
+    file_inputs = FileInputs(FilesValidator(validate_conf_json=False), VALID_SCRIPT, stats=stats)
+    assert stats.resolved_inputs == {}
+
+    structure_validator = file_inputs.get(CURRENT_FILE)
+    assert file_inputs.structure_validator is structure_validator
+    assert file_inputs.script_structure_validator is structure_validator
+    assert stats.resolved_inputs == {CURRENT_FILE: 1}
+
+
+def test_skipped_check_does_not_resolve_its_inputs(mocker):
+    files_validator = FilesValidator(validate_conf_json=False, skipped_checks=['script-docker-image', 'id-set'])
+    id_set_validator = mocker.patch.object(FilesValidator, 'id_set_validator', new_callable=mocker.PropertyMock)
+    mocker.patch.dict(CHECKS, {'script': CHECKS['script']._replace(function=lambda _: True)})
+
+    file_inputs = FileInputs(files_validator, VALID_SCRIPT, stats=files_validator.check_stats)
+    assert files_validator.run_checks(file_inputs, ['id-set', 'script-docker-image', 'script'])
+
+    assert files_validator.check_stats.run_checks == {'script': 1}
+    assert files_validator.check_stats.skipped_checks == {'id-set': 1, 'script-docker-image': 1}
+    assert ID_SET not in files_validator.check_stats.resolved_inputs
+    assert DOCKER_TAG not in files_validator.check_stats.resolved_inputs
+    assert not id_set_validator.called
+
+
+def test_backward_checks_are_not_counted_when_disabled():
+    files_validator = FilesValidator(is_backward_check=False, validate_conf_json=False)
+    file_inputs = FileInputs(files_validator, VALID_SCRIPT, stats=files_validator.check_stats)
+    assert files_validator.run_checks(file_inputs, ['script-backward-compatibility', 'script-docker-image'])
+    assert files_validator.check_stats.run_checks == {}
+    assert files_validator.check_stats.skipped_checks == {}
+    assert file_inputs.stats.resolved_inputs == {}
+
+
+def test_merge_check_stats():
+    stats = CheckStats()
+    stats.run_checks = {'structure': 2}
+    stats.resolved_inputs = {CURRENT_FILE: 2}
+    stats.input_durations = {CURRENT_FILE: 0.5}
+    worker_stats = CheckStats()
+    worker_stats.run_checks = {'structure': 1, 'playbook': 1}
+    worker_stats.skipped_checks = {'id-set': 3}
+    worker_stats.resolved_inputs = {CURRENT_FILE: 1}
+    worker_stats.input_durations = {CURRENT_FILE: 0.25}
+
+    stats.merge(worker_stats)
+    assert stats.run_checks == {'structure': 3, 'playbook': 1}
+    assert stats.skipped_checks == {'id-set': 3}
+    assert stats.resolved_inputs == {CURRENT_FILE: 3}
+    assert stats.input_durations == {CURRENT_FILE: 0.75}
+    assert stats.get_saved_inputs() == {CURRENT_FILE: 3, ID_SET: 3}
+
+    report = stats.get_report()
+    assert 'Checks: playbook (1), structure (3)' in report
+    assert 'Skipped checks: id-set (3)' in report
+    assert 'Resolved inputs: current-file (3, 750ms)' in report
+    assert 'Inputs of skipped checks: current-file (3), id-set (3)' in report
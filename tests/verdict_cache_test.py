@@ -0,0 +1,103 @@
+import os
+import shutil
+
+import pytest
+
+from demisto_sdk.common.verdict_cache import VerdictCache, Verdict, get_blob_hash
+from demisto_sdk.validation.file_validator import FilesValidator
+
+TEST_FILES = os.path.abspath(os.path.join('tests', 'test_files'))
+CONTENT_FILES = {
+    'Playbooks/playbook-invalid.yml': 'Playbooks.playbook-invalid.yml',
+    'Playbooks/playbook-test.yml': 'Playbooks.playbook-test.yml',
+    'Scripts/Valid/Valid.yml': 'script-valid.yml',
+    'Integrations/Zoom/Zoom.yml': 'integration-Zoom.yml',
+}
+
+
+@pytest.fixture
+def content_repo(tmp_path, monkeypatch):
+    repo = tmp_path / 'content'
+    for path, test_file in CONTENT_FILES.items():
+        os.makedirs(os.path.dirname(str(repo / path)), exist_ok=True)
+        shutil.copy(os.path.join(TEST_FILES, test_file), str(repo / path))
+    monkeypatch.chdir(repo)
+    return str(tmp_path / 'cache')
+
+
+def validate_all_files(mocker, cache_dir, rebuild=False):
+    files_validator = FilesValidator(validate_conf_json=False,
+                                     verdict_cache=VerdictCache(cache_dir, sdk_version='1.0.0', rebuild=rebuild))
+    is_valid_file_scheme = mocker.spy(files_validator, 'is_valid_file_scheme')
+    files_validator.validate_all_files()
+    return files_validator._is_valid, sorted(call[0][0] for call in is_valid_file_scheme.call_args_list)
+
+
+def test_blob_hash():
+    # git hash-object of an empty file and of 'test\n'
+    assert get_blob_hash(b'') == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+    assert get_blob_hash(b'test\n') == '9daeafb9864cf43055ae93beb0afd6c7d144bfa4'
+
+
+def test_unchanged_files_are_not_validated_again(content_repo, mocker, capsys):
+    is_valid, validated_files = validate_all_files(mocker, content_repo)
+    output = capsys.readouterr().out
+    assert not is_valid
+    assert len(validated_files) == 4
+
+    assert validate_all_files(mocker, content_repo) == (is_valid, [])
+    assert capsys.readouterr().out == output
+
+    with open('Scripts/Valid/Valid.yml', 'a') as script_file:
+        script_file.write('\n')
+    assert validate_all_files(mocker, content_repo) == (is_valid, ['Scripts/Valid/Valid.yml'])
+    assert capsys.readouterr().out == output
+
+
+def test_rebuild_cache(content_repo, mocker):
+    validate_all_files(mocker, content_repo)
+    assert len(validate_all_files(mocker, content_repo, rebuild=True)[1]) == 4
+    assert validate_all_files(mocker, content_repo)[1] == []
+
+
+def test_sdk_version_is_part_of_the_key(content_repo):
+    verdict_cache = VerdictCache(content_repo, sdk_version='1.0.0')
+    entry_path = verdict_cache.get_entry_path('Scripts/Valid/Valid.yml')
+    verdict_cache.set(entry_path, Verdict(True, 'output'))
+    assert verdict_cache.get(entry_path) == Verdict(True, 'output')
+    assert VerdictCache(content_repo, sdk_version='1.0.1').get_entry_path('Scripts/Valid/Valid.yml') != entry_path
+
+
+def test_prune_unused_verdicts(content_repo, mocker):
+    validate_all_files(mocker, content_repo)
+    os.remove('Playbooks/playbook-invalid.yml')
+    assert validate_all_files(mocker, content_repo)[0]
+
+    verdict_cache = VerdictCache(content_repo)
+    assert sum(len(files) for _, _, files in os.walk(verdict_cache.entries_dir)) == 3
+
+
+def test_repositories_sharing_the_cache_dir(content_repo, tmp_path, mocker, monkeypatch):
+    assert len(validate_all_files(mocker, content_repo)[1]) == 4
+
+    other_repo = tmp_path / 'other'
+    os.makedirs(str(other_repo / 'Scripts' / 'Valid'))
+    shutil.copy(os.path.join(TEST_FILES, 'script-valid.yml'), str(other_repo / 'Scripts' / 'Valid' / 'Valid.yml'))
+    monkeypatch.chdir(other_repo)
+    assert validate_all_files(mocker, content_repo)[1] == ['Scripts/Valid/Valid.yml']
+
+    # the full run of the other repository does not prune the verdicts of the first one
+    monkeypatch.chdir(tmp_path / 'content')
+    assert validate_all_files(mocker, content_repo)[1] == []
+
+
+def test_prune_during_another_run(content_repo, mocker):
+    validate_all_files(mocker, content_repo)
+    other_run = VerdictCache(content_repo, sdk_version='1.0.0')
+    other_run.start_run()
+
+    os.remove('Playbooks/playbook-invalid.yml')
+    validate_all_files(mocker, content_repo)
+    # the other run may still use the verdict of the removed file
+    assert sum(len(files) for _, _, files in os.walk(other_run.entries_dir)) == 4 + 1  # and its run marker
+    assert other_run.prune() == 1
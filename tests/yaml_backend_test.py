@@ -0,0 +1,48 @@
+import glob
+from collections import OrderedDict
+
+import pytest
+import yaml
+
+from demisto_sdk.common import yaml_backend
+
+YML_FILES = glob.glob('./tests/test_files/**/*.yml', recursive=True)
+
+
+@pytest.mark.parametrize('file_path', YML_FILES)
+def test_safe_load_matches_pure_python_loader(file_path):
+    with open(file_path) as f:
+        yml_text = f.read()
+    assert yaml_backend.safe_load(yml_text) == yaml.load(yml_text, Loader=yaml.SafeLoader)
+
+
+def test_ordered_load_keeps_keys_order():
+    data = yaml_backend.ordered_load('b: 1\na:\n  d: 2\n  c: 3\n')
+    assert isinstance(data, OrderedDict)
+    assert list(data.keys()) == ['b', 'a']
+    assert list(data['a'].keys()) == ['d', 'c']
+
+
+def test_ordered_dump_multiline_strings():
+    data = OrderedDict([('name', 'test'), ('script', 'line1\nline2\n'), ('args', ['a'])])
+    assert yaml_backend.ordered_dump(data, multiline_strings=True, default_flow_style=False) == \
+        'name: test\nscript: |\n  line1\n  line2\nargs:\n- a\n'
+    assert yaml_backend.ordered_dump(data, default_flow_style=False) == \
+        'name: test\nscript: \'line1\n\n  line2\n\n  \'\nargs:\n- a\n'
+
+
+def test_multiline_dumper_does_not_change_other_dumpers():
+    yaml_backend.ordered_dump({'a': 'x\ny'}, multiline_strings=True)
+    assert '|' not in yaml_backend.ordered_dump({'a': 'x\ny'})
+    assert '|' not in yaml_backend.safe_dump({'a': 'x\ny'})
+
+
+def test_yaml_1_2_duplicate_key():
+    assert yaml_backend.safe_load_yaml12('a: 1\nb: {c: 1, d: 2}\n') == {'a': 1, 'b': {'c': 1, 'd': 2}}
+    # merge keys are not duplicates
+    assert yaml_backend.safe_load_yaml12('a: &x {c: 1}\nb:\n  <<: *x\n  c: 2\n')['b'] == {'c': 2}
+    with pytest.raises(yaml_backend.YAMLError) as error:
+        yaml_backend.safe_load_yaml12('a: 1\nb:\n- {c: 1, c: 2}\n')
+    assert str(error.value) == \
+        'while constructing a mapping\n  in "<unicode string>", line 3, column 3\n' \
+        'found duplicate key "c" with value "2" (original value: "1")\n  in "<unicode string>", line 3, column 10'